@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# Native async read views (see PORTFOLIO_ASYNC_VIEWS in settings)
+os.environ.setdefault('PORTFOLIO_ASYNC_VIEWS', '1')
 
 application = get_asgi_application()
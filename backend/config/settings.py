@@ -2,6 +2,7 @@
 Django settings for Portfolio API - Fares Essam
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -32,6 +33,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'portfolio.middleware.QueryInstrumentationMiddleware',  # First, so it times everything below
     'corsheaders.middleware.CorsMiddleware',  # Must be before CommonMiddleware
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -66,6 +68,29 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Keep connections open between requests, checking them before reuse.
+        # Django's docs advise against persistent connections under ASGI.
+        'CONN_MAX_AGE': 0 if os.environ.get('PORTFOLIO_ASYNC_VIEWS') == '1' else 600,
+        'CONN_HEALTH_CHECKS': True,
+    },
+    # Read replica for the public read views; list it in PORTFOLIO_READ_DATABASES.
+    # With SQLite it is a copy of the primary (see PORTFOLIO_SYNC_SQLITE_REPLICAS).
+    # 'replica': {
+    #     'ENGINE': 'django.db.backends.sqlite3',
+    #     'NAME': BASE_DIR / 'db.replica.sqlite3',
+    #     'CONN_MAX_AGE': 600,
+    #     'CONN_HEALTH_CHECKS': True,
+    #     'TEST': {'MIRROR': 'default'},
+    # },
+}
+
+DATABASE_ROUTERS = ['portfolio.routers.ReadReplicaRouter']
+
+# Cache - holds the API version registry (portfolio/versions.py). Use a shared
+# backend such as Redis or Memcached when running more than one worker process.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     }
 }
 
@@ -87,17 +112,23 @@ USE_TZ = True
 STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
-# Media files (Uploads)
+# Media files (Uploads), stored under their SHA-256 (portfolio/storage.py)
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+STORAGES = {
+    'default': {'BACKEND': 'portfolio.storage.ContentAddressedStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
+    # config/settings_production.py drops the browsable API
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'portfolio.renderers.FastJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
 }
@@ -119,5 +150,97 @@ CORS_ALLOW_METHODS = [
     'PUT',
 ]
 
+# Logging - portfolio.queries gets one JSON line per request from
+# QueryInstrumentationMiddleware; set it to INFO to log every request rather
+# than only those over their query budget or with repeated queries
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'portfolio.queries': {'handlers': ['console'], 'level': 'WARNING', 'propagate': False},
+    },
+}
+
+# Portfolio app
+# Query counts and DB time per request in a Server-Timing header and the
+# portfolio.queries log (portfolio/middleware.py). None follows DEBUG; keep it
+# off in production, where the header would show every client DB timings.
+PORTFOLIO_QUERY_INSTRUMENTATION = None
+
+# Rendered /api/bundle/ payloads kept in memory, one per host and ?fields= choice
+PORTFOLIO_BUNDLE_SNAPSHOTS = 8
+
+# Threads rendering resized image variants in the background (0 = inline on commit)
+PORTFOLIO_IMAGE_WORKERS = 2
+
+# Contact form ingestion: 'sync' inserts each message in the request, 'buffered'
+# spools it to disk, answers 202 and bulk-inserts in batches (portfolio/ingest.py)
+PORTFOLIO_CONTACT_INGEST = 'sync'
+PORTFOLIO_CONTACT_BATCH_SIZE = 50
+PORTFOLIO_CONTACT_FLUSH_INTERVAL = 2.0
+PORTFOLIO_CONTACT_SPOOL_DIR = BASE_DIR / 'spool'
+
+# CV downloads: None streams from Django (sendfile under gunicorn), or hand the
+# transfer to the front-end server with 'x-accel-redirect' (nginx, served from
+# an internal location at PORTFOLIO_CV_ACCEL_PREFIX) or 'x-sendfile' (Apache)
+PORTFOLIO_CV_OFFLOAD = None
+PORTFOLIO_CV_ACCEL_PREFIX = '/protected-media/'
+
+# Database aliases the public read views read from (see portfolio/routers.py),
+# e.g. ['replica']. With PORTFOLIO_SYNC_SQLITE_REPLICAS on, SQLite replicas are
+# re-copied from the primary in the background, debounced, after content
+# changes; otherwise run `manage.py sync_replicas` on demand. Contact messages,
+# users and sessions are left out of the copies.
+PORTFOLIO_READ_DATABASES = []
+PORTFOLIO_SYNC_SQLITE_REPLICAS = False
+PORTFOLIO_SQLITE_SYNC_DEBOUNCE = 1.0
+
+# Every SQLite connection gets portfolio.sqlite.DEFAULT_PRAGMAS; set
+# PORTFOLIO_SQLITE_PRAGMAS to a dict of pragma values to replace them.
+
+# Serve the read endpoints with the native async views (portfolio/async_views.py).
+# config/asgi.py turns this on; under WSGI the sync DRF views are faster.
+PORTFOLIO_ASYNC_VIEWS = os.environ.get('PORTFOLIO_ASYNC_VIEWS', '0') == '1'
+
+# Change events kept for Last-Event-ID resume on /api/events/ (portfolio/events.py)
+PORTFOLIO_EVENT_BUFFER = 1000
+
+# Shared caches in front of the API (portfolio/cdn.py). Read responses carry
+# s-maxage and Surrogate-Key headers; set PORTFOLIO_CDN_PURGE_URL (and e.g.
+# {'Fastly-Key': ...} in PORTFOLIO_CDN_PURGE_HEADERS) to purge changed keys,
+# which makes a long s-maxage safe. Purges are batched after
+# PORTFOLIO_CDN_PURGE_DEBOUNCE seconds without changes.
+PORTFOLIO_CDN_PURGE_URL = os.environ.get('PORTFOLIO_CDN_PURGE_URL')
+PORTFOLIO_CDN_PURGE_HEADERS = {}
+PORTFOLIO_CDN_PURGE_DEBOUNCE = 1.0
+PORTFOLIO_CDN_PURGE_BATCH_SIZE = 256
+PORTFOLIO_CDN_S_MAXAGE = 86400 if PORTFOLIO_CDN_PURGE_URL else 60
+PORTFOLIO_CDN_STALE_WHILE_REVALIDATE = 30
+
+# Signed webhooks telling the Next.js frontend which pages to revalidate after
+# a change (portfolio/revalidate.py, frontend/src/app/api/revalidate/route.ts),
+# e.g. 'http://localhost:3000/api/revalidate'. The secret must match the
+# frontend's REVALIDATE_SECRET.
+PORTFOLIO_REVALIDATE_URL = os.environ.get('PORTFOLIO_REVALIDATE_URL')
+PORTFOLIO_REVALIDATE_SECRET = os.environ.get('PORTFOLIO_REVALIDATE_SECRET', '')
+PORTFOLIO_REVALIDATE_DEBOUNCE = 2.0
+
+# JSON encoder behind portfolio.renderers.FastJSONRenderer: 'orjson', 'msgspec',
+# 'json' (stdlib) or 'auto' for the fastest one installed
+PORTFOLIO_JSON_ENCODER = 'auto'
+
+# Admin changelists using EstimatedCountPaginator show the database's row
+# estimate instead of an exact COUNT(*) for tables larger than this
+PORTFOLIO_ADMIN_COUNT_ESTIMATE_THRESHOLD = 10000
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Serve MEDIA_URL from Django: content-addressed files as immutable, files
+# uploaded under their original names with no-cache. Turn off when the web
+# server or CDN serves MEDIA_ROOT itself (with the same headers for hashed names).
+# Unreferenced blobs are removed by `manage.py gc_media`.
+PORTFOLIO_SERVE_MEDIA = True
@@ -0,0 +1,38 @@
+"""
+Settings for API-only workers
+
+The production settings reduced to what the public endpoints need: no admin,
+auth, sessions, messages, CSRF, templates or static files, and no DRF
+authentication, so none of it is imported or run per request. Staff pages
+and the staff-only endpoints are served by workers using
+config.settings_production. Use DJANGO_SETTINGS_MODULE=config.settings_api;
+`manage.py measure_startup` compares the cold start of the profiles.
+"""
+
+from .settings_production import *  # noqa: F401,F403
+from .settings_production import REST_FRAMEWORK
+
+INSTALLED_APPS = [
+    'corsheaders',
+    'portfolio',
+]
+
+MIDDLEWARE = [
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'django.middleware.common.CommonMiddleware',
+]
+
+ROOT_URLCONF = 'config.urls_api'
+
+TEMPLATES = []
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_AUTHENTICATION_CLASSES': [],
+    'UNAUTHENTICATED_USER': None,
+}
+
+# Formats the image workers' Pillow can encode; naming them here means API
+# workers only import Pillow if they render a variant themselves
+PORTFOLIO_IMAGE_FORMATS = ('avif', 'webp')
@@ -0,0 +1,23 @@
+"""
+Production settings for Portfolio API
+
+The development settings with debugging off and a JSON-only API: without the
+browsable API, a request from a browser gets the same JSON as the frontend
+instead of a rendered HTML page. Use DJANGO_SETTINGS_MODULE=config.settings_production.
+"""
+
+from .settings import *  # noqa: F401,F403
+from .settings import MIDDLEWARE, REST_FRAMEWORK
+
+DEBUG = False
+
+# No Server-Timing header or per-request query log for the public
+PORTFOLIO_QUERY_INSTRUMENTATION = False
+MIDDLEWARE = [name for name in MIDDLEWARE if name != 'portfolio.middleware.QueryInstrumentationMiddleware']
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_RENDERER_CLASSES': [
+        'portfolio.renderers.FastJSONRenderer',
+    ],
+}
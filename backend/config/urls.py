@@ -6,12 +6,17 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from portfolio import urls as portfolio_urls
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('portfolio.urls')),
 ]
 
-# Serve media files in development
+# Serve media files with long-lived cache headers (portfolio/storage.py)
+if settings.PORTFOLIO_SERVE_MEDIA:
+    urlpatterns.append(path(settings.MEDIA_URL.lstrip('/'), include(portfolio_urls.media_urlpatterns)))
+
+# Serve static files in development
 if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
@@ -0,0 +1,18 @@
+"""
+URL configuration for API-only workers (config/settings_api.py): the public
+API, without the admin or the staff-only endpoints
+"""
+from django.conf import settings
+from django.urls import path, include
+
+from portfolio import urls as portfolio_urls
+
+# Need a logged-in staff user; API workers have no sessions
+STAFF_ONLY = {'contact-messages'}
+
+urlpatterns = [
+    path('api/', include([pattern for pattern in portfolio_urls.urlpatterns if pattern.name not in STAFF_ONLY])),
+]
+
+if settings.PORTFOLIO_SERVE_MEDIA:
+    urlpatterns.append(path(settings.MEDIA_URL.lstrip('/'), include(portfolio_urls.media_urlpatterns)))
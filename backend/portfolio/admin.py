@@ -1,9 +1,23 @@
 from django.contrib import admin
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils.html import format_html
+from . import images, search
 from .models import (
     PersonalInfo, SocialLink, SkillCategory, Skill,
-    Project, Education, Certification, CV, ContactMessage
+    Project, Technology, Education, Certification, CV, ContactMessage
 )
+from .pagination import EstimatedCountPaginator
+
+
+class FullTextSearchMixin:
+    """Search through the model's full-text index (search.match) instead of LIKE over search_fields"""
+    
+    def get_search_results(self, request, queryset, search_term):
+        matched = search.match(queryset, search_term)
+        if matched is None:
+            return super().get_search_results(request, queryset, search_term)
+        return matched, False
 
 
 @admin.register(PersonalInfo)
@@ -49,9 +63,17 @@ class SkillCategoryAdmin(admin.ModelAdmin):
     list_editable = ['order']
     inlines = [SkillInline]
     
+    def get_queryset(self, request):
+        # A correlated subquery rather than Count('skills'): the changelist's
+        # COUNT(*) can drop it, where a GROUP BY annotation would be counted too
+        skills = Skill.objects.filter(category=OuterRef('pk')).order_by().values('category')
+        count = Subquery(skills.annotate(count=Count('pk')).values('count'))
+        return super().get_queryset(request).annotate(skill_count=Coalesce(count, 0))
+    
     def skill_count(self, obj):
-        return obj.skills.count()
+        return obj.skill_count
     skill_count.short_description = 'Skills'
+    skill_count.admin_order_field = 'skill_count'
 
 
 @admin.register(Skill)
@@ -63,11 +85,13 @@ class SkillAdmin(admin.ModelAdmin):
 
 
 @admin.register(Project)
-class ProjectAdmin(admin.ModelAdmin):
+class ProjectAdmin(FullTextSearchMixin, admin.ModelAdmin):
     list_display = ['title', 'thumbnail', 'is_featured', 'is_active', 'order']
     list_editable = ['is_featured', 'is_active', 'order']
-    list_filter = ['is_featured', 'is_active']
+    list_filter = ['is_featured', 'is_active', 'technology_tags']
     search_fields = ['title', 'description', 'technologies']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     prepopulated_fields = {'slug': ('title',)}
     fieldsets = (
         (None, {
@@ -83,11 +107,22 @@ class ProjectAdmin(admin.ModelAdmin):
     
     def thumbnail(self, obj):
         if obj.image:
-            return format_html('<img src="{}" width="50" height="50" style="object-fit: cover; border-radius: 8px;" />', obj.image.url)
+            return format_html('<img src="{}" width="50" height="50" loading="lazy" style="object-fit: cover; border-radius: 8px;" />', images.thumbnail_url(obj.image))
         return "-"
     thumbnail.short_description = 'Image'
 
 
+@admin.register(Technology)
+class TechnologyAdmin(admin.ModelAdmin):
+    list_display = ['name', 'key']
+    search_fields = ['name']
+    readonly_fields = ['key', 'projects']
+    
+    def has_add_permission(self, request):
+        # Technologies are derived from Project.technologies
+        return False
+
+
 @admin.register(Education)
 class EducationAdmin(admin.ModelAdmin):
     list_display = ['institution', 'degree', 'field_of_study', 'start_date', 'end_date', 'is_current']
@@ -115,11 +150,16 @@ class CVAdmin(admin.ModelAdmin):
 
 
 @admin.register(ContactMessage)
-class ContactMessageAdmin(admin.ModelAdmin):
+class ContactMessageAdmin(FullTextSearchMixin, admin.ModelAdmin):
     list_display = ['name', 'email', 'subject', 'is_read', 'created_at']
     list_filter = ['is_read', 'created_at']
     search_fields = ['name', 'email', 'subject', 'message']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     readonly_fields = ['name', 'email', 'subject', 'message', 'created_at']
+    # Explicit pk tie-break in the same direction as the API's keyset ordering,
+    # so both walk the created_at indexes without a sort
+    ordering = ['-created_at', 'pk']
     
     def has_add_permission(self, request):
         return False
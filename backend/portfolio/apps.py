@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class PortfolioConfig(AppConfig):
     name = 'portfolio'
+
+    def ready(self):
+        from . import signals
+        signals.connect(self)
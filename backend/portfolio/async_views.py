@@ -0,0 +1,216 @@
+"""
+Native async versions of the read endpoints
+
+Used instead of the DRF views in views.py when ``PORTFOLIO_ASYNC_VIEWS`` is
+on, which config/asgi.py does by default. They query with the async ORM and
+the async cache API, so under an ASGI server a request only leaves the event
+loop for the database call itself instead of holding a worker thread for its
+whole lifetime. Responses are the same JSON, validators and status codes as
+the DRF views, ``?fields=`` / ``?exclude=`` included; there is no browsable
+API.
+"""
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.views import View
+from rest_framework import exceptions
+from rest_framework.request import Request
+
+from . import cdn, events, readers, search, snapshot, stats
+from .mixins import AsyncConditionalGetMixin
+from .models import PersonalInfo, SocialLink, SkillCategory, Skill, Project, Education, Certification, CV
+from .pagination import KeysetPagination
+from .renderers import FastJSONRenderer
+from .serializers import (
+    PersonalInfoSerializer, ProjectSerializer, ProjectSearchResultSerializer, CVSerializer
+)
+from .views import filter_projects
+
+renderer = FastJSONRenderer()
+
+
+def json_response(data, status=200):
+    return HttpResponse(renderer.render(data), content_type='application/json', status=status)
+
+
+class AsyncReadView(AsyncConditionalGetMixin, View):
+    """Async GET view that reports errors as ``{"detail": ...}`` like DRF's exception handler"""
+    http_method_names = ['get', 'head', 'options']
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        except Http404 as exc:
+            return json_response({'detail': exceptions.NotFound(*exc.args).detail}, status=404)
+        except exceptions.APIException as exc:
+            # Validation errors keep their field keys, as in DRF's exception handler
+            data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+            return json_response(data, status=exc.status_code)
+
+
+class AsyncReaderListView(AsyncReadView):
+    """List through a ``readers.Reader``, with optional keyset pagination"""
+    reader = None
+    pagination_class = None
+
+    def get_queryset(self, request):
+        return self.queryset.all()
+
+    async def get(self, request):
+        reader = self.reader.project(request.GET)
+        queryset = reader.values(self.get_queryset(request))
+        if self.pagination_class is not None:
+            paginator = self.pagination_class()
+            page = await paginator.apaginate_queryset(queryset, Request(request))
+            if page is not None:
+                return json_response(paginator.get_paginated_data(await reader.abuild(page, request)))
+        return json_response(await reader.abuild(queryset, request))
+
+
+class PersonalInfoView(AsyncReadView):
+    """Get personal information (singleton)"""
+    version_resources = ('personalinfo',)
+
+    async def get(self, request):
+        reader = readers.PERSONAL_INFO.project(request.GET)
+        info = await reader.only(PersonalInfo.objects.all()).afirst()
+        if info:
+            context = {'request': request, 'fields': reader.fields}
+            return json_response(PersonalInfoSerializer(info, context=context).data)
+        return json_response({'detail': 'Personal information not configured'}, status=404)
+
+
+class SocialLinkListView(AsyncReaderListView):
+    """List all active social links"""
+    version_resources = ('sociallink',)
+    reader = readers.SOCIAL_LINKS
+    queryset = SocialLink.objects.filter(is_active=True)
+
+
+class SkillCategoryListView(AsyncReaderListView):
+    """List all skill categories with their skills"""
+    version_resources = ('skillcategory', 'skill')
+    reader = readers.SKILL_CATEGORIES
+    queryset = SkillCategory.objects.all()
+
+
+class SkillListView(AsyncReaderListView):
+    """List all skills"""
+    version_resources = ('skill', 'skillcategory')
+    reader = readers.SKILLS
+    queryset = Skill.objects.all()
+
+
+class FeaturedSkillsView(AsyncReaderListView):
+    """List featured skills only"""
+    version_resources = ('skill', 'skillcategory')
+    reader = readers.SKILLS
+    queryset = Skill.objects.filter(is_featured=True)
+
+
+class ProjectListView(AsyncReaderListView):
+    """List all active projects"""
+    version_resources = ('project', 'technology')
+    reader = readers.PROJECTS
+    pagination_class = KeysetPagination
+
+    def get_queryset(self, request):
+        return filter_projects(request.GET)
+
+
+class ProjectSearchView(AsyncReadView):
+    """Full-text search over active projects, best matches first"""
+    version_resources = ('project',)
+    max_limit = 50
+
+    async def get(self, request):
+        reader = readers.PROJECT_SEARCH_RESULTS.project(request.GET)
+        limit = search.parse_limit(request.GET.get('limit'), maximum=self.max_limit)
+        # Raw FTS SQL has no async cursor; run it in the ORM's sync thread
+        projects = await sync_to_async(search.search_projects)(
+            request.GET.get('q', ''), limit=limit, queryset=reader.only(Project.objects.all())
+        )
+        context = {'request': request, 'fields': reader.fields}
+        return json_response(ProjectSearchResultSerializer(projects, many=True, context=context).data)
+
+
+class ProjectDetailView(AsyncReadView):
+    """Get single project by slug"""
+    version_resources = ('project',)
+
+    async def get(self, request, slug):
+        reader = readers.PROJECTS.project(request.GET)
+        try:
+            project = await reader.only(Project.objects.filter(is_active=True)).aget(slug=slug)
+        except Project.DoesNotExist:
+            raise Http404('No Project matches the given query.')
+        self.surrogate_keys = cdn.instance_keys(project)
+        return json_response(ProjectSerializer(project, context={'request': request, 'fields': reader.fields}).data)
+
+
+class EducationListView(AsyncReaderListView):
+    """List all education entries"""
+    version_resources = ('education',)
+    reader = readers.EDUCATION
+    pagination_class = KeysetPagination
+    queryset = Education.objects.all()
+
+
+class CertificationListView(AsyncReaderListView):
+    """List all certifications"""
+    version_resources = ('certification',)
+    reader = readers.CERTIFICATIONS
+    pagination_class = KeysetPagination
+    queryset = Certification.objects.all()
+
+
+class StatsView(AsyncReadView):
+    """Aggregate statistics over skills and projects"""
+    version_resources = stats.RESOURCES
+
+    async def get(self, request):
+        return json_response(await stats.aget_stats(self.version_fingerprint))
+
+
+class CVDownloadView(AsyncReadView):
+    """Get active CV/Resume"""
+    version_resources = ('cv',)
+
+    async def get(self, request):
+        reader = readers.CV.project(request.GET)
+        cv = await reader.only(CV.objects.filter(is_active=True), 'file').afirst()
+        if cv and cv.file:
+            return json_response(CVSerializer(cv, context={'request': request, 'fields': reader.fields}).data)
+        return json_response({'detail': 'No active CV found'}, status=404)
+
+
+class BundleView(AsyncReadView):
+    """Get every payload the home page needs in a single response"""
+    version_resources = snapshot.RESOURCES
+
+    async def get(self, request):
+        sections = readers.requested_fields(request.GET, snapshot.SECTIONS)
+        rendered = snapshot.cached_bundle(request, self.version_fingerprint, sections)
+        if rendered is None:
+            rendered = await sync_to_async(snapshot.get_bundle)(request, self.version_fingerprint, sections)
+        return HttpResponse(rendered, content_type='application/json')
+
+
+class EventStreamView(View):
+    """Server-Sent Events stream of content changes (see events.py)"""
+    http_method_names = ['get']
+    keepalive = 15.0
+
+    async def get(self, request):
+        if not isinstance(request, ASGIRequest):
+            # A WSGI worker would be held for the lifetime of every connection
+            return json_response({'detail': 'The event stream is only served under ASGI'}, status=503)
+        # EventSource sends Last-Event-ID when it reconnects; ?last_event_id= covers a fresh page
+        last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+        response = StreamingHttpResponse(
+            events.get_broker().stream(last_event_id, self.keepalive), content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        # Stops nginx from buffering the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
@@ -0,0 +1,358 @@
+"""
+Benchmark harness for the portfolio API
+
+Drives the GET endpoints from portfolio/urls.py either in-process through
+Django's test client (which also counts SQL queries) or over HTTP against a
+running server, with a configurable number of concurrent workers. Results are
+plain dicts so they can be saved as JSON and compared between runs.
+"""
+import asyncio
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection
+from django.test import AsyncClient, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from . import urls as portfolio_urls
+from .models import Project
+
+# Routes that need a body, authentication or an uploaded file to exercise, and
+# the event stream, which never completes
+SKIP_ROUTES = {'contact', 'contact-messages', 'image-derivative', 'cv-download', 'events'}
+
+# Query count reported by QueryInstrumentationMiddleware, when it is on (PORTFOLIO_QUERY_INSTRUMENTATION)
+_SERVER_TIMING_QUERIES_RE = re.compile(r'desc="(\d+) queries"')
+
+
+def endpoint_paths(names=None):
+    """``{url name: path}`` for every benchmarkable GET route"""
+    paths = {}
+    for pattern in portfolio_urls.urlpatterns:
+        name = pattern.name
+        if name in SKIP_ROUTES or (names and name not in names):
+            continue
+        if name == 'project-detail':
+            slug = Project.objects.filter(is_active=True).values_list('slug', flat=True).first()
+            if slug:
+                paths[name] = reverse(name, kwargs={'slug': slug})
+        elif name == 'project-search':
+            paths[name] = reverse(name) + '?q=react'
+        elif not pattern.pattern.converters:
+            paths[name] = reverse(name)
+    return paths
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(samples, elapsed):
+    """Aggregate ``(status, seconds, bytes, queries)`` samples for one endpoint"""
+    latencies = sorted(seconds * 1000 for _, seconds, _, _ in samples)
+    queries = [count for _, _, _, count in samples if count is not None]
+    errors = sum(1 for status, _, _, _ in samples if status is None or status >= 400)
+    return {
+        'requests': len(samples),
+        'errors': errors,
+        'requests_per_second': round(len(samples) / elapsed, 1) if elapsed else None,
+        'latency_ms': {
+            'mean': round(statistics.fmean(latencies), 3) if latencies else None,
+            'p50': round(percentile(latencies, 0.50), 3) if latencies else None,
+            'p95': round(percentile(latencies, 0.95), 3) if latencies else None,
+            'p99': round(percentile(latencies, 0.99), 3) if latencies else None,
+        },
+        'sql_queries': round(statistics.fmean(queries), 2) if queries else None,
+        'bytes': round(statistics.fmean(size for _, _, size, _ in samples)) if samples else 0,
+    }
+
+
+class InProcessRunner:
+    """Requests through the Django test client, counting SQL queries per request"""
+    mode = 'in-process'
+
+    def __init__(self, headers=None):
+        self.headers = {'HTTP_ACCEPT': 'application/json', **(headers or {})}
+        self._local = threading.local()
+
+    def request(self, path):
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = Client(**self.headers)
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            response = client.get(path)
+            body = b''.join(response.streaming_content) if response.streaming else response.content
+            elapsed = time.perf_counter() - start
+        return response.status_code, elapsed, len(body), len(queries)
+
+
+class ASGIRunner:
+    """
+    Requests through Django's ASGI handler (AsyncClient); concurrent workers
+    are tasks on one event loop instead of threads. Serves the async views
+    when PORTFOLIO_ASYNC_VIEWS is on.
+    """
+    mode = 'asgi'
+
+    def __init__(self, headers=None):
+        self.headers = {'Accept': 'application/json', **(headers or {})}
+        self.client = None
+
+    async def request(self, path):
+        if self.client is None:
+            self.client = AsyncClient(headers=self.headers)
+        start = time.perf_counter()
+        response = await self.client.get(path)
+        if response.streaming:
+            body = b''.join([chunk async for chunk in response.streaming_content])
+        else:
+            body = response.content
+        elapsed = time.perf_counter() - start
+        match = _SERVER_TIMING_QUERIES_RE.search(response.get('Server-Timing', ''))
+        return response.status_code, elapsed, len(body), int(match.group(1)) if match else None
+
+
+class HTTPRunner:
+    """Requests over HTTP against a running server; query counts come from Server-Timing"""
+    mode = 'http'
+
+    def __init__(self, base_url, headers=None, timeout=30):
+        self.base_url = base_url.rstrip('/')
+        self.headers = {'Accept': 'application/json', **(headers or {})}
+        self.timeout = timeout
+
+    def request(self, path):
+        request = urllib.request.Request(self.base_url + path, headers=self.headers)
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = response.read()
+                status = response.status
+                headers = response.headers
+        except urllib.error.HTTPError as error:
+            body = error.read()
+            status = error.code
+            headers = error.headers
+        except OSError:
+            return None, time.perf_counter() - start, 0, None
+        match = _SERVER_TIMING_QUERIES_RE.search(headers.get('Server-Timing', ''))
+        return status, time.perf_counter() - start, len(body), int(match.group(1)) if match else None
+
+
+async def arun_endpoint(runner, path, requests, concurrency, warmup=5):
+    for _ in range(min(warmup, requests)):
+        await runner.request(path)
+    remaining = iter(range(requests))
+    samples = []
+
+    async def worker():
+        for _ in remaining:
+            samples.append(await runner.request(path))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(concurrency, 1))))
+    return summarize(samples, time.perf_counter() - start)
+
+
+def run_endpoint(runner, path, requests, concurrency, warmup=5):
+    if asyncio.iscoroutinefunction(runner.request):
+        return asyncio.run(arun_endpoint(runner, path, requests, concurrency, warmup))
+    for _ in range(min(warmup, requests)):
+        runner.request(path)
+    start = time.perf_counter()
+    if concurrency <= 1:
+        samples = [runner.request(path) for _ in range(requests)]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            samples = list(pool.map(lambda _: runner.request(path), range(requests)))
+    return summarize(samples, time.perf_counter() - start)
+
+
+def run(runner, paths, requests=200, concurrency=1, progress=None):
+    """Benchmark every path and return ``{url name: summary}``"""
+    results = {}
+    for name, path in paths.items():
+        results[name] = {'path': path, **run_endpoint(runner, path, requests, concurrency)}
+        if progress:
+            progress(name, results[name])
+    return results
+
+
+def compare(baseline, current):
+    """Per-endpoint relative change in throughput and p95 latency between two result files"""
+    changes = {}
+    for name, result in current.get('endpoints', {}).items():
+        before = baseline.get('endpoints', {}).get(name)
+        if not before:
+            continue
+        changes[name] = {
+            'requests_per_second': _ratio(before['requests_per_second'], result['requests_per_second']),
+            'p95_ms': _ratio(before['latency_ms']['p95'], result['latency_ms']['p95']),
+            'sql_queries': (before.get('sql_queries'), result.get('sql_queries')),
+        }
+    return changes
+
+
+def _ratio(before, after):
+    if not before or after is None:
+        return None
+    return round((after - before) / before * 100, 1)
+
+
+def compare_serializer(reader, queryset, request, repeat=5, for_serializer=None):
+    """
+    Time ``reader.serializer_class`` against ``reader`` on the same queryset,
+    rendering both to JSON, and check that the bytes are identical.
+    ``for_serializer(queryset)`` adds the select_related / prefetch_related
+    calls the serializer needs; the reader's queryset is left as it is.
+    """
+    from rest_framework.renderers import JSONRenderer
+
+    renderer = JSONRenderer()
+    serializer_class = reader.serializer_class
+    # Same tie-breaking as the reader so equal sort keys can't reorder rows
+    queryset = reader.ordered(queryset)
+    serializer_queryset = for_serializer(queryset) if for_serializer else queryset
+
+    def serializer():
+        return renderer.render(
+            serializer_class(serializer_queryset.all(), many=True, context={'request': request}).data
+        )
+
+    def fast():
+        return renderer.render(reader.serialize(queryset.all(), request))
+
+    timings = {}
+    for label, function in (('serializer', serializer), ('reader', fast)):
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            body = function()
+            samples.append(time.perf_counter() - start)
+        timings[label] = (min(samples), body)
+
+    (slow, expected), (quick, actual) = timings['serializer'], timings['reader']
+    return {
+        'rows': queryset.count(),
+        'serializer_ms': round(slow * 1000, 2),
+        'reader_ms': round(quick * 1000, 2),
+        'speedup': round(slow / quick, 2) if quick else None,
+        'identical': expected == actual,
+        'bytes': len(actual),
+    }
+
+
+def compare_encoders(data, encoders, repeat=5):
+    """
+    Time every encoder in ``encoders`` (see renderers.py) on the same data;
+    best of ``repeat`` runs, with each output checked against DRF's JSONRenderer
+    """
+    from rest_framework.renderers import JSONRenderer
+
+    from .renderers import FastJSONRenderer, get_dumps
+
+    expected = JSONRenderer().render(data)
+    results = {}
+    for name in encoders:
+        dumps = get_dumps(name)
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            body = dumps(data)
+            samples.append(time.perf_counter() - start)
+        best = min(samples)
+        results[name] = {
+            'ms': round(best * 1000, 3),
+            'mb_per_second': round(len(body) / best / 1e6, 1) if best else None,
+            'identical': FastJSONRenderer.escape(body) == expected,
+        }
+    return {'bytes': len(expected), 'encoders': results}
+
+
+# Run in a fresh interpreter per measurement: Django setup, the WSGI handler
+# and one request, built by hand so no test machinery is imported
+STARTUP_PROBE = """
+import io, json, sys, time
+start = time.perf_counter()
+import django
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+ready = time.perf_counter()
+status = []
+environ = {
+    'REQUEST_METHOD': 'GET', 'PATH_INFO': sys.argv[1], 'QUERY_STRING': '', 'SCRIPT_NAME': '',
+    'SERVER_NAME': 'localhost', 'SERVER_PORT': '8000', 'SERVER_PROTOCOL': 'HTTP/1.1',
+    'HTTP_HOST': 'localhost', 'HTTP_ACCEPT': 'application/json',
+    'wsgi.input': io.BytesIO(), 'wsgi.errors': sys.stderr, 'wsgi.url_scheme': 'http',
+}
+response = application(environ, lambda line, headers: status.append(int(line.split()[0])))
+size = sum(len(chunk) for chunk in response)
+done = time.perf_counter()
+rss = None
+try:
+    with open('/proc/self/status') as proc:
+        rss = next(int(line.split()[1]) for line in proc if line.startswith('VmRSS:'))
+except OSError:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+    'setup_ms': (ready - start) * 1000, 'first_request_ms': (done - ready) * 1000,
+    'status': status[0], 'bytes': size, 'rss_kb': rss, 'modules': sorted(sys.modules),
+}))
+"""
+# Reported when loaded by the end of the first request
+HEAVY_MODULES = (
+    'PIL.Image', 'django.contrib.admin', 'django.contrib.auth.models', 'django.contrib.sessions.models',
+    'django.contrib.messages', 'django.contrib.staticfiles', 'rest_framework.authentication',
+)
+
+
+def measure_startup(settings_module, path='/api/bundle/', runs=5):
+    """
+    Cold start of a settings profile: time to set Django up and build the WSGI
+    handler, time of the first request, and resident memory afterwards. Each
+    run is a new interpreter; medians are reported.
+    """
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': settings_module}
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, '-c', STARTUP_PROBE, path],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+        total = time.perf_counter() - start
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr else 'probe failed')
+        samples.append({**json.loads(completed.stdout.strip().splitlines()[-1]), 'process_ms': total * 1000})
+
+    def median(key):
+        return round(statistics.median(sample[key] for sample in samples), 1)
+
+    modules = samples[-1]['modules']
+    return {
+        'settings': settings_module,
+        'path': path,
+        'status': samples[-1]['status'],
+        'process_ms': median('process_ms'),
+        'setup_ms': median('setup_ms'),
+        'first_request_ms': median('first_request_ms'),
+        'rss_kb': median('rss_kb'),
+        'modules': len(modules),
+        'heavy_modules': [name for name in HEAVY_MODULES if name in modules],
+    }
@@ -0,0 +1,94 @@
+"""
+Shared-cache headers and surrogate-key purging for a CDN in front of the API
+
+Cacheable read responses carry ``Cache-Control`` with ``s-maxage`` and
+``stale-while-revalidate`` for shared caches (browsers revalidate every time
+with the ETag) and a ``Surrogate-Key`` header naming what they were built
+from:
+
+- ``<resource>`` for responses listing or aggregating a resource's rows
+- ``<resource>-<pk>`` and ``<resource>-details`` for an instance's detail
+
+Saving or deleting an instance purges ``<resource>`` and
+``<resource>-<pk>``; bulk writes purge ``<resource>`` and
+``<resource>-details``. Purges are batched by a ``dispatch.Dispatcher`` and
+POSTed as ``{"surrogate_keys": [...]}`` (Fastly's batch purge body) to
+``PORTFOLIO_CDN_PURGE_URL`` with ``PORTFOLIO_CDN_PURGE_HEADERS``. Without a
+purge URL nothing is sent and ``s-maxage`` should stay short.
+"""
+import os
+import threading
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.cache import patch_cache_control
+
+from .dispatch import Dispatcher, encode, post_json
+
+# Never cached by a shared cache, so never purged
+PRIVATE = {'contactmessage'}
+
+
+def instance_keys(instance):
+    resource = instance._meta.model_name
+    return [f'{resource}-{instance.pk}', f'{resource}-details']
+
+
+def purge_keys(resource, pk=None):
+    """Keys to purge after a change to one instance of ``resource``, or to any (``pk=None``)"""
+    return [resource, f'{resource}-details' if pk is None else f'{resource}-{pk}']
+
+
+def add_cache_headers(response, keys=None):
+    """Shared-cache lifetime for a 200 or 304 response, and its surrogate keys on a 200"""
+    patch_cache_control(
+        response,
+        public=True,
+        max_age=0,
+        s_maxage=getattr(settings, 'PORTFOLIO_CDN_S_MAXAGE', 60),
+        stale_while_revalidate=getattr(settings, 'PORTFOLIO_CDN_STALE_WHILE_REVALIDATE', 30),
+    )
+    # A 304 leaves out the keys: caches keep the stored ones, which for a
+    # detail name the instance that the not-modified path never loaded
+    if keys and response.status_code == 200:
+        response['Surrogate-Key'] = ' '.join(keys)
+    return response
+
+
+def send_purge(keys):
+    post_json(
+        settings.PORTFOLIO_CDN_PURGE_URL,
+        encode({'surrogate_keys': keys}),
+        headers=getattr(settings, 'PORTFOLIO_CDN_PURGE_HEADERS', {}),
+        timeout=getattr(settings, 'PORTFOLIO_CDN_PURGE_TIMEOUT', 5.0),
+    )
+
+
+_purger = None
+_purger_lock = threading.Lock()
+
+
+def get_purger():
+    """Process-wide purge dispatcher, or None when no purge URL is configured"""
+    global _purger
+    if not getattr(settings, 'PORTFOLIO_CDN_PURGE_URL', None):
+        return None
+    with _purger_lock:
+        if _purger is None or _purger.pid != os.getpid():
+            _purger = Dispatcher(
+                send_purge,
+                name='cdn-purge',
+                debounce=getattr(settings, 'PORTFOLIO_CDN_PURGE_DEBOUNCE', 1.0),
+                batch_size=getattr(settings, 'PORTFOLIO_CDN_PURGE_BATCH_SIZE', 256),
+            )
+    return _purger
+
+
+def purge(resource, pk=None):
+    """Purge what a change to ``resource`` invalidates, once the current transaction commits"""
+    if resource in PRIVATE:
+        return
+    purger = get_purger()
+    if purger is not None:
+        transaction.on_commit(partial(purger.add, purge_keys(resource, pk)))
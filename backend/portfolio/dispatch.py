@@ -0,0 +1,112 @@
+"""
+Debounced, batched delivery of outgoing notifications
+
+A ``Dispatcher`` collects items (CDN surrogate keys, frontend paths) from
+any thread and hands them to its ``send`` callable from a background thread:
+once no new item has arrived for ``debounce`` seconds, or ``max_delay``
+seconds after the first pending one, whichever comes first. Repeated items
+are coalesced, so a burst of admin saves becomes one request. A failed batch
+is retried with exponential backoff and then dropped with an error in the log.
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+import urllib.request
+
+logger = logging.getLogger(__name__)
+
+
+def encode(payload):
+    return json.dumps(payload, separators=(',', ':')).encode()
+
+
+def post_json(url, body, headers=None, timeout=5.0):
+    """POST an encoded JSON ``body``; raises on a connection error or a non-2xx status"""
+    request = urllib.request.Request(url, data=body, method='POST', headers={
+        'Content-Type': 'application/json', **(headers or {}),
+    })
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        response.read()
+        return response.status
+
+
+class Dispatcher:
+
+    def __init__(self, send, name, debounce=1.0, max_delay=10.0, batch_size=256, retries=4, backoff=1.0):
+        self.send = send
+        self.name = name
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.batch_size = batch_size
+        self.retries = retries
+        self.backoff = backoff
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._wake = threading.Event()
+        # Insertion-ordered set of pending items
+        self._pending = {}
+        self._first = self._last = None
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def add(self, items):
+        """Queue items for the next batch"""
+        now = time.monotonic()
+        with self._lock:
+            for item in items:
+                self._pending[item] = None
+            if self._first is None:
+                self._first = now
+            self._last = now
+        self._wake.set()
+
+    def due(self, now=None):
+        """Seconds until the pending items should be sent (0: now), or None when nothing is pending"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if not self._pending:
+                return None
+            deadline = min(self._last + self.debounce, self._first + self.max_delay)
+        return max(0.0, deadline - now)
+
+    def flush(self):
+        """Send everything pending now, in batches of ``batch_size``; returns how many items were sent"""
+        with self._send_lock:
+            with self._lock:
+                items = list(self._pending)
+                self._pending.clear()
+                self._first = self._last = None
+            for start in range(0, len(items), self.batch_size):
+                self._deliver(items[start:start + self.batch_size])
+            return len(items)
+
+    def _deliver(self, batch):
+        for attempt in range(self.retries + 1):
+            try:
+                self.send(batch)
+                return
+            except Exception:
+                if attempt == self.retries:
+                    logger.exception('%s: giving up on %d items after %d attempts', self.name, len(batch), attempt + 1)
+                    return
+                logger.warning('%s: delivery failed, retrying', self.name, exc_info=True)
+                time.sleep(self.backoff * 2 ** attempt)
+
+    def _run(self):
+        while True:
+            wait = self.due()
+            if wait is None:
+                self._wake.wait()
+                self._wake.clear()
+            elif wait > 0:
+                # New items move the deadline; wake up and recompute
+                self._wake.wait(wait)
+                self._wake.clear()
+            else:
+                self.flush()
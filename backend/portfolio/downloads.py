@@ -0,0 +1,177 @@
+"""
+Serving the active CV file with validators, byte ranges and server offload
+
+The active CV's name, size and SHA-256 are cached per version of the ``cv``
+resource (see versions.py), so a download costs no query until a CV is
+saved. ``PORTFOLIO_CV_OFFLOAD`` selects how the bytes are sent:
+
+* ``None`` - Django streams the file. Under a WSGI server that implements
+  ``wsgi.file_wrapper`` with sendfile (e.g. gunicorn) the transfer is
+  zero-copy via ``os.sendfile``, ranges included.
+* ``'x-accel-redirect'`` - nginx serves ``PORTFOLIO_CV_ACCEL_PREFIX`` + name
+  from an ``internal`` location.
+* ``'x-sendfile'`` - Apache / lighttpd serve the absolute file path.
+"""
+import hashlib
+import re
+import threading
+from collections import namedtuple
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+
+from . import versions
+from .models import CV
+from .storage import digest_of
+
+CV_FILENAME = 'CV_Fares_Essam.pdf'
+
+CVFile = namedtuple('CVFile', ['name', 'storage', 'size', 'etag', 'modified'])
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+_lock = threading.Lock()
+_cached = None
+
+
+def file_sha256(storage, name):
+    digest = hashlib.sha256()
+    with storage.open(name, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def active_cv_file():
+    """Metadata of the active CV file, or None; recomputed only when a CV changes"""
+    global _cached
+    fingerprint = versions.fingerprint(versions.get_versions(('cv',)))
+    cached = _cached
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    cv = CV.objects.filter(is_active=True).first()
+    info = None
+    if cv and cv.file:
+        storage, name = cv.file.storage, cv.file.name
+        info = CVFile(
+            name=name,
+            storage=storage,
+            size=storage.size(name),
+            # Content-addressed names already carry the digest
+            etag='"%s"' % (digest_of(name) or file_sha256(storage, name)),
+            modified=int(storage.get_modified_time(name).timestamp()),
+        )
+    with _lock:
+        _cached = (fingerprint, info)
+    return info
+
+
+class RangeFile:
+    """Read-only view of ``length`` bytes of a file starting at ``start``"""
+
+    def __init__(self, file, start, length):
+        self.file = file
+        self.remaining = length
+        file.seek(start)
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        # Lets wsgi.file_wrapper use sendfile from the current offset for Content-Length bytes
+        return self.file.fileno()
+
+    def tell(self):
+        return self.file.tell()
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range(header, size):
+    """Return ``(start, end)`` inclusive for a single byte range, None to ignore, or False if unsatisfiable"""
+    match = _RANGE_RE.match(header.strip())
+    if not match:
+        # Malformed or multiple ranges: serve the whole file
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        suffix = int(last)
+        if suffix == 0:
+            return False
+        return max(size - suffix, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def if_range_matches(request, info):
+    header = request.META.get('HTTP_IF_RANGE')
+    if not header:
+        return True
+    if header.startswith('"'):
+        return header == info.etag
+    modified = parse_http_date_safe(header)
+    return modified is not None and modified >= info.modified
+
+
+def serve(request, info):
+    """Build the download response for ``info`` honouring conditional and Range headers"""
+    response = get_conditional_response(request, etag=info.etag, last_modified=info.modified)
+    if response is None:
+        offload = getattr(settings, 'PORTFOLIO_CV_OFFLOAD', None)
+        if offload == 'x-accel-redirect':
+            response = _offload_response('X-Accel-Redirect', getattr(
+                settings, 'PORTFOLIO_CV_ACCEL_PREFIX', '/protected-media/'
+            ) + info.name)
+        elif offload == 'x-sendfile':
+            response = _offload_response('X-Sendfile', info.storage.path(info.name))
+        else:
+            response = _file_response(request, info)
+
+    response['ETag'] = info.etag
+    response['Last-Modified'] = http_date(info.modified)
+    response['Accept-Ranges'] = 'bytes'
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
+def _offload_response(header, target):
+    # The front-end server handles Range and streams the body itself
+    response = HttpResponse(content_type='application/pdf')
+    response['Content-Disposition'] = content_disposition_header(True, CV_FILENAME)
+    response[header] = target
+    return response
+
+
+def _file_response(request, info):
+    byte_range = None
+    if request.method == 'GET' and 'HTTP_RANGE' in request.META and if_range_matches(request, info):
+        byte_range = parse_range(request.META['HTTP_RANGE'], info.size)
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{info.size}'
+            return response
+
+    file = info.storage.open(info.name, 'rb')
+    if byte_range is None:
+        return FileResponse(file, as_attachment=True, filename=CV_FILENAME)
+
+    start, end = byte_range
+    length = end - start + 1
+    response = FileResponse(RangeFile(file, start, length), as_attachment=True, filename=CV_FILENAME, status=206)
+    response['Content-Length'] = str(length)
+    response['Content-Range'] = f'bytes {start}-{end}/{info.size}'
+    return response
@@ -0,0 +1,164 @@
+"""
+Change notifications for the Server-Sent Events stream at /api/events/
+
+Every committed save or delete of portfolio content publishes a
+``{"model": ..., "id": ..., "version": ...}`` event, where ``version`` is the
+resource's new version token (see versions.py) and ``id`` is null after bulk
+writes, which touch an unknown set of rows. Frontends and edge caches refetch
+what an event names instead of polling every endpoint.
+
+Events are encoded once and kept in a ring buffer of
+``PORTFOLIO_EVENT_BUFFER`` entries shared by every subscriber; a subscriber
+is only a cursor into that buffer and an ``asyncio.Event``, so idle
+connections cost next to nothing. Publishing happens in whatever thread
+committed the change and wakes each event loop with subscribers through one
+``loop.call_soon_threadsafe`` call.
+
+Event ids are ``<boot>-<sequence>``: a reconnecting client's
+``Last-Event-ID`` resumes from the buffer. When the events it missed are no
+longer buffered, or the id comes from another process or an earlier start,
+it gets a ``reset`` event and should refetch everything. The buffer is per
+process, so run the stream in the process that serves the admin, or behind a
+single ASGI worker.
+"""
+import asyncio
+import itertools
+import json
+import threading
+import uuid
+from collections import deque
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+
+# Written by visitors and read by staff only; never announced publicly
+PRIVATE = {'contactmessage'}
+
+# Tells EventSource how long to wait before reconnecting, in milliseconds
+RETRY = b'retry: 3000\n\n'
+RESET = b'event: reset\ndata: {}\n\n'
+KEEPALIVE = b': keep-alive\n\n'
+
+
+class Subscription:
+    __slots__ = ('cursor', 'ready')
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.ready = asyncio.Event()
+
+
+class EventBroker:
+
+    def __init__(self, buffer_size=1000):
+        self.boot = uuid.uuid4().hex[:8]
+        self._log = deque(maxlen=buffer_size)
+        self._sequence = 0
+        self._lock = threading.Lock()
+        # event loop -> subscriptions served by it
+        self._loops = {}
+
+    def publish(self, model, pk, version):
+        """Append an event and wake every subscriber; safe to call from any thread"""
+        data = json.dumps({'model': model, 'id': pk, 'version': version}, separators=(',', ':'))
+        with self._lock:
+            self._sequence += 1
+            self._log.append((self._sequence, f'id: {self.boot}-{self._sequence}\nevent: change\ndata: {data}\n\n'.encode()))
+            loops = list(self._loops)
+        for loop in loops:
+            try:
+                loop.call_soon_threadsafe(self._wake, loop)
+            except RuntimeError:
+                # Closed loop; its subscriptions went with it
+                with self._lock:
+                    self._loops.pop(loop, None)
+
+    def _wake(self, loop):
+        with self._lock:
+            subscriptions = list(self._loops.get(loop, ()))
+        for subscription in subscriptions:
+            subscription.ready.set()
+
+    def subscribe(self, last_event_id=None):
+        """
+        Register a subscription on the running loop, positioned after
+        ``last_event_id`` or at the newest event. Returns it with a flag that is
+        True when events since ``last_event_id`` can't be replayed.
+        """
+        with self._lock:
+            cursor = self._sequence
+            lost = False
+            if last_event_id:
+                boot, _, sequence = last_event_id.partition('-')
+                first = self._log[0][0] if self._log else self._sequence + 1
+                if boot == self.boot and sequence.isdigit() and first - 1 <= int(sequence) <= self._sequence:
+                    cursor = int(sequence)
+                else:
+                    lost = True
+            subscription = Subscription(cursor)
+            self._loops.setdefault(asyncio.get_running_loop(), set()).add(subscription)
+        return subscription, lost
+
+    def unsubscribe(self, subscription):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            subscriptions = self._loops.get(loop)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._loops[loop]
+
+    def read(self, subscription):
+        """Encoded events after the subscription's cursor, advancing it; None if some were dropped"""
+        with self._lock:
+            if not self._log or subscription.cursor >= self._sequence:
+                return []
+            first = self._log[0][0]
+            if subscription.cursor < first - 1:
+                subscription.cursor = self._sequence
+                return None
+            events = [chunk for _, chunk in itertools.islice(self._log, subscription.cursor - first + 1, None)]
+            subscription.cursor = self._sequence
+        return events
+
+    async def stream(self, last_event_id=None, keepalive=15.0):
+        """The SSE response body for one client"""
+        subscription, lost = self.subscribe(last_event_id)
+        try:
+            yield RETRY + (RESET if lost else b'')
+            while True:
+                subscription.ready.clear()
+                events = self.read(subscription)
+                if events is None:
+                    yield RESET
+                elif events:
+                    yield b''.join(events)
+                try:
+                    # wait_for rather than asyncio.timeout(), which needs Python 3.11
+                    await asyncio.wait_for(subscription.ready.wait(), keepalive)
+                except asyncio.TimeoutError:
+                    # Keeps proxies from closing an idle connection
+                    yield KEEPALIVE
+        finally:
+            self.unsubscribe(subscription)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = EventBroker(getattr(settings, 'PORTFOLIO_EVENT_BUFFER', 1000))
+    return _broker
+
+
+def publish(resource, pk, version):
+    """Announce a change once the current transaction commits"""
+    if resource in PRIVATE:
+        return
+    transaction.on_commit(partial(get_broker().publish, resource, pk, version))
@@ -0,0 +1,281 @@
+"""
+Natural-keyed portfolio fixtures for export_portfolio / import_portfolio
+
+A fixture is a stream of ``{"model": "portfolio.skill", "fields": {...}}``
+records, as a JSON array or as NDJSON (one record per line), without primary
+keys. Rows are matched on ``NATURAL_KEYS`` and foreign keys hold the related
+row's natural key, so a fixture can be imported into any database, and
+imported again to update it.
+
+``Importer`` writes records in batches, one transaction per batch. Projects
+and skills, whose natural keys are unique constraints, are upserted with
+``bulk_create(update_conflicts=True)``. Rows of the other models are looked up
+by natural key first, then created with ``bulk_create`` or updated with
+``bulk_update``; their keys are not unique in the database, since e.g. two
+degrees from one institution are legitimate. File fields hold the stored names; the
+media files themselves are not part of a fixture. Technology rows are derived
+from ``Project.technologies`` and rebuilt on import.
+"""
+import gzip
+import json
+import sys
+import time
+from collections import Counter
+from datetime import date, datetime, time as time_of_day
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Q
+
+from .models import (
+    PersonalInfo, SocialLink, SkillCategory, Skill,
+    Project, Technology, Education, Certification
+)
+from .signals import bulk_changed
+
+# Exported and imported in this order, so foreign keys point at rows already written
+MODELS = (PersonalInfo, SocialLink, SkillCategory, Skill, Project, Education, Certification)
+# Fields identifying a row across databases; PersonalInfo is a singleton
+NATURAL_KEYS = {
+    PersonalInfo: (),
+    SocialLink: ('platform', 'url'),
+    SkillCategory: ('name',),
+    Skill: ('category', 'name'),
+    Project: ('slug',),
+    Education: ('institution', 'degree'),
+    Certification: ('name', 'issuer'),
+}
+# Natural keys backed by a unique constraint, upserted in one statement
+CONSTRAINED = {Skill, Project}
+FORMATS = ('json', 'ndjson')
+# Foreign keys resolved per query; bounds the size of the OR of composite keys
+LOOKUP_CHUNK = 200
+
+
+def label(model):
+    return model._meta.label_lower
+
+
+def data_fields(model):
+    return [field for field in model._meta.concrete_fields if not field.primary_key]
+
+
+def guess_format(path):
+    name = path[:-3] if path.endswith('.gz') else path
+    return 'ndjson' if name.endswith(('.ndjson', '.jsonl')) else 'json'
+
+
+def open_fixture(path, mode):
+    """Open ``path`` as text ('-' is stdin / stdout), gzip-compressed when it ends in .gz"""
+    if path == '-':
+        return sys.stdin if mode == 'r' else sys.stdout
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', compresslevel=6, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def _default(value):
+    # Full precision, unlike DjangoJSONEncoder, which drops datetime microseconds
+    if isinstance(value, (datetime, date, time_of_day)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+def dumps(record):
+    return json.dumps(record, default=_default, ensure_ascii=False, separators=(',', ':'))
+
+
+def export_records(model, chunk_size=2000):
+    """Yield a fixture record for every row of ``model``, streamed from the database"""
+    columns, shapes = [], []
+    for field in data_fields(model):
+        if field.is_relation:
+            related = [f'{field.name}__{name}' for name in NATURAL_KEYS[field.related_model]]
+            columns.extend(related)
+            shapes.append((field.name, related))
+        else:
+            columns.append(field.attname)
+            shapes.append((field.name, field.attname))
+    model_label = label(model)
+    for row in model.objects.order_by('pk').values(*columns).iterator(chunk_size=chunk_size):
+        fields = {
+            name: [row[column] for column in source] if isinstance(source, list) else row[source]
+            for name, source in shapes
+        }
+        yield {'model': model_label, 'fields': fields}
+
+
+def write(records, stream, fmt):
+    """Write ``records`` to ``stream`` as a JSON array or NDJSON; returns how many were written"""
+    count = 0
+    if fmt == 'ndjson':
+        for record in records:
+            stream.write(dumps(record) + '\n')
+            count += 1
+        return count
+    stream.write('[')
+    for record in records:
+        stream.write(('\n' if count == 0 else ',\n') + dumps(record))
+        count += 1
+    stream.write('\n]\n')
+    return count
+
+
+def read(stream, fmt):
+    """Yield the records of a fixture; NDJSON is parsed one line at a time"""
+    if fmt == 'ndjson':
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        yield from json.load(stream)
+
+
+class Importer:
+    """
+    Upsert fixture records in batches of ``batch_size``, one transaction per
+    batch. ``update=False`` only inserts rows whose natural key is new and
+    leaves existing rows as they are. Call ``finish()`` after the last record.
+    """
+
+    def __init__(self, batch_size=1000, update=True):
+        self.batch_size = batch_size
+        self.update = update
+        self.models = {label(model): model for model in MODELS}
+        self.pending = {model: [] for model in MODELS}
+        self.counts = Counter()
+        self.elapsed = Counter()
+        # model -> {natural key tuple: pk}, for resolving foreign keys
+        self.keys = {model: {} for model in MODELS}
+
+    def add(self, record):
+        model = self.models.get(record.get('model'))
+        if model is None:
+            raise ValueError(f'Unknown model {record.get("model")!r}')
+        self.pending[model].append(record['fields'])
+        if len(self.pending[model]) >= self.batch_size:
+            self.flush(model)
+
+    def finish(self):
+        """Write what is still pending, then refresh versions, caches and search indexes"""
+        for model in MODELS:
+            if self.pending[model]:
+                self.flush(model)
+        changed = [model for model in MODELS if self.counts[model]]
+        if Project in changed:
+            changed.append(Technology)
+        if changed:
+            bulk_changed(*changed)
+        return self.counts
+
+    def flush(self, model):
+        # Rows this batch refers to must be written first
+        for dependency in MODELS[:MODELS.index(model)]:
+            if self.pending[dependency]:
+                self.flush(dependency)
+        batch, self.pending[model] = self.pending[model], []
+        start = time.perf_counter()
+        with transaction.atomic():
+            objs = self.build(model, batch)
+            self.upsert(model, objs)
+            if model is Project:
+                slugs = [obj.slug for obj in objs]
+                Technology.sync_projects(Project.objects.filter(slug__in=slugs).only('id', 'technologies'))
+        self.elapsed[model] += time.perf_counter() - start
+        self.counts[model] += len(objs)
+
+    def build(self, model, batch):
+        relations = [field for field in data_fields(model) if field.is_relation]
+        for field in relations:
+            self.resolve(field.related_model, {tuple(fields[field.name]) for fields in batch})
+
+        # The last record wins when a batch repeats a natural key
+        objs = {}
+        for fields in batch:
+            values = {}
+            for field in data_fields(model):
+                if field.name not in fields:
+                    continue
+                value = fields[field.name]
+                if field.is_relation:
+                    values[field.attname] = self.keys[field.related_model][tuple(value)]
+                else:
+                    values[field.attname] = field.to_python(value)
+            obj = model(**values)
+            objs[natural_key(obj)] = obj
+        return list(objs.values())
+
+    def resolve(self, model, keys):
+        """Look up the primary keys of ``keys`` (natural key tuples) not seen yet"""
+        known = self.keys[model]
+        known.update(lookup(model, [key for key in keys if key not in known]))
+        unknown = [key for key in keys if key not in known]
+        if unknown:
+            raise ValueError(f'No {label(model)} with natural key {list(unknown[0])}')
+
+    def upsert(self, model, objs):
+        if model is PersonalInfo:
+            # Singleton: the fixture's last record replaces the existing row
+            objs[:] = objs[-1:]
+            objs[0].pk = PersonalInfo.objects.values_list('pk', flat=True).first()
+            unique_fields = ['id']
+        else:
+            unique_fields = list(NATURAL_KEYS[model])
+
+        # bulk_create stamps auto_now_add fields with the current time; keep the fixture's values
+        stamped = [field for field in data_fields(model) if getattr(field, 'auto_now_add', False)]
+        stamps = [[getattr(obj, field.attname) for field in stamped] for obj in objs]
+        update_fields = [
+            field.name for field in data_fields(model)
+            if field.name not in unique_fields and field not in stamped
+        ]
+
+        if model is PersonalInfo or model in CONSTRAINED:
+            if not self.update:
+                model.objects.bulk_create(objs, ignore_conflicts=True)
+                return
+            model.objects.bulk_create(
+                objs, update_conflicts=True, unique_fields=unique_fields, update_fields=update_fields,
+            )
+        else:
+            existing = lookup(model, [natural_key(obj) for obj in objs])
+            for obj in objs:
+                obj.pk = existing.get(natural_key(obj))
+            matched = [obj for obj in objs if obj.pk is not None]
+            model.objects.bulk_create([obj for obj in objs if obj.pk is None])
+            if not self.update:
+                return
+            if matched and update_fields:
+                model.objects.bulk_update(matched, update_fields)
+
+        restore = []
+        for obj, values in zip(objs, stamps):
+            if obj.pk is not None and all(value is not None for value in values):
+                for field, value in zip(stamped, values):
+                    setattr(obj, field.attname, value)
+                restore.append(obj)
+        if stamped and restore:
+            model.objects.bulk_update(restore, [field.name for field in stamped])
+
+
+def natural_key(obj):
+    return tuple(getattr(obj, obj._meta.get_field(name).attname) for name in NATURAL_KEYS[type(obj)])
+
+
+def lookup(model, keys):
+    """``{natural key tuple: pk}`` for the rows of ``model`` matching ``keys``; the oldest row wins a tie"""
+    found = {}
+    names = NATURAL_KEYS[model]
+    for start in range(0, len(keys), LOOKUP_CHUNK):
+        chunk = keys[start:start + LOOKUP_CHUNK]
+        if len(names) == 1:
+            condition = Q(**{f'{names[0]}__in': [key[0] for key in chunk]})
+        else:
+            condition = Q()
+            for key in chunk:
+                condition |= Q(**dict(zip(names, key)))
+        for *key, pk in model.objects.filter(condition).order_by('-pk').values_list(*names, 'pk'):
+            found[tuple(key)] = pk
+    return found
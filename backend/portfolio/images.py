@@ -0,0 +1,181 @@
+"""
+Responsive image derivatives for uploaded images
+
+Every uploaded image gets a fixed ladder of resized WebP/AVIF variants stored
+next to the media files under ``derivatives/<source name>/<width>.<format>``.
+Variants are generated in a background thread pool after the upload is
+committed, and any variant that is still missing is generated on its first
+request by ``ImageDerivativeView``.
+"""
+import functools
+import io
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.urls import reverse
+
+logger = logging.getLogger(__name__)
+
+WIDTHS = (320, 640, 1024, 1600)
+# Small variant for admin changelist thumbnails; not part of the srcset
+THUMBNAIL_WIDTH = 100
+THUMBNAIL_FORMAT = 'webp'
+FORMATS = ('avif', 'webp')
+DERIVATIVE_ROOT = 'derivatives'
+# Upload directories whose images may be resized (see upload_to in models.py)
+SOURCE_DIRS = ('profile/', 'projects/', 'education/', 'certifications/')
+SAVE_OPTIONS = {
+    'webp': {'quality': 80, 'method': 4},
+    'avif': {'quality': 55},
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+@functools.cache
+def available_formats():
+    """Formats from FORMATS that the installed Pillow can encode, unless PORTFOLIO_IMAGE_FORMATS names them"""
+    configured = getattr(settings, 'PORTFOLIO_IMAGE_FORMATS', None)
+    if configured is not None:
+        return tuple(fmt for fmt in FORMATS if fmt in configured)
+    from PIL import features
+    return tuple(fmt for fmt in FORMATS if features.check(fmt))
+
+
+def derivative_name(source_name, width, fmt):
+    return f'{DERIVATIVE_ROOT}/{source_name}/{width}.{fmt}'
+
+
+def is_source(name):
+    return name.startswith(SOURCE_DIRS) and '..' not in name.split('/')
+
+
+def parse_derivative_name(name):
+    """Split a derivative name into ``(source_name, width, fmt)``, or None if invalid"""
+    prefix, _, rest = name.partition('/')
+    source_name, _, variant = rest.rpartition('/')
+    width, _, fmt = variant.partition('.')
+    if prefix != DERIVATIVE_ROOT or not is_source(source_name) or not width.isdigit():
+        return None
+    if int(width) not in WIDTHS + (THUMBNAIL_WIDTH,) or fmt not in available_formats():
+        return None
+    return source_name, int(width), fmt
+
+
+class UndecodableImage(Exception):
+    """The source file is not an image Pillow can read"""
+
+
+def generate(source_name, width, fmt, storage=default_storage):
+    """
+    Render one variant of ``source_name`` and store it, returning its name.
+    Raises ``UndecodableImage`` when the source cannot be decoded.
+    """
+    from PIL import Image, ImageOps
+    from .storage import replace
+
+    name = derivative_name(source_name, width, fmt)
+    with storage.open(source_name, 'rb') as source:
+        try:
+            image = Image.open(source)
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((width, width * 4), Image.Resampling.LANCZOS)
+        # UnidentifiedImageError for unknown formats, OSError or SyntaxError for damaged files
+        except (OSError, SyntaxError, ValueError, Image.DecompressionBombError) as exc:
+            raise UndecodableImage(f'Cannot decode {source_name}: {exc}') from exc
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if 'transparency' in image.info or image.mode in ('LA', 'PA') else 'RGB')
+        buffer = io.BytesIO()
+        image.save(buffer, format=fmt.upper(), **SAVE_OPTIONS.get(fmt, {}))
+
+    # Concurrent requests for a missing variant may all render it; each
+    # replaces the file atomically, so none gets a suffixed name
+    return replace(storage, name, ContentFile(buffer.getvalue()))
+
+
+def generate_all(source_name, storage=default_storage):
+    """Generate every missing variant of ``source_name``, the admin thumbnail included"""
+    variants = [(fmt, width) for fmt in available_formats() for width in WIDTHS]
+    if THUMBNAIL_FORMAT in available_formats():
+        variants.append((THUMBNAIL_FORMAT, THUMBNAIL_WIDTH))
+    for fmt, width in variants:
+        if storage.exists(derivative_name(source_name, width, fmt)):
+            continue
+        try:
+            generate(source_name, width, fmt, storage)
+        except UndecodableImage as exc:
+            logger.warning('No variants of %s: %s', source_name, exc.__cause__)
+            return
+        except Exception:
+            logger.exception('Could not generate %s variant %s of %s', fmt, width, source_name)
+            return
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = getattr(settings, 'PORTFOLIO_IMAGE_WORKERS', 2)
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='image-derivatives')
+    return _executor
+
+
+def schedule(source_name):
+    """Generate the variants of ``source_name`` once the current transaction commits"""
+    if not is_source(source_name):
+        return
+    if getattr(settings, 'PORTFOLIO_IMAGE_WORKERS', 2) == 0:
+        transaction.on_commit(lambda: generate_all(source_name))
+    else:
+        transaction.on_commit(lambda: _get_executor().submit(generate_all, source_name))
+
+
+@functools.cache
+def _url_prefix():
+    # Reverse once and reuse the prefix; reversing every variant of every row is slow
+    return reverse('image-derivative', args=['x'])[:-1]
+
+
+def srcset_base(request=None):
+    """URL prefix of every derivative, absolute when a request is available"""
+    base = _url_prefix()
+    if request is not None:
+        base = request.build_absolute_uri(base)
+    return base
+
+
+def srcset_for_name(source_name, base):
+    """``{format: {width: url}}`` for a stored image name and a ``srcset_base()``"""
+    return {
+        fmt: {str(width): base + quote(derivative_name(source_name, width, fmt)) for width in WIDTHS}
+        for fmt in available_formats()
+    }
+
+
+def thumbnail_url(field_file):
+    """
+    URL of the small thumbnail variant of an image field, generated on its
+    first request; the original's URL when no variant can be made
+    """
+    if not field_file:
+        return None
+    if not is_source(field_file.name) or THUMBNAIL_FORMAT not in available_formats():
+        return field_file.url
+    return _url_prefix() + quote(derivative_name(field_file.name, THUMBNAIL_WIDTH, THUMBNAIL_FORMAT))
+
+
+def srcset(field_file, request=None):
+    """
+    ``{format: {width: url}}`` for an image field, or None when it is empty.
+    URLs are absolute when a request is available, like the *_url fields.
+    """
+    if not field_file:
+        return None
+    return srcset_for_name(field_file.name, srcset_base(request))
@@ -0,0 +1,191 @@
+"""
+Buffered ingestion of contact form submissions
+
+In ``buffered`` mode (``PORTFOLIO_CONTACT_INGEST``) validated messages are
+appended to a per-process spool file, fsync'd, queued in memory and written
+with one ``bulk_create`` when ``PORTFOLIO_CONTACT_BATCH_SIZE`` messages are
+pending or ``PORTFOLIO_CONTACT_FLUSH_INTERVAL`` seconds have passed. This
+takes the database write lock once per batch instead of once per POST.
+
+Each buffer names its spool files with a token unique to the process
+(``contact-<pid>-<random>.*``) and holds an exclusive lock on
+``contact-<token>.lock`` while it runs. Spool files whose owner's lock can be
+taken were left behind by a crashed process; the next buffer to start replays
+them before opening its own spool, so delivery is at-least-once. PIDs are
+never trusted for this, since a restarted container reuses them.
+``created_at`` is the time of the flush, not of the submission.
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files import locks
+from django.db import connections, transaction
+
+from .models import ContactMessage
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ('name', 'email', 'subject', 'message')
+
+
+PREFIX = 'contact-'
+
+
+def _token(path):
+    """Owner token of a spool or lock file: ``contact-<token>.<suffix>``"""
+    return path.name[len(PREFIX):].split('.', 1)[0]
+
+
+def _rotation(path):
+    # contact-<token>.<n>.flushing sorts by n; the live spool comes last
+    parts = path.name.split('.')
+    return int(parts[1]) if len(parts) == 3 and parts[1].isdigit() else float('inf')
+
+
+class ContactMessageBuffer:
+
+    def __init__(self, spool_dir, batch_size=50, flush_interval=2.0):
+        self.spool_dir = Path(spool_dir)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.pid = os.getpid()
+        self.token = f'{self.pid}-{uuid.uuid4().hex[:12]}'
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._pending = []
+        self._inflight = []
+        self._rotation = 0
+
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        # Held until the process exits; a takeable lock marks a dead owner
+        self._owner_lock = open(self.spool_dir / f'{PREFIX}{self.token}.lock', 'a')
+        locks.lock(self._owner_lock, locks.LOCK_EX)
+
+        self._thread = threading.Thread(target=self._run, name='contact-ingest', daemon=True)
+        self.recover()
+        self.spool_path = self.spool_dir / f'{PREFIX}{self.token}.ndjson'
+        self._spool = open(self.spool_path, 'a', encoding='utf-8')
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def submit(self, data):
+        """Durably queue one validated message"""
+        record = {field: data[field] for field in FIELDS}
+        with self._lock:
+            self._spool.write(json.dumps(record) + '\n')
+            self._spool.flush()
+            os.fsync(self._spool.fileno())
+            self._pending.append(record)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def flush(self):
+        """Write every pending message and drop the spool files that held them"""
+        with self._flush_lock:
+            with self._lock:
+                if self._pending:
+                    batch, self._pending = self._pending, []
+                    # Rotate the spool so new submissions don't land in the file being flushed
+                    self._spool.close()
+                    flushing = self._next_flushing_path()
+                    os.rename(self.spool_path, flushing)
+                    self._spool = open(self.spool_path, 'a', encoding='utf-8')
+                    self._inflight.append((flushing, batch))
+
+            written = 0
+            # A failed batch stays in _inflight (and on disk) and is retried next time
+            while self._inflight:
+                flushing, batch = self._inflight[0]
+                self._write(batch)
+                flushing.unlink()
+                self._inflight.pop(0)
+                written += len(batch)
+            return written
+
+    def _next_flushing_path(self):
+        # Never reuse the name of a file that may still hold unwritten messages
+        while True:
+            self._rotation += 1
+            path = self.spool_dir / f'{PREFIX}{self.token}.{self._rotation}.flushing'
+            if not path.exists():
+                return path
+
+    def recover(self):
+        """Replay the spool files of every buffer whose process is no longer running"""
+        tokens = {_token(path) for path in self.spool_dir.glob(f'{PREFIX}*')} - {self.token}
+        for token in sorted(tokens):
+            lock_path = self.spool_dir / f'{PREFIX}{token}.lock'
+            with open(lock_path, 'a') as owner_lock:
+                if not locks.lock(owner_lock, locks.LOCK_EX | locks.LOCK_NB):
+                    # Still running, or being recovered by another process
+                    continue
+                # Listed again under the lock: another process may have just replayed them
+                paths = sorted(
+                    (path for path in self.spool_dir.glob(f'{PREFIX}{token}.*') if path.suffix != '.lock'),
+                    key=_rotation,
+                )
+                for path in paths:
+                    self._replay(path)
+                lock_path.unlink(missing_ok=True)
+
+    def _replay(self, path):
+        batch = []
+        with open(path, encoding='utf-8') as spool:
+            for line in spool:
+                try:
+                    batch.append(json.loads(line))
+                except ValueError:
+                    # A torn final line from the crash; it was never acknowledged
+                    logger.warning('Skipping unreadable line in %s', path.name)
+        if batch:
+            self._write(batch)
+            logger.info('Recovered %d contact messages from %s', len(batch), path.name)
+        path.unlink()
+
+    def _write(self, batch):
+        try:
+            with transaction.atomic():
+                ContactMessage.objects.bulk_create(
+                    [ContactMessage(**record) for record in batch], batch_size=500
+                )
+        finally:
+            if threading.current_thread() is self._thread:
+                connections.close_all()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Flushing buffered contact messages failed; will retry')
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer():
+    """Process-wide buffer configured from settings"""
+    global _buffer
+    with _buffer_lock:
+        if _buffer is None or _buffer.pid != os.getpid():
+            _buffer = ContactMessageBuffer(
+                spool_dir=getattr(settings, 'PORTFOLIO_CONTACT_SPOOL_DIR', Path(settings.BASE_DIR) / 'spool'),
+                batch_size=getattr(settings, 'PORTFOLIO_CONTACT_BATCH_SIZE', 50),
+                flush_interval=getattr(settings, 'PORTFOLIO_CONTACT_FLUSH_INTERVAL', 2.0),
+            )
+    return _buffer
+
+
+def is_buffered():
+    return getattr(settings, 'PORTFOLIO_CONTACT_INGEST', 'sync') == 'buffered'
@@ -0,0 +1,125 @@
+"""
+Per-request SQL instrumentation and query budgets
+
+``QueryRecorder`` is a database execute wrapper that counts queries, sums
+their time and groups them by fingerprint (SQL with literals and IN-lists
+collapsed) so repeated shapes - the signature of an N+1 - stand out.
+``QUERY_BUDGETS`` caps the number of queries each URL name in
+portfolio/urls.py may issue; the middleware logs overruns and the tests fail
+on them.
+"""
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+# Maximum SQL queries per request, keyed by URL name (see portfolio/urls.py).
+# Counts are for a cold request; conditional hits and cached payloads use fewer.
+QUERY_BUDGETS = {
+    'api-overview': 0,
+    'bundle': 9,
+    'personal-info': 1,
+    'social-links': 1,
+    'skill-categories': 2,
+    'skills': 1,
+    'featured-skills': 1,
+    'projects': 1,
+    'project-search': 2,
+    'project-detail': 1,
+    'education': 1,
+    'certifications': 1,
+    'cv': 1,
+    # One grouped query per statistic (see stats.py)
+    'stats': 5,
+    'events': 0,
+    'cv-download': 1,
+    'image-derivative': 0,
+    'media': 0,
+    'contact': 1,
+    # Session and user lookups for the staff check, then one page
+    'contact-messages': 3,
+}
+
+_IN_LIST_RE = re.compile(r'\((?:\s*%s\s*,)+\s*%s\s*\)')
+_NUMBER_RE = re.compile(r'\b\d+\b')
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_SPACE_RE = re.compile(r'\s+')
+
+_recorder = ContextVar('portfolio_query_recorder', default=None)
+
+
+def fingerprint(sql):
+    """Normalize SQL so queries that differ only in literal values compare equal"""
+    sql = _STRING_RE.sub('?', sql)
+    sql = _IN_LIST_RE.sub('(...)', sql)
+    sql = _NUMBER_RE.sub('?', sql)
+    return _SPACE_RE.sub(' ', sql).strip()
+
+
+class QueryRecorder:
+    """Execute wrapper callable that records every query it is handed"""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - start))
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def duration(self):
+        return sum(seconds for _, seconds in self.queries)
+
+    def duplicates(self):
+        """``{fingerprint: count}`` for query shapes that ran more than once"""
+        counts = Counter(fingerprint(sql) for sql, _ in self.queries)
+        return {shape: count for shape, count in counts.items() if count > 1}
+
+
+def _execute(execute, sql, params, many, context):
+    recorder = _recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def install(connection, **kwargs):
+    """Add the dispatching execute wrapper to a connection (once)"""
+    if _execute not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_execute)
+
+
+@contextmanager
+def record_queries(recorder=None):
+    """
+    Record every query run in this context. The recorder lives in a context
+    variable rather than on the connections, which are per thread, so queries
+    the async ORM runs in its worker thread are attributed to the right request.
+    """
+    recorder = recorder or QueryRecorder()
+    for alias in connections:
+        install(connections[alias])
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
+
+
+def budget_for(url_name):
+    return QUERY_BUDGETS.get(url_name)
+
+
+# Connections opened later (e.g. by the async ORM's worker thread) get the wrapper too
+connection_created.connect(install, dispatch_uid='portfolio.instrumentation.install')
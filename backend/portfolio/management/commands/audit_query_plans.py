@@ -0,0 +1,120 @@
+"""
+Management command to check the query plans of every list and detail view
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, router
+from django.test import RequestFactory
+from django.utils import timezone
+from rest_framework import generics
+from rest_framework.request import Request
+
+from portfolio import urls as portfolio_urls
+from portfolio.admin import ContactMessageAdmin
+from portfolio import views
+from portfolio.models import CV, ContactMessage
+
+# Query strings exercised per URL name, besides the bare URL
+VARIANTS = {
+    'projects': ['featured=true', 'tech=react', 'page_size=20', 'featured=true&page_size=20'],
+    'education': ['page_size=20'],
+    'certifications': ['page_size=20'],
+    'contact-messages': ['page_size=20'],
+}
+# Plans that sort on purpose, with the reason
+ACCEPTED = {
+    'skills': "ordered by the category's order, a column of another table; no index spans both",
+    'featured-skills': "ordered by the category's order, a column of another table; no index spans both",
+    'projects?tech=react': 'the technology join finds the few matching projects first; sorting them is '
+                           'cheaper than walking every active project in order',
+}
+# Plan lines that mean every row is read or the result is sorted after the fact
+FULL_SCAN = 'SCAN'
+TEMP_SORT = 'USE TEMP B-TREE'
+
+
+def is_problem(line):
+    if TEMP_SORT in line:
+        return True
+    # "SCAN t USING INDEX i" walks an index in the wanted order and stops at the
+    # LIMIT; "SCAN t" alone reads the whole table
+    words = line.split()
+    return FULL_SCAN in words and 'INDEX' not in words and 'VIRTUAL' not in words
+
+
+class Command(BaseCommand):
+    help = 'Runs EXPLAIN QUERY PLAN for every view queryset and fails on full table scans or temp B-tree sorts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verbose-plans', action='store_true', help='Print every plan, not only problems')
+
+    def handle(self, *args, **options):
+        problems = []
+        for label, queryset in self.querysets():
+            connection = connections[router.db_for_read(queryset.model)]
+            if connection.vendor != 'sqlite':
+                raise CommandError(f'EXPLAIN QUERY PLAN is SQLite only; {connection.alias} is {connection.vendor}')
+            sql, params = queryset.query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+                plan = [row[-1] for row in cursor.fetchall()]
+            flagged = [line for line in plan if is_problem(line)]
+            if flagged and label in ACCEPTED:
+                self.stdout.write(self.style.WARNING(f'{label}: accepted, {ACCEPTED[label]}'))
+                flagged = []
+            if flagged:
+                problems.append(label)
+            if flagged or options['verbose_plans']:
+                style = self.style.ERROR if flagged else self.style.SUCCESS
+                self.stdout.write(style(label))
+                for line in plan:
+                    self.stdout.write(f'    {"!" if line in flagged else " "} {line}')
+
+        if problems:
+            raise CommandError(f'{len(problems)} queries scan a full table or sort in a temp B-tree')
+        self.stdout.write(self.style.SUCCESS('✓ Every view query is served from an index'))
+
+    def querysets(self):
+        """``(label, queryset)`` for the rows each view reads, as it reads them"""
+        factory = RequestFactory()
+        for pattern in portfolio_urls.urlpatterns:
+            # The sync view of each route; the async views build the same querysets
+            view_class = getattr(views, getattr(pattern.callback, 'view_class', type).__name__, None)
+            if not isinstance(view_class, type) or not issubclass(view_class, (generics.ListAPIView, generics.RetrieveAPIView)):
+                continue
+            if pattern.name == 'project-search':
+                # FTS5 MATCH query, planned by the virtual table
+                continue
+            for query in [''] + VARIANTS.get(pattern.name, []):
+                label = f'{pattern.name}?{query}' if query else pattern.name
+                request = Request(factory.get(f'/?{query}'))
+                view = view_class(request=request, args=(), kwargs={}, format_kwarg=None)
+                queryset = view.get_queryset()
+                if getattr(view, 'reader', None) is not None:
+                    queryset = view.reader.values(queryset)
+                if pattern.name == 'project-detail':
+                    yield label, queryset.filter(slug='example')
+                    continue
+
+                paginator = view.pagination_class() if view.pagination_class else None
+                page = paginator.page_queryset(queryset, request) if paginator else None
+                if page is None:
+                    yield label, queryset
+                    continue
+                yield label, page
+                # The next page: a range condition on the ordering columns
+                rows = list(page[:1])
+                if rows:
+                    values = [paginator.field_value(rows[0], name.lstrip('-')) for name in paginator.ordering]
+                    request = Request(factory.get(f'/?{query}&cursor={paginator.encode_cursor(values)}'))
+                    yield f'{label}&cursor', paginator.page_queryset(queryset, request)
+
+        yield 'cv', CV.objects.filter(is_active=True).order_by(*CV._meta.ordering)[:1]
+
+        # Contact message admin changelist: its ordering plus the list_filter options
+        messages = ContactMessage.objects.order_by(*ContactMessageAdmin.ordering)
+        since = timezone.now() - timedelta(days=7)
+        yield 'admin contactmessage', messages[:100]
+        yield 'admin contactmessage?is_read', messages.filter(is_read=False)[:100]
+        yield 'admin contactmessage?created_at', messages.filter(created_at__gte=since)[:100]
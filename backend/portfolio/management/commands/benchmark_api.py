@@ -0,0 +1,105 @@
+"""
+Management command to benchmark every API endpoint and save the results as JSON
+"""
+import json
+import logging
+import platform
+from datetime import datetime, timezone
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio import benchmarks
+from portfolio.models import (
+    SkillCategory, Skill, Project, Education, Certification, ContactMessage
+)
+
+
+class Command(BaseCommand):
+    help = 'Benchmarks the API in-process or over HTTP and reports req/s, latency percentiles, SQL queries and bytes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', help='Base URL of a running server (e.g. http://127.0.0.1:8000); in-process if omitted')
+        parser.add_argument(
+            '--interface', choices=['wsgi', 'asgi'], default='wsgi',
+            help='In-process handler: WSGI with worker threads, or ASGI with tasks on one event loop '
+                 '(set PORTFOLIO_ASYNC_VIEWS=1 to serve the async views)'
+        )
+        parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint')
+        parser.add_argument('--concurrency', type=int, default=1, help='Concurrent workers per endpoint')
+        parser.add_argument('--endpoint', action='append', dest='endpoints', help='URL name to include (repeatable)')
+        parser.add_argument('--output', help='Write the results to this JSON file')
+        parser.add_argument('--compare', help='Print the change against a previous results file')
+
+    def handle(self, *args, **options):
+        if options['url']:
+            runner = benchmarks.HTTPRunner(options['url'])
+        elif options['interface'] == 'asgi':
+            runner = benchmarks.ASGIRunner()
+        else:
+            runner = benchmarks.InProcessRunner()
+
+        # Expected 4xx responses (e.g. no active CV) would otherwise log once per request
+        logging.getLogger('django.request').setLevel(logging.ERROR)
+
+        paths = benchmarks.endpoint_paths(options['endpoints'])
+        if not paths:
+            raise CommandError('No endpoints to benchmark')
+
+        self.stdout.write(
+            f'Benchmarking {len(paths)} endpoints ({runner.mode}, '
+            f'{options["requests"]} requests, concurrency {options["concurrency"]})'
+        )
+        self.stdout.write(f'{"endpoint":<20} {"req/s":>9} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} {"queries":>8} {"bytes":>10}')
+        results = benchmarks.run(
+            runner, paths, options['requests'], options['concurrency'], progress=self.report
+        )
+
+        report = {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'mode': runner.mode,
+            'requests': options['requests'],
+            'concurrency': options['concurrency'],
+            'environment': {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'async_views': settings.PORTFOLIO_ASYNC_VIEWS,
+            },
+            # Row counts of the local database, which is the one served in-process
+            'dataset': None if options['url'] else self.dataset_size(),
+            'endpoints': results,
+        }
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(report, indent=2))
+            self.stdout.write(self.style.SUCCESS(f'✓ Results written to {options["output"]}'))
+        if options['compare']:
+            baseline = json.loads(Path(options['compare']).read_text())
+            for name, change in benchmarks.compare(baseline, report).items():
+                self.stdout.write(
+                    f'{name:<20} req/s {self.signed(change["requests_per_second"])} '
+                    f'p95 {self.signed(change["p95_ms"])} queries {change["sql_queries"][0]} -> {change["sql_queries"][1]}'
+                )
+
+    def report(self, name, result):
+        latency = result['latency_ms']
+        queries = '-' if result['sql_queries'] is None else result['sql_queries']
+        line = (
+            f'{name:<20} {result["requests_per_second"]:>9} {latency["p50"]:>9} '
+            f'{latency["p95"]:>9} {latency["p99"]:>9} {queries:>8} {result["bytes"]:>10}'
+        )
+        self.stdout.write(self.style.ERROR(line) if result['errors'] else line)
+
+    def signed(self, value):
+        return 'n/a' if value is None else f'{value:+.1f}%'
+
+    def dataset_size(self):
+        return {
+            'skill_categories': SkillCategory.objects.count(),
+            'skills': Skill.objects.count(),
+            'projects': Project.objects.count(),
+            'education': Education.objects.count(),
+            'certifications': Certification.objects.count(),
+            'contact_messages': ContactMessage.objects.count(),
+        }
@@ -0,0 +1,48 @@
+"""
+Management command to compare JSON encoder throughput on the largest API payloads
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from portfolio import benchmarks, readers, renderers, snapshot, stats
+from portfolio.models import SkillCategory, Project, Certification
+
+# Payloads as the views build them, before rendering; projects and
+# certifications unpaginated, as large as the responses can get
+PAYLOADS = {
+    'projects': lambda request: readers.PROJECTS.serialize(Project.objects.filter(is_active=True), request),
+    'skill-categories': lambda request: readers.SKILL_CATEGORIES.serialize(SkillCategory.objects.all(), request),
+    'certifications': lambda request: readers.CERTIFICATIONS.serialize(Certification.objects.all(), request),
+    'bundle': lambda request: snapshot.build_bundle(request),
+    'stats': lambda request: stats.build_stats(),
+}
+
+
+class Command(BaseCommand):
+    help = 'Times each available JSON encoder on the largest payloads and checks the output matches JSONRenderer'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per encoder; the fastest is reported')
+        parser.add_argument('--payload', action='append', dest='payloads', choices=list(PAYLOADS))
+        parser.add_argument('--host', default='localhost:8000', help='Host the absolute media URLs are built for')
+
+    def handle(self, *args, **options):
+        request = Request(RequestFactory().get('/api/', HTTP_HOST=options['host']))
+        encoders = renderers.available()
+        self.stdout.write(f'{"payload":<18} {"bytes":>11} ' + ' '.join(f'{name + " ms":>11} {"MB/s":>7}' for name in encoders))
+        mismatched = []
+        for name in options['payloads'] or PAYLOADS:
+            result = benchmarks.compare_encoders(PAYLOADS[name](request), encoders, options['repeat'])
+            columns = ' '.join(
+                f'{timing["ms"]:>11} {timing["mb_per_second"]:>7}' for timing in result['encoders'].values()
+            )
+            self.stdout.write(f'{name:<18} {result["bytes"]:>11,} {columns}')
+            mismatched += [
+                f'{name} ({encoder})' for encoder, timing in result['encoders'].items()
+                if encoder in renderers.EXACT and not timing['identical']
+            ]
+
+        if mismatched:
+            raise CommandError(f'Output differs from JSONRenderer for: {", ".join(mismatched)}')
+        self.stdout.write(self.style.SUCCESS(f'✓ Encoders benchmarked: {", ".join(encoders)}'))
@@ -0,0 +1,51 @@
+"""
+Management command to compare the DRF serializers with the fast readers
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Prefetch
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from portfolio import benchmarks, readers
+from portfolio.models import SocialLink, SkillCategory, Skill, Project, Education, Certification
+
+# endpoint -> (reader, queryset, what the serializer's queryset needs to avoid
+# a query per row). The readers load related columns and nested rows themselves.
+CASES = {
+    'social-links': (readers.SOCIAL_LINKS, lambda: SocialLink.objects.filter(is_active=True), None),
+    'skill-categories': (
+        readers.SKILL_CATEGORIES, lambda: SkillCategory.objects.all(),
+        lambda queryset: queryset.prefetch_related(Prefetch('skills', readers.SKILLS.ordered(Skill.objects.all()))),
+    ),
+    'skills': (readers.SKILLS, lambda: Skill.objects.all(), lambda queryset: queryset.select_related('category')),
+    'projects': (readers.PROJECTS, lambda: Project.objects.filter(is_active=True), None),
+    'education': (readers.EDUCATION, lambda: Education.objects.all(), None),
+    'certifications': (readers.CERTIFICATIONS, lambda: Certification.objects.all(), None),
+}
+
+
+class Command(BaseCommand):
+    help = 'Times serializer vs reader output for each list endpoint and checks the JSON is byte-identical'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per variant; the fastest is reported')
+        parser.add_argument('--endpoint', action='append', dest='endpoints', choices=list(CASES))
+        parser.add_argument('--host', default='localhost:8000', help='Host the absolute media URLs are built for')
+
+    def handle(self, *args, **options):
+        request = Request(RequestFactory().get('/api/', HTTP_HOST=options['host']))
+        self.stdout.write(f'{"endpoint":<18} {"rows":>7} {"serializer ms":>14} {"reader ms":>10} {"speedup":>8}')
+        mismatched = []
+        for name in options['endpoints'] or CASES:
+            reader, queryset, for_serializer = CASES[name]
+            result = benchmarks.compare_serializer(reader, queryset(), request, options['repeat'], for_serializer)
+            self.stdout.write(
+                f'{name:<18} {result["rows"]:>7} {result["serializer_ms"]:>14} '
+                f'{result["reader_ms"]:>10} {result["speedup"]:>7}x'
+            )
+            if not result['identical']:
+                mismatched.append(name)
+
+        if mismatched:
+            raise CommandError(f'Reader output differs from the serializer for: {", ".join(mismatched)}')
+        self.stdout.write(self.style.SUCCESS('✓ Reader output is byte-identical to the serializers'))
@@ -0,0 +1,37 @@
+"""
+Management command to export the portfolio content as a natural-keyed fixture
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from portfolio import fixtures
+
+
+class Command(BaseCommand):
+    help = 'Streams every portfolio model to a JSON or NDJSON fixture (see portfolio/fixtures.py)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', help="Fixture file (.json, .ndjson, optionally .gz), or '-' for stdout")
+        parser.add_argument('--format', choices=fixtures.FORMATS, help='Defaults to the file extension')
+
+    def handle(self, *args, **options):
+        output = options['output']
+        fmt = options['format'] or fixtures.guess_format(output)
+        start = time.perf_counter()
+
+        def records():
+            for model in fixtures.MODELS:
+                yield from fixtures.export_records(model)
+
+        stream = fixtures.open_fixture(output, 'w')
+        try:
+            count = fixtures.write(records(), stream, fmt)
+        finally:
+            if output != '-':
+                stream.close()
+
+        if output != '-':
+            elapsed = time.perf_counter() - start
+            rate = count / elapsed if elapsed else 0
+            self.stdout.write(self.style.SUCCESS(f'✓ {count} records written to {output} ({rate:,.0f} rows/s)'))
@@ -0,0 +1,114 @@
+"""
+Management command to pre-render every public GET endpoint to static JSON files
+"""
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.urls import reverse
+
+from portfolio import urls as portfolio_urls
+from portfolio.models import Project
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MANIFEST = 'manifest.json'
+# Routes that are not public JSON reads: uploads, binary downloads, queries, staff views, the event stream
+SKIP_ROUTES = {'project-search', 'cv-download', 'image-derivative', 'contact', 'contact-messages', 'events'}
+
+
+class Command(BaseCommand):
+    help = 'Renders every public GET API route to JSON files with .gz/.br siblings and a manifest'
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', help='Directory to write the exported API into')
+        parser.add_argument(
+            '--base-url', default='http://localhost:8000',
+            help='Scheme and host used for absolute media URLs in the payloads'
+        )
+
+    def handle(self, *args, **options):
+        output = Path(options['output'])
+        base = urlsplit(options['base_url'])
+        if not base.scheme or not base.netloc:
+            raise CommandError('--base-url must look like https://api.example.com')
+
+        client = Client(HTTP_HOST=base.netloc, HTTP_ACCEPT='application/json')
+        secure = base.scheme == 'https'
+
+        old_manifest = self.load_manifest(output)
+        manifest = {}
+        written = 0
+        for path in self.get_paths():
+            response = client.get(path, secure=secure)
+            if response.status_code != 200:
+                self.stdout.write(self.style.WARNING(f'Skipped {path} (HTTP {response.status_code})'))
+                continue
+
+            body = response.content
+            digest = hashlib.sha256(body).hexdigest()
+            relative = self.file_for(path)
+            manifest[path] = {'file': relative, 'sha256': digest, 'size': len(body)}
+            if old_manifest.get(path, {}).get('sha256') == digest and (output / relative).exists():
+                continue
+            self.write_variants(output / relative, body)
+            written += 1
+
+        removed = 0
+        for path, entry in old_manifest.items():
+            if path not in manifest:
+                for suffix in ('', '.gz', '.br'):
+                    stale = output / (entry['file'] + suffix)
+                    if stale.exists():
+                        stale.unlink()
+                removed += 1
+
+        self.write_file(output / MANIFEST, json.dumps(manifest, indent=2, sort_keys=True).encode())
+        if brotli is None:
+            self.stdout.write(self.style.WARNING('brotli is not installed; .br files were not written'))
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Exported {len(manifest)} routes ({written} changed, {removed} removed) to {output}'
+        ))
+
+    def get_paths(self):
+        for pattern in portfolio_urls.urlpatterns:
+            name = pattern.name
+            if name in SKIP_ROUTES:
+                continue
+            if name == 'project-detail':
+                for slug in Project.objects.filter(is_active=True).values_list('slug', flat=True):
+                    yield reverse(name, kwargs={'slug': slug})
+            elif not pattern.pattern.converters:
+                yield reverse(name)
+            else:
+                self.stdout.write(self.style.WARNING(f'Skipped parameterised route {name}'))
+
+    def file_for(self, path):
+        return path.strip('/') + '/index.json'
+
+    def load_manifest(self, output):
+        try:
+            return json.loads((output / MANIFEST).read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def write_variants(self, target, body):
+        self.write_file(target, body)
+        # mtime=0 keeps the .gz bytes identical across runs for unchanged content
+        self.write_file(target.with_name(target.name + '.gz'), gzip.compress(body, compresslevel=9, mtime=0))
+        if brotli is not None:
+            self.write_file(target.with_name(target.name + '.br'), brotli.compress(body, quality=11))
+
+    def write_file(self, target, data):
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + '.tmp')
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
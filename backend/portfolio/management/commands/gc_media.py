@@ -0,0 +1,26 @@
+"""
+Management command to delete media blobs that no model references
+"""
+from django.core.management.base import BaseCommand
+
+from portfolio import storage
+
+
+class Command(BaseCommand):
+    help = 'Deletes unreferenced content-addressed uploads and their image derivatives (see portfolio/storage.py)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--min-age', type=int, default=3600,
+            help='Keep files younger than this many seconds, which may belong to an upload still being saved',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='List what would be deleted')
+
+    def handle(self, *args, **options):
+        garbage = storage.collect_garbage(min_age=options['min_age'], dry_run=options['dry_run'])
+        if options['dry_run']:
+            for name in garbage:
+                self.stdout.write(name)
+            self.stdout.write(f'{len(garbage)} files would be deleted')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'✓ Deleted {len(garbage)} unreferenced files'))
@@ -0,0 +1,177 @@
+"""
+Management command to generate a synthetic portfolio dataset at a chosen scale
+"""
+import random
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from portfolio.models import (
+    SocialLink, SkillCategory, Skill, Project, Technology,
+    Education, Certification, ContactMessage
+)
+from portfolio.signals import bulk_changed
+
+PREFIX = 'bench'
+TECHNOLOGIES = [
+    'React', 'Next.js', 'TypeScript', 'JavaScript', 'Django', 'Python', 'PHP', 'Laravel',
+    'Node.js', 'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Docker', 'Tailwind CSS', 'Redux',
+    'GraphQL', 'Go', 'Rust', 'Kubernetes', 'AWS', 'Stripe', 'Socket.io', 'Vue',
+]
+WORDS = (
+    'modern scalable platform dashboard realtime secure elegant responsive analytics '
+    'commerce booking social chat payments search media upload admin mobile api'
+).split()
+
+
+class Command(BaseCommand):
+    help = 'Generates synthetic portfolio data for load tests and benchmarks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--projects', type=int, default=10000)
+        parser.add_argument('--categories', type=int, default=20)
+        parser.add_argument('--skills', type=int, default=1000)
+        parser.add_argument('--education', type=int, default=50)
+        parser.add_argument('--certifications', type=int, default=500)
+        parser.add_argument('--social-links', type=int, default=10)
+        parser.add_argument('--messages', type=int, default=100000)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--clear', action='store_true', help='Delete previously generated rows first')
+
+    def handle(self, *args, **options):
+        self.random = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+
+        if options['clear']:
+            self.clear()
+
+        self.create_social_links(options['social_links'])
+        self.create_skills(options['categories'], options['skills'])
+        self.create_projects(options['projects'])
+        self.create_education(options['education'])
+        self.create_certifications(options['certifications'])
+        self.create_messages(options['messages'])
+
+        bulk_changed(SocialLink, SkillCategory, Skill, Project, Technology, Education, Certification, ContactMessage)
+        self.stdout.write(self.style.SUCCESS('Synthetic dataset generated successfully!'))
+
+    def bulk(self, label, model, objects):
+        """Insert ``objects`` in batches, one transaction per batch"""
+        start = time.perf_counter()
+        count = 0
+        batch = []
+        for obj in objects:
+            batch.append(obj)
+            if len(batch) >= self.batch_size:
+                count += self.flush(model, batch)
+                batch = []
+        if batch:
+            count += self.flush(model, batch)
+        elapsed = time.perf_counter() - start
+        rate = count / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(f'✓ {count} {label} ({rate:,.0f} rows/s)'))
+
+    def flush(self, model, batch):
+        with transaction.atomic():
+            model.objects.bulk_create(batch)
+        return len(batch)
+
+    def words(self, count):
+        return ' '.join(self.random.choice(WORDS) for _ in range(count))
+
+    def clear(self):
+        Project.objects.filter(slug__startswith=f'{PREFIX}-').delete()
+        SkillCategory.objects.filter(name__startswith=f'{PREFIX} ').delete()
+        SocialLink.objects.filter(url__contains=f'/{PREFIX}-').delete()
+        Education.objects.filter(institution__startswith=f'{PREFIX} ').delete()
+        Certification.objects.filter(issuer__startswith=f'{PREFIX} ').delete()
+        ContactMessage.objects.filter(email__endswith=f'@{PREFIX}.example').delete()
+        self.stdout.write('Previous synthetic data cleared')
+
+    def create_social_links(self, count):
+        platforms = [choice for choice, _ in SocialLink.PLATFORM_CHOICES]
+        self.bulk('social links', SocialLink, (
+            SocialLink(platform=platforms[i % len(platforms)], url=f'https://example.com/{PREFIX}-{i}', order=i)
+            for i in range(count)
+        ))
+
+    def create_skills(self, categories, skills):
+        self.bulk('skill categories', SkillCategory, (
+            SkillCategory(name=f'{PREFIX} category {i}', order=i) for i in range(categories)
+        ))
+        category_ids = list(
+            SkillCategory.objects.filter(name__startswith=f'{PREFIX} ').values_list('id', flat=True)
+        )
+        if not category_ids:
+            return
+        self.bulk('skills', Skill, (
+            Skill(
+                name=f'{PREFIX} skill {i}',
+                category_id=category_ids[i % len(category_ids)],
+                proficiency=self.random.randint(40, 100),
+                order=i,
+                is_featured=self.random.random() < 0.1,
+            )
+            for i in range(skills)
+        ))
+
+    def create_projects(self, count):
+        now = timezone.now()
+        self.bulk('projects', Project, (
+            Project(
+                title=f'{self.words(3).title()} {i}',
+                slug=f'{PREFIX}-project-{i}',
+                short_description=self.words(12),
+                description='\n'.join(self.words(40) for _ in range(5)),
+                image='',
+                technologies=', '.join(self.random.sample(TECHNOLOGIES, self.random.randint(2, 6))),
+                is_featured=self.random.random() < 0.05,
+                is_active=self.random.random() < 0.95,
+                order=self.random.randint(0, 100),
+                created_at=now - timedelta(minutes=i),
+            )
+            for i in range(count)
+        ))
+        start = time.perf_counter()
+        Technology.sync_projects(Project.objects.filter(slug__startswith=f'{PREFIX}-').only('id', 'technologies'))
+        self.stdout.write(self.style.SUCCESS(f'✓ technology links ({time.perf_counter() - start:.1f}s)'))
+
+    def create_education(self, count):
+        self.bulk('education entries', Education, (
+            Education(
+                institution=f'{PREFIX} University {i}',
+                degree="Bachelor's Degree",
+                field_of_study=self.words(2).title(),
+                start_date=date(2000, 1, 1) + timedelta(days=self.random.randint(0, 9000)),
+                description=self.words(30),
+                order=i,
+            )
+            for i in range(count)
+        ))
+
+    def create_certifications(self, count):
+        self.bulk('certifications', Certification, (
+            Certification(
+                name=f'{self.words(2).title()} Certificate {i}',
+                issuer=f'{PREFIX} Academy {i % 25}',
+                issue_date=date(2010, 1, 1) + timedelta(days=self.random.randint(0, 5000)),
+                order=self.random.randint(0, 50),
+            )
+            for i in range(count)
+        ))
+
+    def create_messages(self, count):
+        self.bulk('contact messages', ContactMessage, (
+            ContactMessage(
+                name=f'Visitor {i}',
+                email=f'visitor{i}@{PREFIX}.example',
+                subject=self.words(5),
+                message=self.words(60),
+                is_read=self.random.random() < 0.5,
+            )
+            for i in range(count)
+        ))
@@ -0,0 +1,52 @@
+"""
+Management command to import a natural-keyed portfolio fixture with bulk upserts
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio import fixtures
+
+
+class Command(BaseCommand):
+    help = (
+        'Upserts a JSON or NDJSON fixture written by export_portfolio, matching rows on their '
+        'natural keys; safe to run again'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('input', help="Fixture file (.json, .ndjson, optionally .gz), or '-' for stdin")
+        parser.add_argument('--format', choices=fixtures.FORMATS, help='Defaults to the file extension')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows per upsert and per transaction')
+
+    def handle(self, *args, **options):
+        path = options['input']
+        fmt = options['format'] or fixtures.guess_format(path)
+        importer = fixtures.Importer(batch_size=options['batch_size'])
+        start = time.perf_counter()
+
+        try:
+            stream = fixtures.open_fixture(path, 'r')
+        except OSError as exc:
+            raise CommandError(f'Cannot open {path}: {exc}')
+        try:
+            for record in fixtures.read(stream, fmt):
+                importer.add(record)
+            counts = importer.finish()
+        except (ValueError, KeyError, TypeError) as exc:
+            # Batches already committed stay imported; running the fixture again is safe
+            raise CommandError(f'Invalid fixture {path}: {exc}')
+        finally:
+            if path != '-':
+                stream.close()
+
+        for model in fixtures.MODELS:
+            if counts[model]:
+                elapsed = importer.elapsed[model]
+                rate = counts[model] / elapsed if elapsed else 0
+                name = model._meta.verbose_name_plural
+                self.stdout.write(self.style.SUCCESS(f'✓ {counts[model]} {name} ({rate:,.0f} rows/s)'))
+        total = sum(counts.values())
+        elapsed = time.perf_counter() - start
+        rate = total / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(f'Imported {total} rows in {elapsed:.1f}s ({rate:,.0f} rows/s)'))
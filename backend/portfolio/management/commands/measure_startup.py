@@ -0,0 +1,43 @@
+"""
+Management command to measure worker cold start and memory per settings profile
+"""
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio import benchmarks
+
+
+class Command(BaseCommand):
+    help = 'Measures setup time, first-request time and RSS of fresh processes for each settings profile'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--profile', action='append', dest='profiles',
+            help='Settings module to measure (repeatable); default: config.settings and config.settings_api',
+        )
+        parser.add_argument('--path', default='/api/bundle/', help='Path of the first request')
+        parser.add_argument('--runs', type=int, default=5, help='Processes per profile; medians are reported')
+        parser.add_argument('--output', help='Write the results to this JSON file')
+
+    def handle(self, *args, **options):
+        profiles = options['profiles'] or ['config.settings', 'config.settings_api']
+        self.stdout.write(f'{"profile":<28} {"status":>6} {"process ms":>11} {"setup ms":>9} {"1st req ms":>11} {"RSS MiB":>8} {"modules":>8}')
+        results = []
+        for profile in profiles:
+            try:
+                result = benchmarks.measure_startup(profile, options['path'], options['runs'])
+            except RuntimeError as exc:
+                raise CommandError(f'{profile}: {exc}')
+            results.append(result)
+            self.stdout.write(
+                f'{profile:<28} {result["status"]:>6} {result["process_ms"]:>11} {result["setup_ms"]:>9} '
+                f'{result["first_request_ms"]:>11} {result["rss_kb"] / 1024:>8.1f} {result["modules"]:>8}'
+            )
+            if result['heavy_modules']:
+                self.stdout.write(f'    loaded: {", ".join(result["heavy_modules"])}')
+
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(results, indent=2))
+            self.stdout.write(self.style.SUCCESS(f'✓ Results written to {options["output"]}'))
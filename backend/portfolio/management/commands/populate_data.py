@@ -3,10 +3,8 @@ Management command to populate default portfolio data for Fares Essam
 """
 from django.core.management.base import BaseCommand
 from django.core.files import File
-from portfolio.models import (
-    PersonalInfo, SocialLink, SkillCategory, Skill,
-    Project, Education, Certification
-)
+from portfolio import fixtures
+from portfolio.models import PersonalInfo
 from pathlib import Path
 
 
@@ -19,18 +17,15 @@ class Command(BaseCommand):
         # Create Personal Info
         self.create_personal_info()
         
-        # Create Social Links
-        self.create_social_links()
-        
-        # Create Skills
-        self.create_skills()
-        
-        # Create Sample Projects
-        self.create_projects()
-        
-        # Create Education
-        self.create_education()
+        # Everything else goes through the fixture importer in bulk, adding
+        # only rows whose natural key is new (see portfolio/fixtures.py)
+        importer = fixtures.Importer(update=False)
+        for records in (self.social_links(), self.skills(), self.projects(), self.education()):
+            for record in records:
+                importer.add(record)
+        importer.finish()
         
+        self.stdout.write(self.style.SUCCESS('✓ Social Links, Skills, Projects and Education created'))
         self.stdout.write(self.style.SUCCESS('Default data populated successfully!'))
 
     def create_personal_info(self):
@@ -60,7 +55,7 @@ When I'm not coding, I'm exploring new technologies, contributing to open-source
         else:
             self.stdout.write('Personal Info already exists')
 
-    def create_social_links(self):
+    def social_links(self):
         links = [
             {
                 'platform': 'github',
@@ -77,14 +72,9 @@ When I'm not coding, I'm exploring new technologies, contributing to open-source
         ]
         
         for link_data in links:
-            SocialLink.objects.get_or_create(
-                platform=link_data['platform'],
-                defaults=link_data
-            )
-        
-        self.stdout.write(self.style.SUCCESS('✓ Social Links created'))
+            yield {'model': 'portfolio.sociallink', 'fields': link_data}
 
-    def create_skills(self):
+    def skills(self):
         categories = [
             {
                 'name': 'Frontend',
@@ -139,23 +129,15 @@ When I'm not coding, I'm exploring new technologies, contributing to open-source
         
         for cat_data in categories:
             skills = cat_data.pop('skills')
-            category, _ = SkillCategory.objects.get_or_create(
-                name=cat_data['name'],
-                defaults=cat_data
-            )
+            yield {'model': 'portfolio.skillcategory', 'fields': cat_data}
             
             for i, skill_data in enumerate(skills):
                 skill_data['order'] = i + 1
-                skill_data['category'] = category
-                Skill.objects.get_or_create(
-                    name=skill_data['name'],
-                    category=category,
-                    defaults=skill_data
-                )
-        
-        self.stdout.write(self.style.SUCCESS('✓ Skills created'))
+                # Foreign keys are written as the category's natural key
+                skill_data['category'] = [cat_data['name']]
+                yield {'model': 'portfolio.skill', 'fields': skill_data}
 
-    def create_projects(self):
+    def projects(self):
         projects = [
             {
                 'title': 'E-Commerce Platform',
@@ -214,14 +196,9 @@ Features:
         ]
         
         for project_data in projects:
-            Project.objects.get_or_create(
-                slug=project_data['slug'],
-                defaults=project_data
-            )
-        
-        self.stdout.write(self.style.SUCCESS('✓ Projects created'))
+            yield {'model': 'portfolio.project', 'fields': project_data}
 
-    def create_education(self):
+    def education(self):
         education_data = [
             {
                 'institution': 'Cairo University',
@@ -236,10 +213,4 @@ Features:
         ]
         
         for edu_data in education_data:
-            Education.objects.get_or_create(
-                institution=edu_data['institution'],
-                degree=edu_data['degree'],
-                defaults=edu_data
-            )
-        
-        self.stdout.write(self.style.SUCCESS('✓ Education created'))
+            yield {'model': 'portfolio.education', 'fields': edu_data}
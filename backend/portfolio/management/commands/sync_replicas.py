@@ -0,0 +1,27 @@
+"""
+Management command to copy the primary SQLite database into the read replicas
+"""
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio import sqlite, versions
+
+
+class Command(BaseCommand):
+    help = 'Refreshes the SQLite read replicas listed in PORTFOLIO_READ_DATABASES from the primary'
+
+    def handle(self, *args, **options):
+        aliases = sqlite.sqlite_replicas()
+        if not aliases:
+            raise CommandError('No SQLite read replicas configured (see PORTFOLIO_READ_DATABASES)')
+
+        start = time.perf_counter()
+        sqlite.sync_replicas(aliases)
+        # Responses may have been cached from the old copies
+        for model in apps.get_app_config('portfolio').get_models():
+            versions.bump(versions.resource_for(model))
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Copied the primary to {", ".join(aliases)} in {time.perf_counter() - start:.2f}s'
+        ))
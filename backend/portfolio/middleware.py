@@ -0,0 +1,79 @@
+"""
+Middleware for the portfolio API
+"""
+import json
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from .instrumentation import budget_for, record_queries
+
+logger = logging.getLogger('portfolio.queries')
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Record query count, DB time and repeated query shapes for every request,
+    expose them in a ``Server-Timing`` header and log one structured line per
+    request (a warning when the URL's query budget is exceeded).
+
+    Only installed while ``PORTFOLIO_QUERY_INSTRUMENTATION`` is on (None:
+    while ``DEBUG`` is), since the header shows every client database timings.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        enabled = getattr(settings, 'PORTFOLIO_QUERY_INSTRUMENTATION', None)
+        if not (settings.DEBUG if enabled is None else enabled):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        start = time.perf_counter()
+        with record_queries() as recorder:
+            response = self.get_response(request)
+        return self.report(request, response, recorder, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        # The async ORM runs queries in a worker thread that shares this
+        # request's connection objects, so the execute wrappers still apply
+        with record_queries() as recorder:
+            response = await self.get_response(request)
+        return self.report(request, response, recorder, time.perf_counter() - start)
+
+    def report(self, request, response, recorder, total):
+        db_ms = recorder.duration * 1000
+        response['Server-Timing'] = (
+            f'db;dur={db_ms:.2f};desc="{recorder.count} queries", '
+            f'total;dur={total * 1000:.2f}'
+        )
+
+        match = getattr(request, 'resolver_match', None)
+        url_name = match.url_name if match else None
+        budget = budget_for(url_name)
+        over_budget = budget is not None and request.method == 'GET' and recorder.count > budget
+        duplicates = recorder.duplicates()
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'url_name': url_name,
+            'status': response.status_code,
+            'queries': recorder.count,
+            'db_ms': round(db_ms, 2),
+            'total_ms': round(total * 1000, 2),
+            'budget': budget,
+            'duplicates': duplicates,
+        }
+        level = logging.WARNING if over_budget or duplicates else logging.INFO
+        logger.log(level, json.dumps(record), extra={'query_stats': record})
+        return response
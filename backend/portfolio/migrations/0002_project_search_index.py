@@ -0,0 +1,44 @@
+from django.db import migrations
+
+# The index as this migration creates it; portfolio/search.py queries it
+FTS_TABLE = 'portfolio_project_fts'
+COLUMNS = 'title, short_description, description, technologies'
+POSTGRES_INDEX = 'portfolio_project_search_idx'
+POSTGRES_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(technologies, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(short_description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5({COLUMNS}, tokenize='porter unicode61')"
+        )
+        schema_editor.execute(f"INSERT INTO {FTS_TABLE}(rowid, {COLUMNS}) SELECT id, {COLUMNS} FROM portfolio_project")
+    elif vendor == 'postgresql':
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {POSTGRES_INDEX} ON portfolio_project USING GIN (({POSTGRES_VECTOR}))"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    elif vendor == 'postgresql':
+        schema_editor.execute(f"DROP INDEX IF EXISTS {POSTGRES_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
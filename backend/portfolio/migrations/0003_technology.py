@@ -0,0 +1,51 @@
+# Generated by Django 6.0 on 2026-10-18 04:00
+
+from django.db import migrations, models
+
+
+def split_technologies(apps, schema_editor):
+    """Create Technology rows from every project's comma-separated list"""
+    Project = apps.get_model('portfolio', 'Project')
+    Technology = apps.get_model('portfolio', 'Technology')
+    Through = Technology.projects.through
+
+    technologies = {}
+    links = set()
+    for project_id, csv in Project.objects.values_list('id', 'technologies'):
+        for name in csv.split(','):
+            name = name.strip()
+            if not name:
+                continue
+            key = ' '.join(name.split()).lower()
+            technologies.setdefault(key, name)
+            links.add((key, project_id))
+
+    Technology.objects.bulk_create([Technology(name=name, key=key) for key, name in technologies.items()])
+    ids = dict(Technology.objects.values_list('key', 'id'))
+    Through.objects.bulk_create([
+        Through(technology_id=ids[key], project_id=project_id) for key, project_id in links
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0002_project_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Technology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('key', models.CharField(help_text='Lower-cased name used for filtering', max_length=100, unique=True)),
+                ('projects', models.ManyToManyField(blank=True, related_name='technology_tags', to='portfolio.project')),
+            ],
+            options={
+                'verbose_name_plural': 'Technologies',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.RunPython(split_technologies, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 6.0 on 2026-10-18 09:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0003_technology'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='skill',
+            name='category',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='skills', to='portfolio.skillcategory'),
+        ),
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(fields=['order', '-issue_date'], name='certification_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['-created_at'], name='contactmessage_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['-created_at'], name='contactmessage_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cv',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-uploaded_at'], name='cv_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(fields=['order', '-start_date'], name='education_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-is_featured', 'order', '-created_at'], name='project_list_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['category', 'order'], name='skill_category_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['category', 'order'], name='skill_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skillcategory',
+            index=models.Index(fields=['order'], name='skillcategory_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sociallink',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order'], name='sociallink_active_order_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+from django.db import migrations
+
+# The index as this migration creates it; portfolio/search.py queries it
+FTS_TABLE = 'portfolio_contactmessage_fts'
+TABLE = 'portfolio_contactmessage'
+COLUMNS = ('name', 'email', 'subject', 'message')
+POSTGRES_INDEX = 'portfolio_contactmessage_search_idx'
+POSTGRES_VECTOR = "to_tsvector('simple', name || ' ' || email || ' ' || subject || ' ' || message)"
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        columns = ', '.join(COLUMNS)
+        new_values = ', '.join(f'new.{column}' for column in COLUMNS)
+        old_values = ', '.join(f'old.{column}' for column in COLUMNS)
+        delete = f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old_values});"
+        insert = f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new_values});"
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+            f"USING fts5({columns}, content='{TABLE}', content_rowid='id', tokenize='unicode61')"
+        )
+        schema_editor.execute(f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {TABLE} BEGIN {insert} END")
+        schema_editor.execute(f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {TABLE} BEGIN {delete} END")
+        schema_editor.execute(
+            f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE OF {columns} ON {TABLE} BEGIN {delete} {insert} END"
+        )
+        schema_editor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    elif vendor == 'postgresql':
+        schema_editor.execute(f"CREATE INDEX IF NOT EXISTS {POSTGRES_INDEX} ON {TABLE} USING GIN (({POSTGRES_VECTOR}))")
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        for suffix in ('ai', 'ad', 'au'):
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    elif vendor == 'postgresql':
+        schema_editor.execute(f"DROP INDEX IF EXISTS {POSTGRES_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0004_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
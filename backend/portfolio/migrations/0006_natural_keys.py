@@ -0,0 +1,54 @@
+from django.core.management.base import CommandError
+from django.db import migrations, models
+from django.db.models import Count
+
+# Columns that must agree for two skills of a category with the same name to be copies of each other
+SKILL_COLUMNS = ('proficiency', 'icon', 'color', 'order', 'is_featured')
+
+
+def dedupe_skills(apps, schema_editor):
+    """
+    Delete exact copies of a category's skill so the constraint can be added,
+    keeping the oldest. Skills that share a name but differ in any other
+    column are never merged: the migration stops and lists them instead.
+    """
+    Skill = apps.get_model('portfolio', 'Skill')
+    duplicates = (
+        Skill.objects.values_list('category', 'name')
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+        .order_by('category', 'name')
+    )
+    copies, conflicts = [], []
+    for category, name, _ in duplicates:
+        rows = list(Skill.objects.filter(category=category, name=name).order_by('id').values('id', *SKILL_COLUMNS))
+        if all(row | {'id': rows[0]['id']} == rows[0] for row in rows):
+            copies.append((category, name, [row['id'] for row in rows]))
+        else:
+            conflicts.append(f'  category {category}, {name!r}: ' + '; '.join(
+                f"id {row['id']} ({', '.join(f'{column}={row[column]!r}' for column in SKILL_COLUMNS)})"
+                for row in rows
+            ))
+    if conflicts:
+        raise CommandError(
+            'Skills in the same category share a name but differ. Delete or rename all but one of each, '
+            'then run migrate again:\n' + '\n'.join(conflicts)
+        )
+    for category, name, ids in copies:
+        Skill.objects.filter(id__in=ids[1:]).delete()
+        print(f'  Removed identical copies of skill {name!r} in category {category}: ids {ids[1:]}, kept {ids[0]}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0005_contactmessage_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_skills, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='skill',
+            constraint=models.UniqueConstraint(fields=('category', 'name'), name='skill_natural_key'),
+        ),
+    ]
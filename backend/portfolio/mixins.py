@@ -0,0 +1,100 @@
+"""
+Reusable view mixins for the portfolio API
+"""
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from . import cdn, versions
+from .routers import replica_reads
+
+
+class ConditionalGetMixin:
+    """
+    Emit ETag / Last-Modified validators derived from the version registry and
+    answer matching conditional requests with 304 before the view runs.
+
+    Views list the resources (model names) their payload depends on in
+    ``version_resources``, which are also the response's surrogate keys
+    (see cdn.py) unless the view sets ``surrogate_keys``. The view itself
+    runs inside ``replica_reads()``.
+    """
+    version_resources = ()
+    surrogate_keys = None
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD') or not self.version_resources:
+            return super().dispatch(request, *args, **kwargs)
+
+        state = versions.get_versions(self.version_resources)
+        etag, last_modified = self.get_validators(request, state)
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            with replica_reads():
+                response = super().dispatch(request, *args, **kwargs)
+        return self.add_validators(response, etag, last_modified)
+
+    def get_validators(self, request, state):
+        self.version_fingerprint = versions.fingerprint(state)
+        return versions.make_etag(state, request), int(versions.last_modified(state))
+
+    def add_validators(self, response, etag, last_modified):
+        if response.status_code not in (200, 304):
+            return response
+        response.headers.setdefault('ETag', etag)
+        response.headers.setdefault('Last-Modified', http_date(last_modified))
+        patch_vary_headers(response, ['Accept'])
+        return cdn.add_cache_headers(response, self.surrogate_keys or list(self.version_resources))
+
+
+class AsyncConditionalGetMixin(ConditionalGetMixin):
+    """``ConditionalGetMixin`` for async views; versions are read through the async cache API"""
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD') or not self.version_resources:
+            return await super(ConditionalGetMixin, self).dispatch(request, *args, **kwargs)
+
+        state = await versions.aget_versions(self.version_resources)
+        etag, last_modified = self.get_validators(request, state)
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            with replica_reads():
+                response = await super(ConditionalGetMixin, self).dispatch(request, *args, **kwargs)
+        return self.add_validators(response, etag, last_modified)
+
+
+class SparseFieldsMixin:
+    """
+    ``?fields=`` / ``?exclude=`` for generic views with a ``reader``:
+    ``get_reader()`` is the reader narrowed to the request's projection, and
+    the serializer context names its fields for
+    ``serializers.SparseFieldsMixin``. Views that serialize instances pass
+    their queryset through ``get_reader().only()``.
+    """
+    reader = None
+
+    def get_reader(self):
+        return self.reader.project(self.request.query_params)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fields'] = self.get_reader().fields
+        return context
+
+
+class ReaderListMixin(SparseFieldsMixin):
+    """
+    List through a ``readers.Reader`` instead of instantiating the serializer
+    for every row. The output is identical to ``serializer_class``'s, which
+    still describes the endpoint (schema, browsable API).
+    """
+
+    def list(self, request, *args, **kwargs):
+        reader = self.get_reader()
+        queryset = reader.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(reader.build(page, request))
+        return Response(reader.build(queryset, request))
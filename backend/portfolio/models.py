@@ -53,6 +53,12 @@ class SocialLink(models.Model):
     
     class Meta:
         ordering = ['order']
+        indexes = [
+            # SocialLinkListView. Partial: the ORM writes is_active=True as a bare
+            # "WHERE is_active", which SQLite matches against an index condition
+            # but cannot use as a key column
+            models.Index(fields=['order'], condition=models.Q(is_active=True), name='sociallink_active_order_idx'),
+        ]
         verbose_name = "Social Link"
         verbose_name_plural = "Social Links"
     
@@ -68,6 +74,9 @@ class SkillCategory(models.Model):
     
     class Meta:
         ordering = ['order']
+        indexes = [
+            models.Index(fields=['order'], name='skillcategory_order_idx'),
+        ]
         verbose_name = "Skill Category"
         verbose_name_plural = "Skill Categories"
     
@@ -78,7 +87,8 @@ class SkillCategory(models.Model):
 class Skill(models.Model):
     """Individual skills with proficiency level"""
     name = models.CharField(max_length=100)
-    category = models.ForeignKey(SkillCategory, on_delete=models.CASCADE, related_name='skills')
+    # Indexed by skill_category_order_idx, which also serves category lookups
+    category = models.ForeignKey(SkillCategory, on_delete=models.CASCADE, related_name='skills', db_index=False)
     proficiency = models.IntegerField(
         validators=[MinValueValidator(0), MaxValueValidator(100)],
         default=75,
@@ -91,6 +101,16 @@ class Skill(models.Model):
     
     class Meta:
         ordering = ['category', 'order']
+        indexes = [
+            # Each category's skills in order (SkillCategoryListView's nested skills)
+            models.Index(fields=['category', 'order'], name='skill_category_order_idx'),
+            # FeaturedSkillsView
+            models.Index(fields=['category', 'order'], condition=models.Q(is_featured=True), name='skill_featured_idx'),
+        ]
+        # Natural key for fixture upserts (see fixtures.py)
+        constraints = [
+            models.UniqueConstraint(fields=['category', 'name'], name='skill_natural_key'),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.category.name})"
@@ -113,13 +133,75 @@ class Project(models.Model):
     
     class Meta:
         ordering = ['-is_featured', 'order', '-created_at']
+        indexes = [
+            # ProjectListView (and ?featured=true, which stops at the first non-featured row)
+            models.Index(
+                fields=['-is_featured', 'order', '-created_at'], condition=models.Q(is_active=True),
+                name='project_list_idx',
+            ),
+        ]
     
     def __str__(self):
         return self.title
     
     @property
     def tech_list(self):
-        return [tech.strip() for tech in self.technologies.split(',')]
+        return self.split_technologies(self.technologies)
+    
+    @staticmethod
+    def split_technologies(value):
+        return [tech.strip() for tech in value.split(',')]
+    
+    def sync_technologies(self):
+        """Mirror the comma-separated technologies into Technology rows"""
+        Technology.sync_projects([self])
+
+
+class Technology(models.Model):
+    """Technologies used by projects, normalized from Project.technologies"""
+    name = models.CharField(max_length=100)
+    key = models.CharField(max_length=100, unique=True, help_text="Lower-cased name used for filtering")
+    projects = models.ManyToManyField(Project, related_name='technology_tags', blank=True)
+    
+    class Meta:
+        ordering = ['name']
+        verbose_name_plural = "Technologies"
+    
+    def __str__(self):
+        return self.name
+    
+    @staticmethod
+    def normalize(name):
+        return ' '.join(name.split()).lower()
+    
+    @classmethod
+    def sync_projects(cls, projects, batch_size=500):
+        """Replace the technology links of ``projects`` with their parsed CSV values"""
+        projects = list(projects)
+        Through = cls.projects.through
+        for start in range(0, len(projects), batch_size):
+            wanted = {}
+            names = {}
+            for project in projects[start:start + batch_size]:
+                keys = set()
+                for name in project.tech_list:
+                    if name:
+                        key = cls.normalize(name)
+                        names.setdefault(key, name)
+                        keys.add(key)
+                wanted[project.pk] = keys
+            
+            ids = dict(cls.objects.filter(key__in=names).values_list('key', 'id'))
+            missing = [cls(name=name, key=key) for key, name in names.items() if key not in ids]
+            if missing:
+                cls.objects.bulk_create(missing, ignore_conflicts=True)
+                ids = dict(cls.objects.filter(key__in=names).values_list('key', 'id'))
+            
+            Through.objects.filter(project_id__in=wanted).delete()
+            Through.objects.bulk_create([
+                Through(project_id=pk, technology_id=ids[key])
+                for pk, keys in wanted.items() for key in keys
+            ])
 
 
 class Education(models.Model):
@@ -136,6 +218,9 @@ class Education(models.Model):
     
     class Meta:
         ordering = ['order', '-start_date']
+        indexes = [
+            models.Index(fields=['order', '-start_date'], name='education_order_idx'),
+        ]
         verbose_name_plural = "Education"
     
     def __str__(self):
@@ -155,6 +240,9 @@ class Certification(models.Model):
     
     class Meta:
         ordering = ['order', '-issue_date']
+        indexes = [
+            models.Index(fields=['order', '-issue_date'], name='certification_order_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.issuer}"
@@ -171,6 +259,10 @@ class CV(models.Model):
         verbose_name = "CV/Resume"
         verbose_name_plural = "CVs/Resumes"
         ordering = ['-uploaded_at']
+        indexes = [
+            # The active CV: newest with is_active=True
+            models.Index(fields=['-uploaded_at'], condition=models.Q(is_active=True), name='cv_active_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} ({'Active' if self.is_active else 'Inactive'})"
@@ -193,6 +285,11 @@ class ContactMessage(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], name='contactmessage_created_idx'),
+            # Unread messages, newest first (the admin's is_read filter)
+            models.Index(fields=['-created_at'], condition=models.Q(is_read=False), name='contactmessage_unread_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.subject}"
@@ -0,0 +1,202 @@
+"""
+Keyset (cursor) pagination for the portfolio API, and an estimated-count
+paginator for admin changelists
+"""
+import base64
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginate on the model's ``Meta.ordering`` tuple (plus the primary key as a
+    tie-breaker) so each page is a single indexed range query instead of an
+    OFFSET scan. Cursors are opaque base64 tokens holding the ordering values
+    of the last row on the previous page.
+
+    Pagination is opt-in: unless the client sends ``cursor`` or ``page_size``
+    the full list is returned unchanged. Ordering fields must be concrete,
+    non-null columns.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 20
+    max_page_size = 100
+    opt_in = True
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self.page_queryset(queryset, request)
+        if queryset is None:
+            return None
+        return self.set_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset, request):
+        """``paginate_queryset`` for async views; fetches the page with async iteration"""
+        queryset = self.page_queryset(queryset, request)
+        if queryset is None:
+            return None
+        return self.set_page([row async for row in queryset])
+
+    def page_queryset(self, queryset, request):
+        """The lazy queryset for the requested page (one row extra), or None when not paginating"""
+        params = request.query_params
+        if self.opt_in and self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        model = queryset.model
+        self.ordering = self.get_ordering(queryset)
+        queryset = queryset.order_by(*self.ordering)
+
+        encoded = params.get(self.cursor_query_param)
+        if encoded:
+            queryset = queryset.filter(self.after(self.decode_cursor(model, encoded)))
+
+        return queryset[:self.page_size + 1]
+
+    def set_page(self, rows):
+        self.has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        self.last_row = rows[-1] if rows else None
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_data(self, data):
+        return {
+            'next': self.get_next_link(),
+            'results': data,
+        }
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def get_ordering(self, queryset):
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+        if not any(name.lstrip('-') in ('pk', 'id') for name in ordering):
+            ordering.append('pk')
+        return ordering
+
+    def after(self, values):
+        """
+        Build ``(a > x) | (a = x & b > y) | ...`` for the ordering columns,
+        flipping the comparison for descending ones.
+        """
+        condition = Q()
+        equal = {}
+        for name, value in zip(self.ordering, values):
+            field = name.lstrip('-')
+            lookup = 'lt' if name.startswith('-') else 'gt'
+            condition |= Q(**equal, **{f'{field}__{lookup}': value})
+            equal[field] = value
+        return condition
+
+    def get_next_link(self):
+        if not self.has_next or self.last_row is None:
+            return None
+        values = [self.field_value(self.last_row, name.lstrip('-')) for name in self.ordering]
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, self.encode_cursor(values)
+        )
+
+    def field_value(self, obj, name):
+        # Rows are model instances, or dicts from readers.Reader.values()
+        value = obj[name] if isinstance(obj, dict) else getattr(obj, name)
+        return value.isoformat() if hasattr(value, 'isoformat') else value
+
+    def get_field(self, model, name):
+        return model._meta.pk if name == 'pk' else model._meta.get_field(name)
+
+    def encode_cursor(self, values):
+        return base64.urlsafe_b64encode(json.dumps(values, separators=(',', ':')).encode()).decode()
+
+    def decode_cursor(self, model, encoded):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                self.get_field(model, name.lstrip('-')).to_python(value)
+                for name, value in zip(self.ordering, values)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+
+class AlwaysKeysetPagination(KeysetPagination):
+    """Keyset pagination that applies even when the client sends no parameters"""
+    opt_in = False
+
+
+def estimated_count(queryset):
+    """
+    The database's cheap estimate of an unfiltered queryset's row count, or
+    None when there is none (filtered querysets, other databases)
+    """
+    if queryset.query.where or queryset.query.distinct or queryset.query.is_sliced:
+        return None
+    connection = connections[queryset.db]
+    table = queryset.model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            # Maintained by VACUUM / ANALYZE; -1 until the table was first analyzed
+            cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass', [table])
+        elif connection.vendor == 'sqlite':
+            # A rowid B-tree lookup; rows deleted since make it an overestimate
+            cursor.execute(f'SELECT MAX(rowid) FROM {connection.ops.quote_name(table)}')
+        elif connection.vendor == 'mysql':
+            cursor.execute(
+                'SELECT table_rows FROM information_schema.tables WHERE table_schema = DATABASE() AND table_name = %s',
+                [table],
+            )
+        else:
+            return None
+        row = cursor.fetchone()
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Admin changelist paginator that reports the database's row estimate
+    instead of running an exact ``COUNT(*)`` once the table holds more than
+    ``PORTFOLIO_ADMIN_COUNT_ESTIMATE_THRESHOLD`` rows. Filtered and searched
+    changelists are still counted exactly. Pair it with
+    ``show_full_result_count = False`` so the admin skips its second count.
+    """
+
+    @cached_property
+    def count(self):
+        threshold = getattr(settings, 'PORTFOLIO_ADMIN_COUNT_ESTIMATE_THRESHOLD', 10000)
+        estimate = estimated_count(self.object_list)
+        if estimate is not None and estimate > threshold:
+            return estimate
+        return super().count
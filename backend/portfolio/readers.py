@@ -0,0 +1,397 @@
+"""
+Fast read-only serialization for the list endpoints
+
+A ``Reader`` is compiled once from a ModelSerializer class: every field
+becomes a column for ``.values()`` plus an accessor that turns the row value
+into exactly what the serializer would output. Rows are then built as plain
+dicts without instantiating the serializer, resolving fields or calling
+``build_absolute_uri`` per object, and the rendered JSON is byte-identical to
+the serializer's.
+
+Fields that are not model columns (``SerializerMethodField``, properties,
+``get_FOO_display``) must be given in ``computed``.
+
+``Reader.project()`` applies a request's ``?fields=`` / ``?exclude=``
+sparse fieldset: the projected reader outputs only those fields and selects
+only the columns they need, through ``values()`` or ``only()``.
+"""
+import functools
+from operator import itemgetter
+from urllib.parse import urljoin
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.core.files.storage import FileSystemStorage
+from django.utils import timezone
+from django.utils.encoding import filepath_to_uri
+from rest_framework import ISO_8601, serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.settings import api_settings
+
+from . import images
+from .models import Project, SocialLink
+from .serializers import (
+    PersonalInfoSerializer, SocialLinkSerializer, SkillCategorySerializer, SkillSerializer,
+    ProjectSerializer, ProjectSearchResultSerializer, EducationSerializer,
+    CertificationSerializer, CVSerializer, ContactMessageListSerializer
+)
+
+# Field classes whose to_representation returns database values unchanged
+PASSTHROUGH_FIELDS = {
+    serializers.CharField, serializers.EmailField, serializers.URLField, serializers.SlugField,
+    serializers.IntegerField, serializers.BooleanField, serializers.ChoiceField,
+    serializers.ReadOnlyField, PrimaryKeyRelatedField,
+}
+# Distinct projections remembered per reader; past this, projected readers are built per request
+MAX_PROJECTIONS = 64
+
+
+def _field_names(params, key):
+    names = []
+    for value in params.getlist(key):
+        names.extend(name for name in (part.strip() for part in value.split(',')) if name)
+    return names
+
+
+def requested_fields(params, available):
+    """
+    The names in ``available`` that ``?fields=`` / ``?exclude=`` select, in
+    ``available`` order, or None when the request asks for all of them
+    """
+    fields, exclude = _field_names(params, 'fields'), _field_names(params, 'exclude')
+    if not fields and not exclude:
+        return None
+    unknown = [name for name in dict.fromkeys(fields + exclude) if name not in available]
+    if unknown:
+        raise ValidationError({'fields': [f'Unknown field: {name}' for name in unknown]})
+    selected = (set(fields) if fields else set(available)) - set(exclude)
+    if len(selected) == len(available):
+        return None
+    return tuple(name for name in available if name in selected)
+
+
+class ReadContext:
+    """Per-request values every row shares, computed once"""
+
+    def __init__(self, request=None):
+        self.request = request
+        self._media_bases = {}
+        self._srcset_base = None
+
+    def media_url(self, storage, name):
+        """Same result as ``request.build_absolute_uri(storage.url(name))``"""
+        # storage may be the lazy default_storage, whose __class__ is the wrapped class
+        if getattr(storage.__class__, 'url', None) is not FileSystemStorage.url:
+            url = storage.url(name)
+            return self.request.build_absolute_uri(url) if self.request else url
+        base = self._media_bases.get(storage)
+        if base is None:
+            base = storage.base_url
+            if self.request is not None:
+                base = self.request.build_absolute_uri(base)
+            self._media_bases[storage] = base
+        return urljoin(base, filepath_to_uri(name).lstrip('/'))
+
+    def srcset(self, name):
+        if self._srcset_base is None:
+            self._srcset_base = images.srcset_base(self.request)
+        return images.srcset_for_name(name, self._srcset_base)
+
+
+class Computed:
+    """Output built by ``function(value, context)`` from one column"""
+
+    def __init__(self, column, function):
+        self.column = column
+        self.function = function
+
+    def accessor(self, reader, context):
+        get, function = itemgetter(self.column), self.function
+        return lambda row: function(get(row), context)
+
+
+class MediaURL(Computed):
+    """Absolute URL of a file column, like the ``*_url`` serializer methods"""
+
+    def __init__(self, column):
+        super().__init__(column, None)
+
+    def accessor(self, reader, context):
+        get = itemgetter(self.column)
+        storage = reader.model._meta.get_field(self.column).storage
+        return lambda row: context.media_url(storage, name) if (name := get(row)) else None
+
+
+class Srcset(Computed):
+    """Derivative URLs of an image column, like the ``*_srcset`` serializer methods"""
+
+    def __init__(self, column):
+        super().__init__(column, lambda name, context: context.srcset(name) if name else None)
+
+
+class DateTime:
+    """
+    ``DateTimeField.to_representation`` with the timezone looked up once per
+    request instead of once per row; other formats use the field itself
+    """
+
+    def __init__(self, column, field):
+        self.column = column
+        self.field = field
+
+    def accessor(self, reader, context):
+        get, field = itemgetter(self.column), self.field
+        output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+        tz = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+        if output_format is None or output_format.lower() != ISO_8601 or tz is None:
+            return lambda row: None if (value := get(row)) is None else field.to_representation(value)
+
+        def to_representation(row):
+            value = get(row)
+            if not value:
+                return None
+            if timezone.is_aware(value):
+                value = value.astimezone(tz)
+            else:
+                value = field.enforce_timezone(value)
+            value = value.isoformat()
+            return value[:-6] + 'Z' if value.endswith('+00:00') else value
+        return to_representation
+
+
+class Nested:
+    """Rows of ``reader`` whose ``foreign_key`` column points at the parent row"""
+    column = 'pk'
+
+    def __init__(self, reader, foreign_key):
+        self.reader = reader
+        self.foreign_key = foreign_key
+
+    def queryset(self, rows):
+        return self.reader.model._default_manager.filter(
+            **{f'{self.foreign_key}__in': [row['pk'] for row in rows]}
+        )
+
+    def attach(self, name, rows, data, child_rows, context):
+        """Set ``name`` on each output dict to the built child rows that point at it"""
+        key = self.reader.model._meta.get_field(self.foreign_key).attname
+        children = {row['pk']: [] for row in rows}
+        for child_row, output in zip(child_rows, self.reader.build_rows(child_rows, context)):
+            children[child_row[key]].append(output)
+        for row, output in zip(rows, data):
+            output[name] = children[row['pk']]
+
+
+class Reader:
+    """Serializer output for many rows from a single ``.values()`` query"""
+
+    def __init__(self, serializer_class, computed=None, fields=None):
+        self.serializer_class = serializer_class
+        self.model = serializer_class.Meta.model
+        self.computed = computed or {}
+        # Output field names of a projection (see project()); None for every field
+        self.fields = fields
+        self._projections = {}
+
+    @functools.cached_property
+    def plan(self):
+        """``[(output key, column, converter or computed spec)]`` in serializer field order"""
+        plan = []
+        for name, field in self.serializer_class().fields.items():
+            if field.write_only or (self.fields is not None and name not in self.fields):
+                continue
+            if name in self.computed:
+                spec = self.computed[name]
+                plan.append((name, spec.column, spec))
+                continue
+            model_field = self.resolve(field.source)
+            if model_field is None or isinstance(field, serializers.SerializerMethodField):
+                raise ImproperlyConfigured(
+                    f'{self.serializer_class.__name__}.{name} is not a model column; add it to computed'
+                )
+            column = field.source.replace('.', '__')
+            if model_field.is_relation and '.' not in field.source:
+                # Select the id as category_id: a column aliased "category" would make
+                # ORDER BY category sort by the id instead of the related model's ordering
+                column = model_field.attname
+            if isinstance(field, serializers.FileField):
+                use_url = getattr(field, 'use_url', api_settings.UPLOADED_FILES_USE_URL)
+                spec = MediaURL(column) if use_url else Computed(column, lambda name, context: name or None)
+            elif type(field) is serializers.DateTimeField:
+                spec = DateTime(column, field)
+            elif type(field) in PASSTHROUGH_FIELDS:
+                spec = None
+            else:
+                spec = field.to_representation
+            plan.append((name, column, spec))
+        return plan
+
+    def resolve(self, source):
+        model, field = self.model, None
+        for part in source.split('.'):
+            if model is None:
+                return None
+            try:
+                field = model._meta.get_field(part)
+            except FieldDoesNotExist:
+                return None
+            if not field.concrete:
+                return None
+            model = field.related_model
+        return field
+
+    @functools.cached_property
+    def columns(self):
+        return list(dict.fromkeys(column for _, column, _ in self.plan))
+
+    @functools.cached_property
+    def names(self):
+        return [name for name, _, _ in self.plan]
+
+    def project(self, params):
+        """The reader for the ``?fields=`` / ``?exclude=`` projection in ``params``"""
+        fields = requested_fields(params, self.names)
+        if fields is None:
+            return self
+        reader = self._projections.get(fields)
+        if reader is None:
+            reader = Reader(self.serializer_class, self.computed, fields)
+            if len(self._projections) < MAX_PROJECTIONS:
+                self._projections[fields] = reader
+        return reader
+
+    def ordered(self, queryset):
+        """
+        Order by the queryset's ordering with ``pk`` as the final tie-breaker,
+        like KeysetPagination, so rows with equal sort keys come out in the
+        same order whatever query plan the database picks
+        """
+        ordering = list(queryset.query.order_by or self.model._meta.ordering)
+        if not any(isinstance(name, str) and name.lstrip('-') in ('pk', 'id') for name in ordering):
+            ordering.append('pk')
+        return queryset.order_by(*ordering)
+
+    def values(self, queryset):
+        """
+        ``queryset.values()`` with every column the output needs, plus the
+        ordering columns and ``pk`` so KeysetPagination can build its cursor
+        """
+        queryset = self.ordered(queryset)
+        return queryset.values(*dict.fromkeys(self.columns + self.ordering_columns(queryset) + ['pk']))
+
+    def only(self, queryset, *extra):
+        """
+        ``queryset.only()`` the model columns the output and the ordering read,
+        plus ``extra``, for views that still serialize model instances
+        """
+        concrete = {field.attname for field in self.model._meta.concrete_fields}
+        columns = [column for column in self.columns if column in concrete]
+        return queryset.only(*dict.fromkeys(columns + self.ordering_columns(queryset) + list(extra)))
+
+    def ordering_columns(self, queryset):
+        columns = []
+        for name in queryset.query.order_by or self.model._meta.ordering:
+            field = self.resolve(name.lstrip('-')) if isinstance(name, str) else None
+            if field is not None and not field.is_relation:
+                columns.append(field.name)
+        return columns
+
+    def accessors(self, context):
+        accessors = []
+        for name, column, spec in self.plan:
+            if spec is None:
+                accessor = itemgetter(column)
+            elif isinstance(spec, Nested):
+                accessor = None
+            elif isinstance(spec, (Computed, DateTime)):
+                accessor = spec.accessor(self, context)
+            else:
+                accessor = self.converter(column, spec)
+            accessors.append((name, accessor))
+        return accessors
+
+    @staticmethod
+    def converter(column, to_representation):
+        get = itemgetter(column)
+        return lambda row: None if (value := get(row)) is None else to_representation(value)
+
+    @functools.cached_property
+    def nested(self):
+        return [(name, spec) for name, _, spec in self.plan if isinstance(spec, Nested)]
+
+    def build_rows(self, rows, context):
+        accessors = self.accessors(context)
+        # Nested fields keep their position as None until Nested.attach() sets them
+        return [{name: accessor(row) if accessor else None for name, accessor in accessors} for row in rows]
+
+    def build(self, rows, request=None, context=None):
+        """Output dicts for rows fetched with ``values()``"""
+        context = context or ReadContext(request)
+        rows = list(rows)
+        data = self.build_rows(rows, context)
+        for name, spec in self.nested:
+            child_rows = list(spec.reader.values(spec.queryset(rows)))
+            spec.attach(name, rows, data, child_rows, context)
+        return data
+
+    async def abuild(self, rows, request=None, context=None):
+        """``build`` for async views; ``rows`` may be a ``values()`` queryset, iterated asynchronously"""
+        context = context or ReadContext(request)
+        if not isinstance(rows, list):
+            rows = [row async for row in rows]
+        data = self.build_rows(rows, context)
+        for name, spec in self.nested:
+            child_rows = [row async for row in spec.reader.values(spec.queryset(rows))]
+            spec.attach(name, rows, data, child_rows, context)
+        return data
+
+    def serialize(self, queryset, request=None):
+        """Same data as ``serializer_class(queryset, many=True).data``"""
+        return self.build(self.values(queryset), request)
+
+    async def aserialize(self, queryset, request=None):
+        return await self.abuild(self.values(queryset), request)
+
+
+PERSONAL_INFO = Reader(PersonalInfoSerializer, computed={
+    'profile_photo_url': MediaURL('profile_photo'),
+    'profile_photo_srcset': Srcset('profile_photo'),
+    'favicon_url': MediaURL('favicon'),
+})
+SOCIAL_LINKS = Reader(SocialLinkSerializer, computed={
+    'platform_display': Computed(
+        'platform', lambda value, context: str(_platform_labels().get(value, value))
+    ),
+})
+SKILLS = Reader(SkillSerializer)
+SKILL_CATEGORIES = Reader(SkillCategorySerializer, computed={
+    'skills': Nested(SKILLS, 'category'),
+})
+PROJECTS = Reader(ProjectSerializer, computed={
+    'image_url': MediaURL('image'),
+    'image_srcset': Srcset('image'),
+    'tech_list': Computed('technologies', lambda value, context: Project.split_technologies(value)),
+})
+EDUCATION = Reader(EducationSerializer, computed={
+    'logo_url': MediaURL('logo'),
+    'logo_srcset': Srcset('logo'),
+})
+CERTIFICATIONS = Reader(CertificationSerializer, computed={
+    'image_url': MediaURL('image'),
+    'image_srcset': Srcset('image'),
+})
+CV = Reader(CVSerializer, computed={
+    'file_url': MediaURL('file'),
+})
+CONTACT_MESSAGES = Reader(ContactMessageListSerializer)
+# Projection and columns only: search rows are model instances from search.search_projects
+PROJECT_SEARCH_RESULTS = Reader(ProjectSearchResultSerializer, computed={
+    **PROJECTS.computed,
+    'rank': Computed('search_rank', None),
+    'snippet': Computed('search_snippet', None),
+})
+
+
+@functools.cache
+def _platform_labels():
+    return dict(SocialLink._meta.get_field('platform').flatchoices)
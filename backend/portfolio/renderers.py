@@ -0,0 +1,95 @@
+"""
+Fast JSON rendering for the API
+
+``FastJSONRenderer`` is a drop-in for DRF's ``JSONRenderer`` that encodes
+with orjson, or msgspec, when installed (``PORTFOLIO_JSON_ENCODER``, 'auto'
+by default, picks the first available). Both write compact UTF-8 directly to
+bytes, several times faster than the stdlib encoder on large lists.
+
+With orjson the output is byte-identical to ``JSONRenderer``'s: datetimes,
+times, Decimals, UUIDs and lazy strings are handed to DRF's own encoder, and
+U+2028 / U+2029 are escaped the same way. msgspec writes raw datetimes with
+full microsecond precision and Decimals as exact numbers; the serializers
+already turn both into strings, so API responses are unaffected. Requests
+asking for ``indent`` go through the stdlib encoder.
+"""
+from functools import lru_cache
+
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Encoders whose output is byte-identical to JSONRenderer's
+EXACT = ('orjson', 'json')
+
+_drf_encoder = JSONEncoder()
+# Valid in JSON but not in JavaScript source; JSONRenderer escapes them
+_LINE_SEPARATOR = '\u2028'.encode()
+_PARAGRAPH_SEPARATOR = '\u2029'.encode()
+
+
+def available():
+    """Encoders that can be used in this environment, fastest first"""
+    return [
+        name for name, module in (('orjson', orjson), ('msgspec', msgspec), ('json', True))
+        if module is not None
+    ]
+
+
+def _orjson_dumps():
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def dumps(data):
+        return orjson.dumps(data, default=_drf_encoder.default, option=options)
+    return dumps
+
+
+def _msgspec_dumps():
+    encoder = msgspec.json.Encoder(enc_hook=_drf_encoder.default, decimal_format='number')
+    return encoder.encode
+
+
+def _stdlib_dumps():
+    renderer = JSONRenderer()
+    return renderer.render
+
+
+def get_dumps(name=None):
+    """``data -> bytes`` for the named encoder, or for ``PORTFOLIO_JSON_ENCODER``"""
+    return _build_dumps(name or getattr(settings, 'PORTFOLIO_JSON_ENCODER', 'auto'))
+
+
+@lru_cache(maxsize=None)
+def _build_dumps(name):
+    if name == 'auto':
+        name = available()[0]
+    if name not in available():
+        raise ValueError(f'JSON encoder {name!r} is not installed; available: {", ".join(available())}')
+    return {'orjson': _orjson_dumps, 'msgspec': _msgspec_dumps, 'json': _stdlib_dumps}[name]()
+
+
+class FastJSONRenderer(JSONRenderer):
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return self.escape(get_dumps()(data))
+
+    @staticmethod
+    def escape(ret):
+        """Escape U+2028 / U+2029 like JSONRenderer"""
+        if _LINE_SEPARATOR in ret or _PARAGRAPH_SEPARATOR in ret:
+            ret = ret.replace(_LINE_SEPARATOR, b'\\u2028').replace(_PARAGRAPH_SEPARATOR, b'\\u2029')
+        return ret
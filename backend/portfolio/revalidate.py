@@ -0,0 +1,109 @@
+"""
+On-demand revalidation webhooks for the Next.js frontend
+
+After a change is committed, the frontend paths rendered from the changed
+rows (``paths_for``) are queued on a ``dispatch.Dispatcher``, coalesced over
+``PORTFOLIO_REVALIDATE_DEBOUNCE`` seconds and POSTed as ``{"paths": [...]}``
+to ``PORTFOLIO_REVALIDATE_URL`` (frontend/src/app/api/revalidate/route.ts),
+with retries. A path with a ``[segment]`` stands for every page of that route,
+e.g. ``/projects/[slug]`` after a bulk write.
+
+Requests are signed with ``PORTFOLIO_REVALIDATE_SECRET``: the
+``X-Portfolio-Signature`` header is ``sha256=`` and the hex HMAC-SHA256 of
+``<X-Portfolio-Timestamp>.<body>``, so the frontend can reject forged and
+replayed webhooks.
+"""
+import hashlib
+import hmac
+import os
+import threading
+import time
+from functools import partial
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+
+from .dispatch import Dispatcher, encode, post_json
+
+HOME = '/'
+# Frontend paths rendered from each resource (see frontend/src/app)
+PATHS = {
+    'personalinfo': [HOME, '/about', '/contact'],
+    'sociallink': [HOME, '/about', '/contact'],
+    'cv': [HOME, '/about'],
+    'skillcategory': [HOME, '/skills'],
+    'skill': [HOME, '/skills'],
+    'project': [HOME, '/projects'],
+    'technology': [HOME, '/projects'],
+    'education': [HOME, '/education'],
+    'certification': [HOME, '/education'],
+}
+
+
+def enabled():
+    return bool(getattr(settings, 'PORTFOLIO_REVALIDATE_URL', None))
+
+
+def paths_for(resource, instance=None):
+    """Frontend paths to revalidate after a change to ``instance``, or to any row of ``resource``"""
+    paths = list(PATHS.get(resource, []))
+    if resource == 'project':
+        if instance is None:
+            paths.append('/projects/[slug]')
+        else:
+            # A renamed project's old page must stop showing it too
+            for slug in {instance.slug, getattr(instance, '_previous_slug', None)} - {None}:
+                paths.append(f'/projects/{slug}')
+    return paths
+
+
+def sign(body, timestamp, secret):
+    message = f'{timestamp}.'.encode() + body
+    return 'sha256=' + hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+def send_paths(paths):
+    body = encode({'paths': paths})
+    timestamp = str(int(time.time()))
+    post_json(
+        settings.PORTFOLIO_REVALIDATE_URL,
+        body,
+        headers={
+            'X-Portfolio-Timestamp': timestamp,
+            'X-Portfolio-Signature': sign(body, timestamp, settings.PORTFOLIO_REVALIDATE_SECRET),
+        },
+        timeout=getattr(settings, 'PORTFOLIO_REVALIDATE_TIMEOUT', 5.0),
+    )
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher():
+    """Process-wide webhook dispatcher, or None when no revalidation URL is configured"""
+    global _dispatcher
+    if not enabled():
+        return None
+    if not getattr(settings, 'PORTFOLIO_REVALIDATE_SECRET', ''):
+        raise ImproperlyConfigured('PORTFOLIO_REVALIDATE_URL needs a PORTFOLIO_REVALIDATE_SECRET to sign with')
+    with _dispatcher_lock:
+        if _dispatcher is None or _dispatcher.pid != os.getpid():
+            _dispatcher = Dispatcher(
+                send_paths,
+                name='frontend-revalidate',
+                debounce=getattr(settings, 'PORTFOLIO_REVALIDATE_DEBOUNCE', 2.0),
+            )
+    return _dispatcher
+
+
+def schedule(resource, instance=None):
+    """Revalidate the pages showing ``instance`` once the current transaction commits"""
+    schedule_paths(paths_for(resource, instance))
+
+
+def schedule_paths(paths):
+    dispatcher = get_dispatcher()
+    if dispatcher is not None and paths:
+        transaction.on_commit(partial(dispatcher.add, paths))
@@ -0,0 +1,59 @@
+"""
+Database routing between the primary and read replicas
+
+``PORTFOLIO_READ_DATABASES`` lists the aliases in ``DATABASES`` that serve
+reads. Only code running inside ``replica_reads()`` - the public read views,
+through ConditionalGetMixin - reads portfolio content from a replica; admin
+pages, contact messages, sessions and every write stay on ``default``, so a
+write is never followed by a read of an older copy in the same request.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+PRIMARY = 'default'
+
+# Alias chosen for the current request, so all of its queries see the same copy
+_read_alias = ContextVar('portfolio_read_alias', default=None)
+
+
+def read_aliases():
+    return list(getattr(settings, 'PORTFOLIO_READ_DATABASES', []))
+
+
+@contextmanager
+def replica_reads():
+    """Send portfolio reads made in this context to one randomly chosen read alias"""
+    aliases = read_aliases()
+    token = _read_alias.set(random.choice(aliases) if aliases else None)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+class ReadReplicaRouter:
+    # Never read from a replica: contact messages are written by visitors and
+    # listed by staff, who expect to see them immediately
+    primary_only = {'contactmessage'}
+
+    def db_for_read(self, model, **hints):
+        alias = _read_alias.get()
+        if alias and model._meta.app_label == 'portfolio' and model._meta.model_name not in self.primary_only:
+            return alias
+        return PRIMARY
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas are copies of the primary (see sqlite.sync_replicas), never migrated directly
+        if db in read_aliases():
+            return False
+        return None
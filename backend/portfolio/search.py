@@ -0,0 +1,198 @@
+"""
+Full-text search over projects and contact messages
+
+SQLite uses an FTS5 virtual table keyed by project id; PostgreSQL uses a GIN
+index over a tsvector expression. Both are created by migration 0002 and kept
+in sync from the post_save / post_delete signals. Other databases fall back to
+unranked ``icontains`` matching.
+
+Contact messages (migration 0005) are indexed the same way, except that the
+FTS5 table is an external-content table kept in sync by triggers: messages
+are also inserted with bulk_create by the ingest buffer, which sends no
+signals. ``match()`` narrows a queryset of either model through its index,
+for admin search.
+"""
+import re
+
+from django.db import connections, router
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape
+
+from .models import Project, ContactMessage
+
+FTS_TABLE = 'portfolio_project_fts'
+SEARCH_COLUMNS = ('title', 'short_description', 'description', 'technologies')
+# bm25 weights for SEARCH_COLUMNS, in the same order
+FTS_WEIGHTS = (10.0, 5.0, 1.0, 3.0)
+# The expressions migrations 0002 and 0005 index; PostgreSQL only uses the index for the same expression
+POSTGRES_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(technologies, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(short_description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+MESSAGE_FTS_TABLE = 'portfolio_contactmessage_fts'
+# 'simple': names and e-mail addresses should not be stemmed
+POSTGRES_MESSAGE_VECTOR = (
+    "to_tsvector('simple', name || ' ' || email || ' ' || subject || ' ' || message)"
+)
+
+# Model -> (FTS5 table, PostgreSQL text search configuration, tsvector expression)
+FULL_TEXT_INDEXES = {
+    Project: (FTS_TABLE, 'english', POSTGRES_VECTOR),
+    ContactMessage: (MESSAGE_FTS_TABLE, 'simple', POSTGRES_MESSAGE_VECTOR),
+}
+
+# Snippet markers are control characters so the text can be HTML-escaped
+# before they are turned into <mark> tags.
+_START, _STOP = '\x02', '\x03'
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def _connection(write=False):
+    alias = router.db_for_write(Project) if write else router.db_for_read(Project)
+    return connections[alias]
+
+
+def query_terms(query):
+    """Split free text into search terms, dropping FTS operators and punctuation"""
+    return _TOKEN_RE.findall(query.lower())[:16]
+
+
+def highlight(snippet):
+    return escape(snippet).replace(_START, '<mark>').replace(_STOP, '</mark>')
+
+
+def fts5_query(terms):
+    """Every term as a quoted prefix query, so partial words match as you type"""
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def tsquery(terms):
+    return ' & '.join(f'{term}:*' for term in terms)
+
+
+def match(queryset, query):
+    """
+    ``queryset`` (of a model in FULL_TEXT_INDEXES) narrowed to the rows whose
+    indexed text matches every term of ``query``, or None when the database
+    has no full-text index
+    """
+    terms = query_terms(query)
+    if not terms:
+        return queryset
+    table, config, vector = FULL_TEXT_INDEXES[queryset.model]
+    vendor = connections[queryset.db].vendor
+    if vendor == 'sqlite':
+        return queryset.filter(pk__in=RawSQL(f"SELECT rowid FROM {table} WHERE {table} MATCH %s", [fts5_query(terms)]))
+    if vendor == 'postgresql':
+        condition = RawSQL(f"({vector}) @@ to_tsquery('{config}', %s)", [tsquery(terms)], output_field=BooleanField())
+        return queryset.filter(condition)
+    return None
+
+
+def rebuild_index():
+    """Re-index every project, e.g. after rows were written with bulk_create"""
+    connection = _connection(write=True)
+    if connection.vendor != 'sqlite':
+        return
+    columns = ', '.join(SEARCH_COLUMNS)
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(f"INSERT INTO {FTS_TABLE}(rowid, {columns}) SELECT id, {columns} FROM portfolio_project")
+
+
+def index_project(project):
+    """Insert or refresh one project's row in the FTS5 table"""
+    connection = _connection(write=True)
+    if connection.vendor != 'sqlite':
+        # The PostgreSQL index is an expression index and maintains itself
+        return
+    columns = ', '.join(SEARCH_COLUMNS)
+    placeholders = ', '.join(['%s'] * (len(SEARCH_COLUMNS) + 1))
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [project.pk])
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES ({placeholders})",
+            [project.pk] + [getattr(project, column) for column in SEARCH_COLUMNS],
+        )
+
+
+def remove_project(pk):
+    connection = _connection(write=True)
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [pk])
+
+
+def parse_limit(value, default=20, maximum=50):
+    """``?limit=`` clamped to ``1..maximum``, or ``default`` when it is missing or not a number"""
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(min(limit, maximum), 1)
+
+
+def search_projects(query, limit=20, queryset=None):
+    """
+    Return active projects matching ``query`` best-first. Each project has
+    ``search_rank`` and ``search_snippet`` (HTML with <mark> highlights) set.
+    The projects are loaded from ``queryset`` (e.g. narrowed with ``only()``).
+    """
+    queryset = Project.objects.all() if queryset is None else queryset
+    terms = query_terms(query)
+    if not terms:
+        return []
+
+    connection = _connection()
+    if connection.vendor == 'sqlite':
+        weights = ', '.join(map(str, FTS_WEIGHTS))
+        sql = (
+            f"SELECT {FTS_TABLE}.rowid, -bm25({FTS_TABLE}, {weights}), "
+            f"snippet({FTS_TABLE}, -1, %s, %s, '…', 16) "
+            f"FROM {FTS_TABLE} JOIN portfolio_project p ON p.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH %s AND p.is_active "
+            f"ORDER BY bm25({FTS_TABLE}, {weights}) LIMIT %s"
+        )
+        params = [_START, _STOP, fts5_query(terms), limit]
+    elif connection.vendor == 'postgresql':
+        sql = (
+            f"SELECT id, ts_rank_cd({POSTGRES_VECTOR}, q), "
+            f"ts_headline('english', short_description || ' ' || description, q, %s) "
+            f"FROM portfolio_project, to_tsquery('english', %s) q "
+            f"WHERE is_active AND ({POSTGRES_VECTOR}) @@ q "
+            f"ORDER BY 2 DESC LIMIT %s"
+        )
+        params = [
+            f'StartSel={_START}, StopSel={_STOP}, MaxWords=30, MinWords=10',
+            tsquery(terms),
+            limit,
+        ]
+    else:
+        condition = Q()
+        for term in terms:
+            condition &= Q(title__icontains=term) | Q(short_description__icontains=term) | \
+                Q(description__icontains=term) | Q(technologies__icontains=term)
+        projects = list(queryset.filter(condition, is_active=True)[:limit])
+        for project in projects:
+            project.search_rank = 0.0
+            project.search_snippet = escape(project.short_description)
+        return projects
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        hits = cursor.fetchall()
+
+    projects = queryset.in_bulk([pk for pk, _, _ in hits])
+    results = []
+    for pk, rank, snippet in hits:
+        project = projects.get(pk)
+        if project is not None:
+            project.search_rank = float(rank)
+            project.search_snippet = highlight(snippet)
+            results.append(project)
+    return results
@@ -1,10 +1,27 @@
 from rest_framework import serializers
+from . import images
 from .models import (
     PersonalInfo, SocialLink, SkillCategory, Skill,
     Project, Education, Certification, CV, ContactMessage
 )
 
 
+class SparseFieldsMixin:
+    """
+    Output only the fields named in ``context['fields']`` (a projection from
+    ``readers.Reader.project``). Nested serializers share the root's context,
+    so only the top-level serializer is narrowed.
+    """
+    
+    def get_fields(self):
+        fields = super().get_fields()
+        selected = self.context.get('fields')
+        parent = self.parent.parent if isinstance(self.parent, serializers.ListSerializer) else self.parent
+        if selected is not None and parent is None:
+            fields = {name: field for name, field in fields.items() if name in selected}
+        return fields
+
+
 class SocialLinkSerializer(serializers.ModelSerializer):
     platform_display = serializers.CharField(source='get_platform_display', read_only=True)
     
@@ -13,8 +30,9 @@ class SocialLinkSerializer(serializers.ModelSerializer):
         fields = ['id', 'platform', 'platform_display', 'url', 'icon', 'order']
 
 
-class PersonalInfoSerializer(serializers.ModelSerializer):
+class PersonalInfoSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     profile_photo_url = serializers.SerializerMethodField()
+    profile_photo_srcset = serializers.SerializerMethodField()
     favicon_url = serializers.SerializerMethodField()
     
     class Meta:
@@ -22,7 +40,8 @@ class PersonalInfoSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'name', 'title', 'email', 'phone', 'location',
             'bio', 'about_text', 'resume_headline',
-            'profile_photo', 'profile_photo_url', 'favicon', 'favicon_url'
+            'profile_photo', 'profile_photo_url', 'profile_photo_srcset',
+            'favicon', 'favicon_url'
         ]
     
     def get_profile_photo_url(self, obj):
@@ -33,6 +52,9 @@ class PersonalInfoSerializer(serializers.ModelSerializer):
             return obj.profile_photo.url
         return None
     
+    def get_profile_photo_srcset(self, obj):
+        return images.srcset(obj.profile_photo, self.context.get('request'))
+    
     def get_favicon_url(self, obj):
         if obj.favicon:
             request = self.context.get('request')
@@ -58,15 +80,16 @@ class SkillCategorySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'icon', 'order', 'skills']
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
     tech_list = serializers.ReadOnlyField()
     
     class Meta:
         model = Project
         fields = [
             'id', 'title', 'slug', 'short_description', 'description',
-            'image', 'image_url', 'technologies', 'tech_list',
+            'image', 'image_url', 'image_srcset', 'technologies', 'tech_list',
             'live_url', 'github_url', 'is_featured', 'created_at'
         ]
     
@@ -77,17 +100,29 @@ class ProjectSerializer(serializers.ModelSerializer):
                 return request.build_absolute_uri(obj.image.url)
             return obj.image.url
         return None
+    
+    def get_image_srcset(self, obj):
+        return images.srcset(obj.image, self.context.get('request'))
+
+
+class ProjectSearchResultSerializer(ProjectSerializer):
+    rank = serializers.FloatField(source='search_rank', read_only=True)
+    snippet = serializers.CharField(source='search_snippet', read_only=True)
+    
+    class Meta(ProjectSerializer.Meta):
+        fields = ProjectSerializer.Meta.fields + ['rank', 'snippet']
 
 
 class EducationSerializer(serializers.ModelSerializer):
     logo_url = serializers.SerializerMethodField()
+    logo_srcset = serializers.SerializerMethodField()
     
     class Meta:
         model = Education
         fields = [
             'id', 'institution', 'degree', 'field_of_study',
             'start_date', 'end_date', 'is_current', 'description',
-            'logo', 'logo_url'
+            'logo', 'logo_url', 'logo_srcset'
         ]
     
     def get_logo_url(self, obj):
@@ -97,16 +132,20 @@ class EducationSerializer(serializers.ModelSerializer):
                 return request.build_absolute_uri(obj.logo.url)
             return obj.logo.url
         return None
+    
+    def get_logo_srcset(self, obj):
+        return images.srcset(obj.logo, self.context.get('request'))
 
 
 class CertificationSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
     
     class Meta:
         model = Certification
         fields = [
             'id', 'name', 'issuer', 'issue_date', 'expiry_date',
-            'credential_id', 'credential_url', 'image', 'image_url'
+            'credential_id', 'credential_url', 'image', 'image_url', 'image_srcset'
         ]
     
     def get_image_url(self, obj):
@@ -116,9 +155,12 @@ class CertificationSerializer(serializers.ModelSerializer):
                 return request.build_absolute_uri(obj.image.url)
             return obj.image.url
         return None
+    
+    def get_image_srcset(self, obj):
+        return images.srcset(obj.image, self.context.get('request'))
 
 
-class CVSerializer(serializers.ModelSerializer):
+class CVSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     file_url = serializers.SerializerMethodField()
     
     class Meta:
@@ -145,3 +187,10 @@ class ContactMessageSerializer(serializers.ModelSerializer):
             'subject': {'required': True},
             'message': {'required': True},
         }
+
+
+class ContactMessageListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+
+    class Meta:
+        model = ContactMessage
+        fields = ['id', 'name', 'email', 'subject', 'message', 'is_read', 'created_at']
@@ -0,0 +1,77 @@
+"""
+Signal handlers that keep derived caches in sync with portfolio content
+"""
+from django.db import models
+from django.db.backends.signals import connection_created
+from django.db.models.signals import pre_save, post_save, post_delete
+
+from . import cdn, events, images, revalidate, routers, search, snapshot, sqlite, versions
+from .models import Project
+
+
+def content_changed(sender, instance=None, **kwargs):
+    """After a save or delete: bump the sender's version, drop cached payloads, tell subscribers, CDN and frontend"""
+    resource = versions.resource_for(sender)
+    version = versions.bump(resource)
+    pk = instance.pk if instance is not None else None
+    if resource in snapshot.RESOURCES:
+        snapshot.invalidate()
+    if resource not in routers.ReadReplicaRouter.primary_only and sqlite.syncing():
+        # Announced once the replicas hold the change
+        sqlite.schedule_sync(resource, pk, revalidate.paths_for(resource, instance))
+        return
+    events.publish(resource, pk, version)
+    cdn.purge(resource, pk)
+    revalidate.schedule(resource, instance)
+
+
+def bulk_changed(*model_classes):
+    """
+    Do the work the per-row handlers would have done after rows were written
+    with bulk_create / update / delete, which send no signals
+    """
+    for model in model_classes:
+        content_changed(model)
+        if model is Project:
+            search.rebuild_index()
+
+
+def image_saved(sender, instance, raw=False, **kwargs):
+    """Queue responsive variants for every image attached to the instance"""
+    if raw:
+        return
+    for field in sender._meta.concrete_fields:
+        if isinstance(field, models.ImageField):
+            field_file = getattr(instance, field.attname)
+            if field_file:
+                images.schedule(field_file.name)
+
+
+def project_saving(sender, instance, raw=False, **kwargs):
+    """Remember the slug a project is renamed from; its frontend page is revalidated too"""
+    if not raw and instance.pk and revalidate.enabled():
+        instance._previous_slug = Project.objects.filter(pk=instance.pk).values_list('slug', flat=True).first()
+
+
+def project_saved(sender, instance, raw=False, **kwargs):
+    """Refresh the project's full-text index row and technology tags in the same transaction"""
+    if not raw:
+        search.index_project(instance)
+        instance.sync_technologies()
+
+
+def project_deleted(sender, instance, **kwargs):
+    search.remove_project(instance.pk)
+
+
+def connect(app_config):
+    connection_created.connect(sqlite.apply_pragmas, dispatch_uid='portfolio_sqlite_pragmas')
+    for model in app_config.get_models():
+        post_save.connect(content_changed, sender=model, dispatch_uid=f'content_changed_save_{model.__name__}')
+        post_delete.connect(content_changed, sender=model, dispatch_uid=f'content_changed_delete_{model.__name__}')
+        if any(isinstance(field, models.ImageField) for field in model._meta.concrete_fields):
+            post_save.connect(image_saved, sender=model, dispatch_uid=f'image_saved_{model.__name__}')
+
+    pre_save.connect(project_saving, sender=Project, dispatch_uid='project_revalidate_rename')
+    post_save.connect(project_saved, sender=Project, dispatch_uid='project_search_save')
+    post_delete.connect(project_deleted, sender=Project, dispatch_uid='project_search_delete')
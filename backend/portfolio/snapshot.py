@@ -0,0 +1,97 @@
+"""
+In-memory snapshot of the public portfolio payloads served by the bundle endpoint
+"""
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+
+from . import readers
+from .models import (
+    PersonalInfo, SocialLink, SkillCategory, Skill,
+    Project, Education, Certification, CV
+)
+from .renderers import FastJSONRenderer
+from .serializers import PersonalInfoSerializer, CVSerializer
+
+# Resources (see versions.py) the bundle is built from
+RESOURCES = (
+    'personalinfo', 'sociallink', 'skillcategory', 'skill',
+    'project', 'education', 'certification', 'cv',
+)
+
+# Payloads in the bundle, in order; ?fields= / ?exclude= pick among them
+SECTIONS = (
+    'personal_info', 'social_links', 'skill_categories', 'featured_skills',
+    'projects', 'education', 'certifications', 'cv',
+)
+
+_lock = threading.Lock()
+# Rendered bundles keyed by the absolute base URL they were built for, since
+# the serializers embed absolute media URLs, and by the sections requested
+# (None for all). Each entry remembers the version fingerprint it was built
+# from so changes made by other workers are noticed. The base URL comes from
+# the Host header, so only the PORTFOLIO_BUNDLE_SNAPSHOTS most recently used
+# bundles are kept.
+_snapshots = OrderedDict()
+
+
+def invalidate():
+    """Drop every cached bundle; called whenever a portfolio model changes"""
+    with _lock:
+        _snapshots.clear()
+
+
+def build_bundle(request, sections=None):
+    """Serialize every payload the home page needs (or only ``sections``) into a single dict"""
+    context = {'request': request}
+
+    def personal_info():
+        info = PersonalInfo.objects.first()
+        return PersonalInfoSerializer(info, context=context).data if info else None
+
+    def cv():
+        cv = CV.objects.filter(is_active=True).first()
+        return CVSerializer(cv, context=context).data if cv and cv.file else None
+
+    builders = {
+        'personal_info': personal_info,
+        'social_links': lambda: readers.SOCIAL_LINKS.serialize(SocialLink.objects.filter(is_active=True), request),
+        'skill_categories': lambda: readers.SKILL_CATEGORIES.serialize(SkillCategory.objects.all(), request),
+        'featured_skills': lambda: readers.SKILLS.serialize(Skill.objects.filter(is_featured=True), request),
+        'projects': lambda: readers.PROJECTS.serialize(Project.objects.filter(is_active=True), request),
+        'education': lambda: readers.EDUCATION.serialize(Education.objects.all(), request),
+        'certifications': lambda: readers.CERTIFICATIONS.serialize(Certification.objects.all(), request),
+        'cv': cv,
+    }
+    return {name: builders[name]() for name in (SECTIONS if sections is None else sections)}
+
+
+def get_bundle(request, fingerprint, sections=None):
+    """
+    Return the rendered JSON bundle for this request's host, building it when
+    the cached copy is missing or was built from other resource versions
+    """
+    rendered = cached_bundle(request, fingerprint, sections)
+    if rendered is not None:
+        return rendered
+
+    rendered = FastJSONRenderer().render(build_bundle(request, sections))
+    key = request.build_absolute_uri('/'), sections
+    with _lock:
+        _snapshots[key] = (fingerprint, rendered)
+        _snapshots.move_to_end(key)
+        while len(_snapshots) > getattr(settings, 'PORTFOLIO_BUNDLE_SNAPSHOTS', 8):
+            _snapshots.popitem(last=False)
+    return rendered
+
+
+def cached_bundle(request, fingerprint, sections=None):
+    """The rendered bundle if one built from ``fingerprint`` is cached, else None"""
+    key = request.build_absolute_uri('/'), sections
+    with _lock:
+        cached = _snapshots.get(key)
+        if cached is None or cached[0] != fingerprint:
+            return None
+        _snapshots.move_to_end(key)
+    return cached[1]
@@ -0,0 +1,173 @@
+"""
+SQLite tuning and file-copy read replicas
+
+``apply_pragmas`` runs on every new SQLite connection (connection_created)
+and applies ``DEFAULT_PRAGMAS``, or ``PORTFOLIO_SQLITE_PRAGMAS`` when set:
+WAL lets readers and the writer work concurrently, and the other pragmas
+trade a little durability and memory for fewer fsyncs and disk reads. Read
+aliases are opened with ``query_only`` on.
+
+When the read aliases are SQLite files, ``sync_replicas`` refreshes them with
+an online backup of the primary. The copy is taken into memory first and
+the tables the replicas never serve (contact messages and their search
+index, users, sessions, ...) are emptied there, so visitor messages and
+password hashes never reach a replica file.
+
+With ``PORTFOLIO_SYNC_SQLITE_REPLICAS`` on (off by default), every committed
+content change is queued on a ``dispatch.Dispatcher``, so a burst of saves is
+copied once, ``PORTFOLIO_SQLITE_SYNC_DEBOUNCE`` seconds after the last one,
+from a background thread rather than the request. Subscribers, the CDN and
+the frontend are told about such a change only after the copy
+(``_sync_and_announce``); the changed resources' versions are bumped again
+there, so a response cached from a replica before the copy is never reused.
+"""
+import logging
+import os
+import sqlite3
+import threading
+from functools import partial
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connections, transaction
+
+from . import cdn, events, revalidate, routers, search, snapshot, versions
+from .dispatch import Dispatcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64 * 1024,  # negative: KiB rather than pages
+}
+
+_sync_lock = threading.Lock()
+
+
+def apply_pragmas(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite' or connection.is_in_memory_db():
+        return
+    pragmas = getattr(settings, 'PORTFOLIO_SQLITE_PRAGMAS', DEFAULT_PRAGMAS)
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
+        if connection.alias in routers.read_aliases():
+            cursor.execute('PRAGMA query_only = ON')
+
+
+def sqlite_replicas():
+    """Read aliases that are SQLite files distinct from the primary"""
+    primary = connections[routers.PRIMARY].settings_dict
+    if primary['ENGINE'] != 'django.db.backends.sqlite3':
+        return []
+    return [
+        alias for alias in routers.read_aliases()
+        if connections[alias].settings_dict['ENGINE'] == primary['ENGINE']
+        and str(connections[alias].settings_dict['NAME']) != str(primary['NAME'])
+    ]
+
+
+def private_tables():
+    """Tables the read replicas never serve, emptied from every copy"""
+    tables = {search.MESSAGE_FTS_TABLE}
+    for model in apps.get_models(include_auto_created=True):
+        if model._meta.app_label != 'portfolio' or model._meta.model_name in routers.ReadReplicaRouter.primary_only:
+            tables.add(model._meta.db_table)
+    return tables
+
+
+def copy_database(source_path, target_paths):
+    """Back up ``source_path`` into every file of ``target_paths``, without the private tables"""
+    copy = sqlite3.connect(':memory:')
+    try:
+        source = sqlite3.connect(source_path)
+        try:
+            # Online backup: a consistent snapshot, even while the primary is being written
+            source.backup(copy)
+        finally:
+            source.close()
+        existing = {name for (name,) in copy.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        # Overwrite deleted rows instead of leaving them in free pages
+        copy.execute('PRAGMA secure_delete = ON')
+        for table in sorted(private_tables() & existing):
+            if table == search.MESSAGE_FTS_TABLE:
+                # External-content index: rebuilt from the emptied table
+                continue
+            copy.execute(f'DELETE FROM "{table}"')
+        if search.MESSAGE_FTS_TABLE in existing:
+            copy.execute(f"INSERT INTO {search.MESSAGE_FTS_TABLE}({search.MESSAGE_FTS_TABLE}) VALUES ('rebuild')")
+        copy.commit()
+        for path in target_paths:
+            target = sqlite3.connect(path)
+            try:
+                copy.backup(target, pages=1024)
+            finally:
+                target.close()
+    finally:
+        copy.close()
+
+
+def sync_replicas(aliases=None):
+    """Copy the primary database into every SQLite read replica"""
+    aliases = sqlite_replicas() if aliases is None else aliases
+    if not aliases:
+        return []
+    with _sync_lock:
+        copy_database(
+            connections[routers.PRIMARY].settings_dict['NAME'],
+            [connections[alias].settings_dict['NAME'] for alias in aliases],
+        )
+    return aliases
+
+
+def syncing():
+    """Whether content changes are copied to the SQLite replicas, and announced after the copy"""
+    return getattr(settings, 'PORTFOLIO_SYNC_SQLITE_REPLICAS', False) and bool(sqlite_replicas())
+
+
+_syncer = None
+_syncer_lock = threading.Lock()
+
+
+def get_syncer():
+    """Process-wide replica sync dispatcher, or None when replicas are not synced"""
+    global _syncer
+    if not syncing():
+        return None
+    with _syncer_lock:
+        if _syncer is None or _syncer.pid != os.getpid():
+            _syncer = Dispatcher(
+                _sync_and_announce,
+                name='sqlite-replica-sync',
+                debounce=getattr(settings, 'PORTFOLIO_SQLITE_SYNC_DEBOUNCE', 1.0),
+                # One copy covers every pending change
+                batch_size=100_000,
+            )
+    return _syncer
+
+
+def schedule_sync(resource, pk=None, paths=()):
+    """
+    Refresh the replicas once the current transaction commits, then announce
+    the change to ``resource`` (``pk``) and revalidate the frontend ``paths``
+    """
+    syncer = get_syncer()
+    if syncer is not None:
+        transaction.on_commit(partial(syncer.add, [(resource, pk, tuple(paths))]), using=routers.PRIMARY)
+
+
+def _sync_and_announce(changes):
+    # Raising leaves the changes to the dispatcher's retries
+    sync_replicas()
+    bumped = {}
+    for resource, pk, paths in changes:
+        if resource not in bumped:
+            # Clients and caches that refetched from a replica before the copy refetch again
+            bumped[resource] = versions.bump(resource)
+            if resource in snapshot.RESOURCES:
+                snapshot.invalidate()
+        events.publish(resource, pk, bumped[resource])
+        cdn.purge(resource, pk)
+        revalidate.schedule_paths(list(paths))
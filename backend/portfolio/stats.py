@@ -0,0 +1,96 @@
+"""
+Aggregate statistics over skills and projects for the stats endpoint
+
+Every figure is computed by the database with annotate / aggregate: one
+grouped query per statistic, no model instances. The result is memoized in
+the default cache together with the version fingerprint of ``RESOURCES`` it
+was built from, so it is rebuilt only after a skill or project changes.
+"""
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db.models import Avg, Count, F, Max, Min, Q, Value
+from django.db.models.functions import ExtractYear, Least, Round
+
+from .models import SkillCategory, Skill, Project, Technology
+
+# Resources (see versions.py) the statistics are built from
+RESOURCES = ('skill', 'skillcategory', 'project', 'technology')
+
+CACHE_KEY = 'portfolio:stats'
+# Proficiency histogram: 0-9, 10-19, ..., 90-100
+BUCKET_SIZE = 10
+BUCKETS = 10
+
+
+def build_stats():
+    skills = Skill.objects.aggregate(
+        count=Count('id'),
+        average_proficiency=Round(Avg('proficiency'), 1),
+    )
+
+    categories = list(
+        SkillCategory.objects.order_by('order', 'pk').annotate(
+            skill_count=Count('skills'),
+            average_proficiency=Round(Avg('skills__proficiency'), 1),
+            min_proficiency=Min('skills__proficiency'),
+            max_proficiency=Max('skills__proficiency'),
+        ).values(
+            'id', 'name', 'skill_count', 'average_proficiency', 'min_proficiency', 'max_proficiency'
+        )
+    )
+
+    # Integer division puts 100 in a bucket of its own; Least folds it into the last one
+    counts = dict(
+        Skill.objects.order_by()
+        .annotate(bucket=Least(F('proficiency') / BUCKET_SIZE, Value(BUCKETS - 1)))
+        .values_list('bucket')
+        .annotate(count=Count('id'))
+    )
+    histogram = [
+        {
+            'min': bucket * BUCKET_SIZE,
+            'max': 100 if bucket == BUCKETS - 1 else (bucket + 1) * BUCKET_SIZE - 1,
+            'count': counts.get(bucket, 0),
+        }
+        for bucket in range(BUCKETS)
+    ]
+
+    technologies = list(
+        Technology.objects.annotate(project_count=Count('projects', filter=Q(projects__is_active=True)))
+        .filter(project_count__gt=0)
+        .order_by('-project_count', 'name')
+        .values('name', 'key', 'project_count')
+    )
+
+    projects = Project.objects.filter(is_active=True)
+    per_year = list(
+        projects.order_by()
+        .annotate(year=ExtractYear('created_at'))
+        .values('year')
+        .annotate(count=Count('id'))
+        .order_by('year')
+    )
+
+    return {
+        'skills': {**skills, 'proficiency_histogram': histogram},
+        'skill_categories': categories,
+        'technologies': technologies,
+        'projects': {'count': sum(row['count'] for row in per_year), 'per_year': per_year},
+    }
+
+
+def get_stats(fingerprint):
+    """The statistics for the resource versions in ``fingerprint``, built once per change"""
+    cached = cache.get(CACHE_KEY)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    data = build_stats()
+    cache.set(CACHE_KEY, (fingerprint, data), None)
+    return data
+
+
+async def aget_stats(fingerprint):
+    cached = await cache.aget(CACHE_KEY)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    return await sync_to_async(get_stats)(fingerprint)
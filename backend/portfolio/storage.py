@@ -0,0 +1,150 @@
+"""
+Content-addressed media storage
+
+``ContentAddressedStorage`` stores every upload as
+``<upload_to>/<sha256 of the content><extension>``: uploading the same bytes
+twice, from any model, stores them once, and the file behind a name never
+changes, so ``MediaFileView`` can serve it as immutable. Blobs are written to
+a temporary name and renamed into place, so concurrent identical uploads are
+harmless and a reader never sees a partial file.
+
+Image derivatives (``images.DERIVATIVE_ROOT``) keep the names ``images.py``
+gives them; they are keyed by their source's content-addressed name and
+written the same way, with ``replace``.
+
+Since blobs are shared, deleting or replacing a file never deletes the blob;
+``collect_garbage`` (``manage.py gc_media``) removes the ones no row
+references any more, with their derivatives, once they are older than a
+grace period. Saving content that is already stored touches its blob, so a
+re-upload of an orphan is never collected before its row is committed.
+"""
+import hashlib
+import os
+import re
+import time
+import uuid
+
+from django.apps import apps
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.db import models
+
+from . import images
+
+_DIGEST_RE = re.compile(r'^[0-9a-f]{64}$')
+_EXTENSION_RE = re.compile(r'^\.[a-z0-9]{1,10}$')
+_PRESERVED = (images.DERIVATIVE_ROOT + '/',)
+_TEMPORARY_SUFFIX = '.tmp'
+
+
+def digest_of(name):
+    """SHA-256 hex digest a content-addressed name was stored under, or None"""
+    stem = os.path.splitext(os.path.basename(name))[0]
+    return stem if _DIGEST_RE.match(stem) else None
+
+
+def content_digest(content):
+    digest = hashlib.sha256()
+    for chunk in content.chunks():
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hashed_name(name, digest):
+    """``name`` with its file name replaced by ``digest``, keeping the directory and extension"""
+    directory, basename = os.path.split(name)
+    extension = os.path.splitext(basename)[1].lower()
+    if not _EXTENSION_RE.match(extension):
+        extension = ''
+    return os.path.join(directory, digest + extension) if directory else digest + extension
+
+
+class ContentAddressedStorage(FileSystemStorage):
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if name.startswith(_PRESERVED):
+            return super().save(name, content, max_length)
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+
+        name = hashed_name(name, content_digest(content))
+        if max_length is not None and len(name) > max_length:
+            raise SuspiciousFileOperation(f'Content-addressed name {name!r} is longer than {max_length} characters')
+        if self.exists(name):
+            # Restart the blob's garbage-collection grace period: the row
+            # naming it may not be committed yet
+            os.utime(self.path(name))
+        else:
+            replace(self, name, content)
+        return name
+
+
+def replace(storage, name, content):
+    """
+    Store ``content`` as ``name`` in a file system storage, replacing any file
+    already there: it is written to a temporary dot-file and renamed into
+    place, so concurrent writers never produce suffixed copies and readers
+    never see a partial file
+    """
+    temporary = os.path.join(os.path.dirname(name), f'.{uuid.uuid4().hex}{_TEMPORARY_SUFFIX}')
+    temporary = FileSystemStorage._save(storage, temporary, content)
+    os.replace(storage.path(temporary), storage.path(name))
+    return name
+
+
+def referenced_names(storage=default_storage):
+    """Every file name stored in a file column of the portfolio models"""
+    names = set()
+    for model in apps.get_app_config('portfolio').get_models():
+        for field in model._meta.get_fields():
+            if isinstance(field, models.FileField) and field.storage is storage:
+                names.update(
+                    model._base_manager.exclude(**{field.name: ''})
+                    .exclude(**{f'{field.name}__isnull': True})
+                    .values_list(field.name, flat=True).distinct()
+                )
+    return names
+
+
+def walk(storage, directory=''):
+    directories, files = storage.listdir(directory)
+    for name in files:
+        yield f'{directory}/{name}' if directory else name
+    for subdirectory in directories:
+        yield from walk(storage, f'{directory}/{subdirectory}' if directory else subdirectory)
+
+
+def is_garbage(name, referenced):
+    """Whether ``name`` is an unreferenced blob, a derivative of one, or a leftover temporary file"""
+    if name in referenced:
+        return False
+    if os.path.basename(name).startswith('.') and name.endswith(_TEMPORARY_SUFFIX):
+        return True
+    if name.startswith(_PRESERVED):
+        source_name = name[len(images.DERIVATIVE_ROOT) + 1:].rpartition('/')[0]
+        return source_name not in referenced
+    # Files uploaded under their original names are left alone
+    return digest_of(name) is not None
+
+
+def collect_garbage(storage=default_storage, min_age=3600, dry_run=False):
+    """
+    Delete unreferenced blobs and derivatives older than ``min_age`` seconds,
+    returning their names. The grace period covers uploads whose rows are
+    not committed yet: a file is stored before the row naming it is saved.
+    """
+    if not storage.exists(''):
+        return []
+    referenced = referenced_names(storage)
+    cutoff = time.time() - min_age
+    garbage = [
+        name for name in walk(storage)
+        if is_garbage(name, referenced) and storage.get_modified_time(name).timestamp() <= cutoff
+    ]
+    if not dry_run:
+        for name in garbage:
+            storage.delete(name)
+    return garbage
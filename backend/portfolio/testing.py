@@ -0,0 +1,25 @@
+"""
+Test helpers for the portfolio API
+"""
+from django.urls import reverse
+
+from .instrumentation import budget_for, record_queries
+
+
+class QueryBudgetMixin:
+    """TestCase mixin that checks a request against ``QUERY_BUDGETS``"""
+
+    def assertWithinQueryBudget(self, url_name, path=None, method='get', **kwargs):
+        budget = budget_for(url_name)
+        if budget is None:
+            self.fail(f'No query budget declared for {url_name!r} in portfolio/instrumentation.py')
+        path = path or reverse(url_name)
+        with record_queries() as recorder:
+            response = getattr(self.client, method)(path, **kwargs)
+            if getattr(response, 'streaming', False):
+                b''.join(response.streaming_content)
+
+        if recorder.count > budget:
+            queries = '\n'.join(f'  {i}. {sql}' for i, (sql, _) in enumerate(recorder.queries, 1))
+            self.fail(f'{url_name} ({path}) ran {recorder.count} queries, budget is {budget}:\n{queries}')
+        return response
@@ -1,3 +1,1363 @@
-from django.test import TestCase
+import base64
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+from datetime import date, datetime, timezone as dt_timezone
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from io import BytesIO, StringIO
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import include, reverse
+from django.urls import path as route
+from rest_framework.renderers import JSONRenderer
+
+from . import (
+    async_views, benchmarks, cdn, downloads, events, fixtures, images, ingest, readers, renderers, revalidate,
+    routers, search, snapshot, sqlite, storage,
+)
+from . import urls as portfolio_urls
+from .instrumentation import QUERY_BUDGETS
+from .models import (
+    PersonalInfo, SocialLink, SkillCategory, Skill,
+    Project, Technology, Education, Certification, CV, ContactMessage
+)
+from .testing import QueryBudgetMixin
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, PORTFOLIO_IMAGE_WORKERS=0, PORTFOLIO_CONTACT_INGEST='sync')
+class QueryBudgetTests(QueryBudgetMixin, TestCase):
+    """Every endpoint stays within its query budget with several rows per table"""
+
+    @classmethod
+    def setUpTestData(cls):
+        PersonalInfo.objects.create()
+        for i in range(3):
+            SocialLink.objects.create(platform='github', url=f'https://github.com/user{i}', order=i)
+            category = SkillCategory.objects.create(name=f'Category {i}', order=i)
+            for j in range(3):
+                Skill.objects.create(name=f'Skill {i}.{j}', category=category, is_featured=j == 0)
+            Project.objects.create(
+                title=f'Project {i}', slug=f'project-{i}', short_description='A React app',
+                description='Built with React', image='projects/project.png',
+                technologies='React, Django',
+            )
+            Education.objects.create(
+                institution=f'University {i}', degree='BSc', field_of_study='CS', start_date=date(2020, 1, 1)
+            )
+            Certification.objects.create(name=f'Cert {i}', issuer='Issuer', issue_date=date(2021, 1, 1))
+            ContactMessage.objects.create(name='Visitor', email='v@example.com', subject='Hi', message='Hello')
+        cv = CV(title='Resume')
+        cv.file.save('resume.pdf', ContentFile(b'%PDF-1.4 test'), save=True)
+        cls.staff = User.objects.create_user('staff', password='x', is_staff=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        # Every request starts cold: no cached versions, snapshots or file metadata
+        cache.clear()
+        snapshot.invalidate()
+        downloads._cached = None
+
+    def test_every_route_declares_a_budget(self):
+        names = {pattern.name for pattern in portfolio_urls.urlpatterns + portfolio_urls.media_urlpatterns}
+        self.assertEqual(names - set(QUERY_BUDGETS), set())
+
+    def test_read_endpoints(self):
+        for name in [
+            'api-overview', 'bundle', 'personal-info', 'social-links', 'skill-categories', 'skills',
+            'featured-skills', 'projects', 'education', 'certifications', 'stats', 'cv', 'cv-download',
+        ]:
+            with self.subTest(name):
+                response = self.assertWithinQueryBudget(name)
+                self.assertEqual(response.status_code, 200)
+
+    def test_parameterised_endpoints(self):
+        for name, path in [
+            ('project-detail', reverse('project-detail', args=['project-1'])),
+            ('project-search', reverse('project-search') + '?q=react'),
+            ('projects', reverse('projects') + '?tech=react&tech=django'),
+            ('projects', reverse('projects') + '?page_size=2'),
+            ('certifications', reverse('certifications') + '?page_size=2'),
+        ]:
+            with self.subTest(path):
+                response = self.assertWithinQueryBudget(name, path)
+                self.assertEqual(response.status_code, 200)
+
+    def test_sparse_fieldsets(self):
+        for name, path, keys in [
+            ('projects', reverse('projects') + '?fields=id,title,image_url', ['id', 'title', 'image_url']),
+            ('project-detail', reverse('project-detail', args=['project-1']) + '?fields=title', ['title']),
+            ('project-search', reverse('project-search') + '?q=react&fields=slug,rank', ['slug', 'rank']),
+            ('personal-info', reverse('personal-info') + '?fields=name&fields=bio', ['name', 'bio']),
+            ('skill-categories', reverse('skill-categories') + '?exclude=id,icon,order', ['name', 'skills']),
+            ('bundle', reverse('bundle') + '?fields=cv,projects', ['projects', 'cv']),
+        ]:
+            with self.subTest(path):
+                data = self.assertWithinQueryBudget(name, path).json()
+                if name != 'bundle':
+                    data = data[0] if isinstance(data, list) else data
+                self.assertEqual(list(data), keys)
+        response = self.client.get(reverse('projects') + '?fields=title,secret')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'fields': ['Unknown field: secret']})
+
+    def test_contact_endpoints(self):
+        response = self.assertWithinQueryBudget('contact', method='post', data={
+            'name': 'Visitor', 'email': 'v@example.com', 'subject': 'Hi', 'message': 'Hello',
+        })
+        self.assertEqual(response.status_code, 201)
+        self.client.force_login(self.staff)
+        response = self.assertWithinQueryBudget('contact-messages')
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(PORTFOLIO_QUERY_INSTRUMENTATION=True)
+    def test_server_timing_header(self):
+        with self.assertLogs('portfolio.queries', 'INFO') as logs:
+            response = self.client.get(reverse('skills'))
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="\d+ queries", total;dur=[\d.]+$')
+        self.assertEqual(logs.records[0].query_stats['url_name'], 'skills')
+
+    def test_no_instrumentation_without_debug(self):
+        response = self.client.get(reverse('skills'))
+        self.assertFalse(response.has_header('Server-Timing'))
+
+
+class QueryPlanTests(TestCase):
+    def test_view_queries_use_indexes(self):
+        # Raises CommandError on a full scan or a temp B-tree sort that is not accepted
+        call_command('audit_query_plans', stdout=StringIO())
+
+
+class AdminChangelistTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_superuser('admin', password='x')
+        ContactMessage.objects.create(name='Ada', email='ada@example.com', subject='Hiring', message='Django role')
+        ContactMessage.objects.bulk_create([
+            ContactMessage(name='Bob', email='bob@example.com', subject='Hello', message='Quick question'),
+        ])
+
+    def setUp(self):
+        self.client.force_login(self.staff)
+
+    def test_contact_message_search_uses_full_text_index(self):
+        # bulk_create sends no signals; the index triggers still cover it
+        for query, names in [('djan', ['Ada']), ('question', ['Bob']), ('example', ['Ada', 'Bob']), ('nothing', [])]:
+            with self.subTest(query):
+                response = self.client.get(reverse('admin:portfolio_contactmessage_changelist'), {'q': query})
+                self.assertEqual(sorted(message.name for message in response.context['cl'].result_list), names)
+
+    def test_skill_counts_are_annotated(self):
+        url = reverse('admin:portfolio_skillcategory_changelist')
+        category = SkillCategory.objects.create(name='Backend')
+        Skill.objects.create(name='Django', category=category)
+        SkillCategory.objects.create(name='Empty', order=1)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        counts = {row.name: row.skill_count for row in response.context['cl'].result_list}
+        self.assertEqual(counts, {'Backend': 1, 'Empty': 0})
+        # More categories, same number of queries
+        for i in range(3):
+            Skill.objects.create(name=f'Skill {i}', category=SkillCategory.objects.create(name=f'Category {i}'))
+        with self.assertNumQueries(len(queries)):
+            self.client.get(url)
+
+
+class FixtureTests(TestCase):
+    def test_export_import_round_trip(self):
+        category = SkillCategory.objects.create(name='Backend')
+        Skill.objects.create(name='Django', category=category, proficiency=90)
+        Project.objects.create(
+            title='Shop', slug='shop', short_description='s', description='d',
+            image='', technologies='Django, React',
+        )
+        # Natural keys without a unique constraint are matched by the importer
+        for degree in ('BSc', 'MSc'):
+            Education.objects.create(
+                institution='Cairo University', degree=degree, field_of_study='CS', start_date=date(2020, 1, 1)
+            )
+        stream = StringIO()
+        fixtures.write((record for model in fixtures.MODELS for record in fixtures.export_records(model)), stream, 'ndjson')
+        exported = stream.getvalue()
+
+        Skill.objects.all().delete()
+        Project.objects.filter(slug='shop').update(title='Old')
+        Education.objects.filter(degree='MSc').delete()
+        Education.objects.update(field_of_study='Old')
+        for _ in range(2):
+            importer = fixtures.Importer(batch_size=1)
+            for record in fixtures.read(StringIO(exported), 'ndjson'):
+                importer.add(record)
+            importer.finish()
+
+        # Upserted in place: no duplicates, updated values, links rebuilt
+        self.assertEqual(Skill.objects.get().proficiency, 90)
+        project = Project.objects.get()
+        self.assertEqual(project.title, 'Shop')
+        self.assertEqual(sorted(project.technology_tags.values_list('key', flat=True)), ['django', 'react'])
+        self.assertEqual(Technology.objects.count(), 2)
+        self.assertEqual(
+            sorted(Education.objects.values_list('degree', 'field_of_study')), [('BSc', 'CS'), ('MSc', 'CS')]
+        )
+        stream = StringIO()
+        fixtures.write((record for model in fixtures.MODELS for record in fixtures.export_records(model)), stream, 'ndjson')
+        self.assertEqual(stream.getvalue(), exported)
+
+    def test_populate_data_is_idempotent(self):
+        for _ in range(2):
+            call_command('populate_data', stdout=StringIO())
+        self.assertEqual(SocialLink.objects.count(), 2)
+        self.assertEqual(Skill.objects.count(), 21)
+        self.assertEqual(Project.objects.count(), 3)
+        self.assertEqual(Education.objects.count(), 1)
+
+
+class EventStreamTests(TestCase):
+    async def test_stream_delivers_and_resumes(self):
+        broker = events.get_broker()
+        response = await self.async_client.get(reverse('events'))
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), events.RETRY)
+        broker.publish('project', 1, 'v1')
+        first = await anext(stream)
+        self.assertIn(b'data: {"model":"project","id":1,"version":"v1"}', first)
+        broker.publish('project', 1, 'v2')
+        await anext(stream)
+        await stream.aclose()
+
+        # Resuming after the first event replays the second; an unknown id asks for a reset
+        event_id = first.split(b'\n')[0].removeprefix(b'id: ').decode()
+        response = await self.async_client.get(reverse('events'), headers={'Last-Event-ID': event_id})
+        stream = aiter(response.streaming_content)
+        await anext(stream)
+        self.assertIn(b'"version":"v2"', await anext(stream))
+        await stream.aclose()
+        response = await self.async_client.get(reverse('events'), headers={'Last-Event-ID': 'other-1'})
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), events.RETRY + events.RESET)
+        await stream.aclose()
+
+    def test_changes_are_published_on_commit(self):
+        log = events.get_broker()._log
+        with self.captureOnCommitCallbacks(execute=True):
+            category = SkillCategory.objects.create(name='Backend')
+            ContactMessage.objects.create(name='A', email='a@example.com', subject='S', message='M')
+        self.assertIn(f'"model":"skillcategory","id":{category.pk}'.encode(), log[-1][1])
+        self.assertNotIn(b'contactmessage', b''.join(chunk for _, chunk in log))
+        self.assertEqual(self.client.get(reverse('events')).status_code, 503)
+
+
+class StandInEndpoint(BaseHTTPRequestHandler):
+    """Records POSTs in place of a CDN purge API or the frontend"""
+    received = []
+
+    def do_POST(self):
+        self.received.append((self.headers, self.rfile.read(int(self.headers['Content-Length']))))
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+    @classmethod
+    def start(cls, test):
+        """Serve on a free port for the rest of ``test``; returns the URL"""
+        cls.received = []
+        server = HTTPServer(('127.0.0.1', 0), cls)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        test.addCleanup(server.shutdown)
+        return f'http://127.0.0.1:{server.server_port}/'
+
+
+class CDNTests(TestCase):
+    def test_cache_headers(self):
+        project = Project.objects.create(
+            title='Shop', slug='shop', short_description='s', description='d',
+            image='', technologies='Django',
+        )
+        response = self.client.get(reverse('skill-categories'))
+        self.assertIn('s-maxage=', response['Cache-Control'])
+        self.assertIn('stale-while-revalidate=', response['Cache-Control'])
+        self.assertEqual(response['Surrogate-Key'], 'skillcategory skill')
+        response = self.client.get(reverse('project-detail', args=['shop']))
+        self.assertEqual(response['Surrogate-Key'], f'project-{project.pk} project-details')
+        response = self.client.get(reverse('project-detail', args=['shop']), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertIn('s-maxage=', response['Cache-Control'])
+        self.assertFalse(response.has_header('Surrogate-Key'))
+
+    def test_changes_are_purged_in_one_batch(self):
+        url = StandInEndpoint.start(self)
+        self.addCleanup(setattr, cdn, '_purger', None)
+        cdn._purger = None
+        with override_settings(PORTFOLIO_CDN_PURGE_URL=url, PORTFOLIO_CDN_PURGE_DEBOUNCE=60):
+            with self.captureOnCommitCallbacks(execute=True):
+                first = SkillCategory.objects.create(name='Backend')
+                second = SkillCategory.objects.create(name='Frontend')
+                first.save()
+            self.assertEqual(cdn.get_purger().flush(), 3)
+        self.assertEqual([json.loads(body) for _, body in StandInEndpoint.received], [
+            {'surrogate_keys': ['skillcategory', f'skillcategory-{first.pk}', f'skillcategory-{second.pk}']},
+        ])
+
+
+class RevalidationTests(TestCase):
+    def test_signed_webhook_lists_affected_paths(self):
+        url = StandInEndpoint.start(self)
+        self.addCleanup(setattr, revalidate, '_dispatcher', None)
+        revalidate._dispatcher = None
+        with override_settings(
+            PORTFOLIO_REVALIDATE_URL=url, PORTFOLIO_REVALIDATE_SECRET='s3cret', PORTFOLIO_REVALIDATE_DEBOUNCE=60,
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                project = Project.objects.create(
+                    title='Shop', slug='shop', short_description='s', description='d',
+                    image='', technologies='Django',
+                )
+                project.slug = 'store'
+                project.save()
+                SkillCategory.objects.create(name='Backend')
+            revalidate.get_dispatcher().flush()
+        (headers, body), = StandInEndpoint.received
+        self.assertEqual(json.loads(body), {'paths': ['/', '/projects', '/projects/shop', '/projects/store', '/skills']})
+        self.assertEqual(headers['X-Portfolio-Signature'], revalidate.sign(body, headers['X-Portfolio-Timestamp'], 's3cret'))
+
+
+class BundleSnapshotTests(TestCase):
+    # Bundle section -> the endpoint serving the same payload on its own
+    SECTION_ROUTES = {
+        'personal_info': 'personal-info',
+        'social_links': 'social-links',
+        'skill_categories': 'skill-categories',
+        'featured_skills': 'featured-skills',
+        'projects': 'projects',
+        'education': 'education',
+        'certifications': 'certifications',
+        'cv': 'cv',
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        PersonalInfo.objects.create(profile_photo='profile/me.png')
+        SocialLink.objects.create(platform='github', url='https://github.com/user')
+        category = SkillCategory.objects.create(name='Backend')
+        Skill.objects.create(name='Django', category=category, is_featured=True)
+        Skill.objects.create(name='SQL', category=category)
+        Project.objects.create(
+            title='Shop', slug='shop', short_description='s', description='d',
+            image='projects/shop.png', technologies='Django, React',
+        )
+        Education.objects.create(
+            institution='University', degree='BSc', field_of_study='CS', start_date=date(2020, 1, 1)
+        )
+        Certification.objects.create(name='Cert', issuer='Issuer', issue_date=date(2021, 1, 1))
+        CV.objects.create(title='Resume', file='cv/resume.pdf')
+
+    def setUp(self):
+        snapshot.invalidate()
+        self.addCleanup(snapshot.invalidate)
+
+    def test_sections_match_their_endpoints(self):
+        bundle = self.client.get(reverse('bundle')).json()
+        self.assertEqual(set(bundle), set(self.SECTION_ROUTES))
+        for section, name in self.SECTION_ROUTES.items():
+            with self.subTest(section):
+                self.assertEqual(bundle[section], self.client.get(reverse(name)).json())
+
+    def test_fields_select_whole_sections(self):
+        full = self.client.get(reverse('bundle')).json()
+        for query, sections in [
+            ('?fields=cv,projects', ['projects', 'cv']),
+            ('?fields=education&fields=featured_skills', ['featured_skills', 'education']),
+            ('?exclude=projects,cv', [s for s in self.SECTION_ROUTES if s not in ('projects', 'cv')]),
+        ]:
+            with self.subTest(query):
+                bundle = self.client.get(reverse('bundle') + query).json()
+                self.assertEqual(list(bundle), sections)
+                self.assertEqual(bundle, {section: full[section] for section in sections})
+        response = self.client.get(reverse('bundle') + '?fields=projects,secret')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'fields': ['Unknown field: secret']})
+
+    def test_changes_rebuild_the_bundle(self):
+        self.assertEqual(len(self.client.get(reverse('bundle')).json()['featured_skills']), 1)
+        Skill.objects.create(name='Python', category=SkillCategory.objects.get(), is_featured=True)
+        self.assertEqual(len(self.client.get(reverse('bundle')).json()['featured_skills']), 2)
+
+    @override_settings(ALLOWED_HOSTS=['*'], PORTFOLIO_BUNDLE_SNAPSHOTS=3)
+    def test_hosts_cannot_grow_the_cache_without_bound(self):
+        for i in range(10):
+            response = self.client.get(reverse('bundle'), HTTP_HOST=f'host{i}.example.com')
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [base for base, _ in snapshot._snapshots],
+            [f'http://host{i}.example.com/' for i in (7, 8, 9)],
+        )
+        # A hit makes its bundle the most recently used one
+        self.client.get(reverse('bundle'), HTTP_HOST='host7.example.com')
+        self.client.get(reverse('bundle'), HTTP_HOST='host10.example.com')
+        self.assertEqual(
+            [base for base, _ in snapshot._snapshots],
+            [f'http://host{i}.example.com/' for i in (9, 7, 10)],
+        )
+
+
+class ConditionalGetTests(TestCase):
+    """Validators come from the version registry and change when the content does"""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = SkillCategory.objects.create(name='Backend')
+        cls.skill = Skill.objects.create(name='Django', category=category)
+        Project.objects.create(
+            title='Project', slug='project', short_description='Short', description='Long', image='projects/shot.png'
+        )
+
+    def setUp(self):
+        cache.clear()
+        snapshot.invalidate()
+
+    def test_matching_validators_get_304(self):
+        for url in (reverse('skills'), reverse('project-detail', args=['project']), reverse('bundle')):
+            with self.subTest(url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                etag, last_modified = response['ETag'], response['Last-Modified']
+
+                response = self.client.get(url, headers={'If-None-Match': etag})
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.content, b'')
+                self.assertEqual((response['ETag'], response['Last-Modified']), (etag, last_modified))
+                self.assertEqual(self.client.get(url, headers={'If-Modified-Since': last_modified}).status_code, 304)
+                self.assertEqual(self.client.get(url, headers={'If-None-Match': '"stale"'}).status_code, 200)
+
+    def test_etag_varies_with_the_request(self):
+        etag = self.client.get(reverse('projects'))['ETag']
+        self.assertNotEqual(self.client.get(reverse('projects') + '?featured=true')['ETag'], etag)
+        self.assertNotEqual(self.client.get(reverse('projects'), headers={'Accept': 'text/html'})['ETag'], etag)
+
+    def test_saving_content_changes_the_etag(self):
+        url = reverse('skills')
+        etag = self.client.get(url)['ETag']
+
+        Education.objects.create(
+            institution='University', degree='BSc', field_of_study='CS', start_date=date(2020, 1, 1)
+        )
+        self.assertEqual(self.client.get(url, headers={'If-None-Match': etag}).status_code, 304)
+
+        for change in (
+            lambda: self.skill.save(),
+            lambda: SkillCategory.objects.get().save(),
+            lambda: Skill.objects.create(name='SQL', category=self.skill.category),
+            lambda: Skill.objects.filter(name='SQL').delete(),
+        ):
+            change()
+            response = self.client.get(url, headers={'If-None-Match': etag})
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response['ETag'], etag)
+            etag = response['ETag']
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Few distinct values per ordering column, so most rows tie on a prefix of the key
+        for i in range(11):
+            Certification.objects.create(
+                name=f'Cert {i}', issuer='Issuer', order=i % 3, issue_date=date(2021, 1 + i % 2, 1)
+            )
+            Project.objects.create(
+                title=f'Project {i}', slug=f'project-{i}', short_description='s', description='d',
+                image='', is_featured=i % 2 == 0, order=i % 3,
+            )
+        Project.objects.update(created_at=datetime(2024, 1, 1, tzinfo=dt_timezone.utc))
+
+    def walk(self, url_name, page_size, **params):
+        ids, url, pages = [], reverse(url_name), 0
+        params = {'page_size': page_size, **params}
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertLessEqual(len(data['results']), page_size)
+            ids.extend(row['id'] for row in data['results'])
+            url, params, pages = data['next'], None, pages + 1
+        return ids, pages
+
+    def test_pages_cover_the_full_ordering_once(self):
+        for url_name, queryset in [
+            ('certifications', Certification.objects.order_by('order', '-issue_date', 'pk')),
+            ('projects', Project.objects.order_by('-is_featured', 'order', '-created_at', 'pk')),
+        ]:
+            expected = list(queryset.values_list('id', flat=True))
+            for page_size in (1, 2, 4, 11, 100):
+                with self.subTest(url_name, page_size=page_size):
+                    ids, pages = self.walk(url_name, page_size)
+                    self.assertEqual(ids, expected)
+                    self.assertEqual(pages, max(1, -(-len(expected) // page_size)))
+
+    def test_cursor_survives_the_deletion_of_its_row(self):
+        expected = list(Certification.objects.order_by('order', '-issue_date', 'pk').values_list('id', flat=True))
+        data = self.client.get(reverse('certifications'), {'page_size': 3}).json()
+        Certification.objects.filter(pk=data['results'][-1]['id']).delete()
+        data = self.client.get(data['next']).json()
+        self.assertEqual([row['id'] for row in data['results']], expected[3:6])
+
+    def test_malformed_cursor(self):
+        def cursor(values):
+            return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+        for value in ['not-a-cursor', cursor({'order': 1}), cursor([1, '2021-01-01']), cursor([1, 'someday', 3])]:
+            with self.subTest(value):
+                response = self.client.get(reverse('certifications'), {'cursor': value})
+                self.assertEqual(response.status_code, 404)
+                self.assertEqual(response.json(), {'detail': 'Invalid cursor'})
+
+
+class ProjectSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.titled = Project.objects.create(
+            title='Kafka pipeline', slug='kafka-pipeline', short_description='Streaming', description='Events',
+            image='',
+        )
+        cls.described = Project.objects.create(
+            title='Shop', slug='shop', short_description='Store', description='Orders flow through Kafka', image='',
+        )
+        Project.objects.create(
+            title='Hidden Kafka', slug='hidden', short_description='s', description='d', image='', is_active=False,
+        )
+
+    def search(self, query):
+        return [project.slug for project in search.search_projects(query)]
+
+    def test_title_matches_rank_above_description_matches(self):
+        response = self.client.get(reverse('project-search'), {'q': 'kafka'})
+        self.assertEqual(response.status_code, 200)
+        results = response.json()
+        self.assertEqual([row['slug'] for row in results], ['kafka-pipeline', 'shop'])
+        self.assertGreater(results[0]['rank'], results[1]['rank'])
+
+    def test_snippets_mark_the_matched_terms(self):
+        titled, described = search.search_projects('kafka')
+        self.assertEqual(titled.search_snippet, '<mark>Kafka</mark> pipeline')
+        self.assertEqual(described.search_snippet, 'Orders flow through <mark>Kafka</mark>')
+        # Terms are prefix matches
+        self.assertEqual(search.search_projects('pipe')[0].search_snippet, 'Kafka <mark>pipeline</mark>')
+
+    def test_snippets_escape_the_indexed_text(self):
+        Project.objects.create(
+            title='Widget', slug='widget', short_description='s', image='',
+            description='<script>alert(1)</script> & a widget <b>demo</b>',
+        )
+        snippet = search.search_projects('demo')[0].search_snippet
+        self.assertEqual(
+            snippet, '&lt;script&gt;alert(1)&lt;/script&gt; &amp; a widget &lt;b&gt;<mark>demo</mark>&lt;/b&gt;'
+        )
+
+    def test_index_follows_saves_and_deletes(self):
+        self.assertEqual(self.search('orders'), ['shop'])
+        self.described.description = 'Payments'
+        self.described.save()
+        self.assertEqual(self.search('orders'), [])
+        self.assertEqual(self.search('payments'), ['shop'])
+
+        self.titled.delete()
+        self.assertEqual(self.search('kafka'), [])
+        self.assertEqual(self.search('streaming'), [])
+
+    def test_other_databases_fall_back_to_icontains(self):
+        connection = search._connection
+        self.addCleanup(setattr, search, '_connection', connection)
+        search._connection = lambda write=False: type('Connection', (), {'vendor': 'mysql'})()
+
+        results = search.search_projects('KAFKA flow')
+        self.assertEqual([project.slug for project in results], ['shop'])
+        self.assertEqual((results[0].search_rank, results[0].search_snippet), (0.0, 'Store'))
+        self.assertEqual(self.search('<nothing>'), [])
+
+    def test_queries_without_terms_match_nothing(self):
+        self.assertEqual(self.search(''), [])
+        self.assertEqual(self.search('"* -'), [])
+
+
+class TechnologyFilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for slug, technologies in [
+            ('shop', 'React, Django, PostgreSQL'),
+            ('blog', 'Django,  Tailwind   CSS'),
+            ('app', 'react ,Next.js, , Tailwind CSS'),
+        ]:
+            Project.objects.create(
+                title=slug, slug=slug, short_description='s', description='d', image='', technologies=technologies
+            )
+
+    def filter(self, *tech):
+        response = self.client.get(reverse('projects'), {'tech': tech})
+        self.assertEqual(response.status_code, 200)
+        return sorted(project['slug'] for project in response.json())
+
+    def test_every_listed_technology_must_match(self):
+        self.assertEqual(self.filter('django'), ['blog', 'shop'])
+        self.assertEqual(self.filter('django', 'react'), ['shop'])
+        self.assertEqual(self.filter('react', 'tailwind css'), ['app'])
+        self.assertEqual(self.filter('django', 'next.js'), [])
+        self.assertEqual(self.filter('unknown'), [])
+
+    def test_names_are_compared_case_and_whitespace_insensitively(self):
+        self.assertEqual(self.filter(' REACT '), ['app', 'shop'])
+        self.assertEqual(self.filter('tailwind\tCSS'), ['app', 'blog'])
+        self.assertEqual(
+            sorted(Technology.objects.values_list('key', flat=True)),
+            ['django', 'next.js', 'postgresql', 'react', 'tailwind css'],
+        )
+
+    def test_saving_a_project_resyncs_its_technologies(self):
+        project = Project.objects.get(slug='shop')
+        react = Technology.objects.get(key='react')
+        project.technologies = 'REACT, Vue'
+        project.save()
+
+        self.assertEqual(
+            sorted(project.technology_tags.values_list('key', flat=True)), ['react', 'vue']
+        )
+        # Existing rows are reused rather than duplicated
+        self.assertEqual(project.technology_tags.get(key='react'), react)
+        self.assertEqual(self.filter('django'), ['blog'])
+        self.assertEqual(self.filter('vue'), ['shop'])
+
+
+class MigrationTests(TransactionTestCase):
+    """Data migrations, run against the historical models they were written for"""
+
+    def migrate(self, target):
+        """Migrate the portfolio app to ``target`` and return the app registry at that state"""
+        executor = MigrationExecutor(connection)
+        executor.migrate([('portfolio', target)])
+        return executor.loader.project_state([('portfolio', target)]).apps
+
+    def tearDown(self):
+        call_command('migrate', 'portfolio', verbosity=0)
+
+    def test_technology_migration_splits_the_csv(self):
+        Project = self.migrate('0002_project_search_index').get_model('portfolio', 'Project')
+        for slug, technologies in [('shop', 'React, Django ,,'), ('blog', ' Tailwind  CSS,Django'), ('empty', '')]:
+            Project.objects.create(
+                title=slug, slug=slug, short_description='s', description='d', image='', technologies=technologies
+            )
+
+        apps = self.migrate('0003_technology')
+        Technology = apps.get_model('portfolio', 'Technology')
+        self.assertEqual(
+            sorted(Technology.objects.values_list('key', 'name')),
+            [('django', 'Django'), ('react', 'React'), ('tailwind css', 'Tailwind  CSS')],
+        )
+        self.assertEqual(
+            sorted(Technology.projects.through.objects.values_list('technology__key', 'project__slug')),
+            [('django', 'blog'), ('django', 'shop'), ('react', 'shop'), ('tailwind css', 'blog')],
+        )
+
+        self.migrate('0002_project_search_index')
+        self.assertEqual(Project.objects.count(), 3)
+
+    def test_natural_key_migration_removes_only_identical_skills(self):
+        Skill = self.migrate('0005_contactmessage_search_index').get_model('portfolio', 'Skill')
+        category = Skill._meta.get_field('category').related_model.objects.create(name='Backend')
+        kept, copy = (Skill.objects.create(name='Django', category=category, proficiency=90) for _ in range(2))
+        python = Skill.objects.create(name='Python', category=category)
+        first, second = (Skill.objects.create(name='SQL', category=category, proficiency=p) for p in (60, 80))
+
+        with self.assertRaisesMessage(CommandError, f"category {category.pk}, 'SQL': id {first.pk} (proficiency=60"):
+            self.migrate('0006_natural_keys')
+        self.assertEqual(Skill.objects.count(), 5)
+
+        second.delete()
+        stdout = StringIO()
+        with redirect_stdout(stdout):
+            Skill = self.migrate('0006_natural_keys').get_model('portfolio', 'Skill')
+        self.assertIn(f"'Django' in category {category.pk}: ids [{copy.pk}], kept {kept.pk}", stdout.getvalue())
+        self.assertEqual(
+            sorted(Skill.objects.values_list('pk', 'name', 'proficiency')),
+            [(kept.pk, 'Django', 90), (python.pk, 'Python', 75), (first.pk, 'SQL', 60)],
+        )
+
+
+def png(size=(640, 480)):
+    from PIL import Image
+    buffer = BytesIO()
+    Image.frombytes('RGB', size, os.urandom(size[0] * size[1] * 3)).save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, PORTFOLIO_IMAGE_WORKERS=0)
+class ImageDerivativeTests(TestCase):
+    def tearDown(self):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def derivatives_of(self, source_name):
+        return default_storage.listdir(f'{images.DERIVATIVE_ROOT}/{source_name}')[1]
+
+    def test_uploads_get_every_variant_after_commit(self):
+        project = Project(title='Shop', slug='shop', short_description='s', description='d')
+        with self.captureOnCommitCallbacks(execute=True):
+            project.image.save('shot.png', ContentFile(png()), save=True)
+            self.assertFalse(default_storage.exists(images.DERIVATIVE_ROOT))
+
+        expected = sorted(
+            [f'{width}.{fmt}' for fmt in images.available_formats() for width in images.WIDTHS]
+            + [f'{images.THUMBNAIL_WIDTH}.{images.THUMBNAIL_FORMAT}']
+        )
+        self.assertEqual(sorted(self.derivatives_of(project.image.name)), expected)
+
+        srcset = self.client.get(reverse('project-detail', args=['shop'])).json()['image_srcset']
+        self.assertEqual(set(srcset), set(images.available_formats()))
+        self.assertEqual(
+            srcset['webp']['640'],
+            'http://testserver' + reverse('image-derivative', args=[f'derivatives/{project.image.name}/640.webp']),
+        )
+
+    def test_missing_variants_are_rendered_on_request(self):
+        from PIL import Image
+        source_name = default_storage.save('projects/shot.png', ContentFile(png()))
+        name = images.derivative_name(source_name, 320, 'webp')
+
+        response = self.client.get(reverse('image-derivative', args=[name]))
+        self.assertEqual((response.status_code, response['Content-Type']), (200, 'image/webp'))
+        with Image.open(BytesIO(b''.join(response.streaming_content))) as variant:
+            self.assertEqual((variant.format, variant.size), ('WEBP', (320, 240)))
+        self.assertEqual(self.derivatives_of(source_name), ['320.webp'])
+
+    def test_unknown_variants(self):
+        default_storage.save('projects/shot.png', ContentFile(png()))
+        for name in [
+            'derivatives/projects/shot.png/300.webp',
+            'derivatives/projects/shot.png/320.gif',
+            'derivatives/cv/resume.pdf/320.webp',
+            'derivatives/projects/../cv/resume.pdf/320.webp',
+            'derivatives/projects/missing.png/320.webp',
+        ]:
+            with self.subTest(name):
+                self.assertEqual(self.client.get(reverse('image-derivative', args=[name])).status_code, 404)
+
+    def test_concurrent_generation_leaves_one_file(self):
+        from PIL import Image
+        source_name = default_storage.save('projects/shot.png', ContentFile(png()))
+        threads = [threading.Thread(target=images.generate, args=(source_name, 320, 'webp')) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(images.generate(source_name, 320, 'webp'), images.derivative_name(source_name, 320, 'webp'))
+        self.assertEqual(self.derivatives_of(source_name), ['320.webp'])
+
+        response = self.client.get(reverse('image-derivative', args=[images.derivative_name(source_name, 320, 'webp')]))
+        self.assertEqual((response.status_code, response['Content-Type']), (200, 'image/webp'))
+        with Image.open(BytesIO(b''.join(response.streaming_content))) as variant:
+            self.assertEqual((variant.format, variant.width), ('WEBP', 320))
+
+    def test_undecodable_sources(self):
+        for content in (b'not an image', png()[:2000]):
+            source_name = default_storage.save('projects/broken.png', ContentFile(content))
+            with self.subTest(source_name):
+                name = images.derivative_name(source_name, 320, 'webp')
+                response = self.client.get(reverse('image-derivative', args=[name]))
+                self.assertEqual(response.status_code, 404)
+                self.assertEqual(response.json(), {'detail': 'Image could not be decoded'})
+                with self.assertLogs('portfolio.images', 'WARNING'):
+                    images.generate_all(source_name)
+                self.assertFalse(default_storage.exists(f'{images.DERIVATIVE_ROOT}/{source_name}'))
+
+
+class StatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        backend = SkillCategory.objects.create(name='Backend', order=0)
+        SkillCategory.objects.create(name='Empty', order=1)
+        for proficiency in (0, 9, 10, 55, 99, 100):
+            Skill.objects.create(name=f'Skill {proficiency}', category=backend, proficiency=proficiency)
+        for slug, technologies, year, active in [
+            ('shop', 'React, Django', 2023, True),
+            ('blog', ' react ,NEXT.js', 2023, True),
+            ('api', 'Django', 2024, True),
+            ('old', 'Vue, React', 2022, False),
+        ]:
+            project = Project.objects.create(
+                title=slug, slug=slug, short_description='s', description='d', image='',
+                technologies=technologies, is_active=active,
+            )
+            Project.objects.filter(pk=project.pk).update(created_at=datetime(year, 6, 1, tzinfo=dt_timezone.utc))
+
+    def setUp(self):
+        cache.clear()
+
+    def test_statistics(self):
+        data = self.client.get(reverse('stats')).json()
+        histogram = {
+            (bucket['min'], bucket['max']): bucket['count'] for bucket in data['skills']['proficiency_histogram']
+        }
+        self.assertEqual(len(histogram), 10)
+        self.assertEqual((histogram[(0, 9)], histogram[(10, 19)], histogram[(50, 59)]), (2, 1, 1))
+        # 100 shares the last bucket
+        self.assertEqual(histogram[(90, 100)], 2)
+        self.assertEqual(sum(histogram.values()), 6)
+        self.assertEqual((data['skills']['count'], data['skills']['average_proficiency']), (6, 45.5))
+        self.assertEqual([
+            (row['name'], row['skill_count'], row['min_proficiency'], row['max_proficiency'])
+            for row in data['skill_categories']
+        ], [('Backend', 6, 0, 100), ('Empty', 0, None, None)])
+
+        self.assertEqual(data['projects'], {
+            'count': 3, 'per_year': [{'year': 2023, 'count': 2}, {'year': 2024, 'count': 1}],
+        })
+        # Inactive projects are not counted, and Vue is only used by one
+        self.assertEqual([(row['key'], row['project_count']) for row in data['technologies']], [
+            ('django', 2), ('react', 2), ('next.js', 1),
+        ])
+
+    def test_result_is_rebuilt_after_a_change(self):
+        self.assertEqual(self.client.get(reverse('stats')).json()['skills']['count'], 6)
+        # Writes that send no signals leave the memoized result in place
+        Skill.objects.filter(proficiency=0).update(proficiency=100)
+        with self.assertNumQueries(0):
+            data = self.client.get(reverse('stats')).json()
+        self.assertEqual(data['skills']['proficiency_histogram'][0]['count'], 2)
+
+        Skill.objects.get(proficiency=9).save()
+        data = self.client.get(reverse('stats')).json()
+        self.assertEqual(data['skills']['proficiency_histogram'][0]['count'], 1)
+        self.assertEqual(data['skills']['proficiency_histogram'][-1]['count'], 3)
+
+        Project.objects.filter(slug='old').update(is_active=True)
+        Project.objects.get(slug='old').save()
+        self.assertEqual(self.client.get(reverse('stats')).json()['projects']['count'], 4)
+
+
+class ContactIngestTests(TestCase):
+    def setUp(self):
+        self.spool_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.spool_dir, ignore_errors=True)
+
+    def message(self, subject):
+        return {'name': 'Visitor', 'email': 'v@example.com', 'subject': subject, 'message': 'Hello'}
+
+    def test_buffered_submissions_are_acknowledged_then_written_in_one_batch(self):
+        self.addCleanup(setattr, ingest, '_buffer', None)
+        with self.settings(
+            PORTFOLIO_CONTACT_INGEST='buffered', PORTFOLIO_CONTACT_SPOOL_DIR=self.spool_dir,
+            PORTFOLIO_CONTACT_FLUSH_INTERVAL=3600,
+        ):
+            for subject in ('First', 'Second'):
+                response = self.client.post(reverse('contact'), self.message(subject))
+                self.assertEqual(response.status_code, 202)
+            self.assertFalse(ContactMessage.objects.exists())
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(ingest.get_buffer().flush(), 2)
+        self.assertEqual([query['sql'][:6] for query in queries if 'contactmessage' in query['sql']], ['INSERT'])
+        self.assertEqual(sorted(ContactMessage.objects.values_list('subject', flat=True)), ['First', 'Second'])
+
+    def test_sync_submissions_are_inserted_in_the_request(self):
+        response = self.client.post(reverse('contact'), self.message('Now'))
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(ContactMessage.objects.get().subject, 'Now')
+
+    def test_torn_last_line_of_a_spool_is_skipped(self):
+        with open(os.path.join(self.spool_dir, 'contact-999999999-0123456789ab.ndjson'), 'w') as spool:
+            spool.write(json.dumps(self.message('Leftover')) + '\n{"name": "Torn')
+
+        with self.assertLogs('portfolio.ingest', 'WARNING'):
+            buffer = ingest.ContactMessageBuffer(self.spool_dir, flush_interval=3600)
+        self.assertEqual(list(ContactMessage.objects.values_list('subject', flat=True)), ['Leftover'])
+        self.assertEqual(
+            sorted(os.listdir(self.spool_dir)), [f'contact-{buffer.token}.lock', f'contact-{buffer.token}.ndjson']
+        )
+
+    def test_spool_of_a_crashed_process_with_the_same_pid_is_recovered(self):
+        # A container restart reuses the pid; only the random part of the token differs
+        dead = f'{os.getpid()}-0123456789ab'
+        for name, subject in ((f'contact-{dead}.1.flushing', 'In flight'), (f'contact-{dead}.ndjson', 'Leftover')):
+            with open(os.path.join(self.spool_dir, name), 'w') as spool:
+                spool.write(json.dumps(self.message(subject)) + '\n')
+
+        buffer = ingest.ContactMessageBuffer(self.spool_dir, flush_interval=3600)
+        buffer.submit(self.message('New'))
+        buffer.flush()
+
+        self.assertEqual(
+            sorted(ContactMessage.objects.values_list('subject', flat=True)), ['In flight', 'Leftover', 'New']
+        )
+        self.assertEqual(
+            sorted(os.listdir(self.spool_dir)), [f'contact-{buffer.token}.lock', f'contact-{buffer.token}.ndjson']
+        )
+
+    def test_spool_of_a_running_buffer_is_left_alone(self):
+        running = ingest.ContactMessageBuffer(self.spool_dir, flush_interval=3600)
+        running.submit(self.message('Pending'))
+        ingest.ContactMessageBuffer(self.spool_dir, flush_interval=3600)
+        self.assertFalse(ContactMessage.objects.exists())
+        self.assertEqual(running.flush(), 1)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, PORTFOLIO_IMAGE_WORKERS=0)
+class StaticExportTests(TestCase):
+    def export(self, output):
+        stdout = StringIO()
+        call_command('export_static_api', output, stdout=stdout)
+        with open(os.path.join(output, 'manifest.json')) as manifest:
+            return json.load(manifest), stdout.getvalue()
+
+    def test_exports_every_public_read(self):
+        PersonalInfo.objects.create()
+        CV.objects.create(title='Resume', file='cv/resume.pdf')
+        Project.objects.create(title='Shop', slug='shop', short_description='s', description='d', image='')
+        output = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output, ignore_errors=True)
+
+        exported, stdout = self.export(output)
+        self.assertNotIn('Skipped', stdout)
+        self.assertIn(reverse('projects'), exported)
+        # The event stream never ends under ASGI and is a 503 under WSGI
+        self.assertNotIn(reverse('events'), exported)
+        detail = exported[reverse('project-detail', args=['shop'])]
+        with open(os.path.join(output, detail['file']), 'rb') as body:
+            data = body.read()
+        self.assertEqual(data, self.client.get(reverse('project-detail', args=['shop'])).content)
+        with gzip.open(os.path.join(output, detail['file'] + '.gz')) as compressed:
+            self.assertEqual(compressed.read(), data)
+
+    def test_reexport_rewrites_only_what_changed(self):
+        Project.objects.create(title='Shop', slug='shop', short_description='s', description='d', image='')
+        output = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output, ignore_errors=True)
+        before, _ = self.export(output)
+        for entry in before.values():
+            os.utime(os.path.join(output, entry['file']), (0, 0))
+
+        project = Project.objects.get(slug='shop')
+        project.is_active = False
+        project.save()
+        after, stdout = self.export(output)
+        changed = {path for path, entry in after.items() if entry['sha256'] != before[path]['sha256']}
+        # The project list and the bundle lose the project; its detail route goes away
+        self.assertLessEqual({reverse('projects'), reverse('bundle')}, changed)
+        self.assertIn(f'({len(changed)} changed, 1 removed)', stdout)
+        for path, entry in after.items():
+            with self.subTest(path):
+                rewritten = os.stat(os.path.join(output, entry['file'])).st_mtime != 0
+                self.assertEqual(rewritten, path in changed)
+        self.assertNotIn(reverse('project-detail', args=['shop']), after)
+        self.assertEqual(os.listdir(os.path.join(output, 'api/projects/shop')), [])
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class CVDownloadTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        downloads._cached = None
+        self.addCleanup(shutil.rmtree, MEDIA_ROOT, ignore_errors=True)
+        CV(title='Resume').file.save('resume.pdf', ContentFile(b'0123456789'), save=True)
+
+    def download(self, **headers):
+        response = self.client.get(reverse('cv-download'), headers=headers)
+        body = b''.join(response.streaming_content) if response.streaming else response.content
+        return response, body
+
+    def test_full_download(self):
+        response, body = self.download()
+        self.assertEqual((response.status_code, body), (200, b'0123456789'))
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(self.download(**{'If-None-Match': response['ETag']})[0].status_code, 304)
+
+    def test_satisfiable_ranges(self):
+        for header, content_range, expected in [
+            ('bytes=2-5', 'bytes 2-5/10', b'2345'),
+            ('bytes=8-', 'bytes 8-9/10', b'89'),
+            ('bytes=-3', 'bytes 7-9/10', b'789'),
+            ('bytes=5-100', 'bytes 5-9/10', b'56789'),
+            ('bytes=-100', 'bytes 0-9/10', b'0123456789'),
+        ]:
+            with self.subTest(header):
+                response, body = self.download(Range=header)
+                self.assertEqual(response.status_code, 206)
+                self.assertEqual(response['Content-Range'], content_range)
+                self.assertEqual(response['Content-Length'], str(len(expected)))
+                self.assertEqual(body, expected)
+
+    def test_unsatisfiable_ranges(self):
+        for header in ('bytes=10-', 'bytes=-0', 'bytes=20-30'):
+            with self.subTest(header):
+                response, _ = self.download(Range=header)
+                self.assertEqual(response.status_code, 416)
+                self.assertEqual(response['Content-Range'], 'bytes */10')
+
+    def test_multiple_or_malformed_ranges_get_the_whole_file(self):
+        for header in ('bytes=0-1,4-5', 'items=0-1', 'bytes=a-b', 'bytes=-'):
+            with self.subTest(header):
+                response, body = self.download(Range=header)
+                self.assertEqual((response.status_code, body), (200, b'0123456789'))
+
+    def test_if_range(self):
+        etag = self.download()[0]['ETag']
+        for if_range, status in [
+            (etag, 206),
+            ('"stale"', 200),
+            ('Mon, 01 Jan 2001 00:00:00 GMT', 200),
+            ('Fri, 01 Jan 2100 00:00:00 GMT', 206),
+        ]:
+            with self.subTest(if_range):
+                response, _ = self.download(Range='bytes=0-1', **{'If-Range': if_range})
+                self.assertEqual(response.status_code, status)
+
+
+class BenchmarkTests(TestCase):
+    def generate(self, *args):
+        call_command(
+            'generate_dataset', '--projects=30', '--categories=2', '--skills=10', '--education=2',
+            '--certifications=3', '--social-links=2', '--messages=5', *args, stdout=StringIO(),
+        )
+
+    def test_generated_rows_are_linked_and_searchable(self):
+        self.generate()
+        self.assertEqual(
+            [model.objects.count() for model in (Project, Skill, Certification, ContactMessage)], [30, 10, 3, 5]
+        )
+        for project in Project.objects.prefetch_related('technology_tags'):
+            self.assertEqual(
+                sorted(tech.key for tech in project.technology_tags.all()),
+                sorted(Technology.normalize(name) for name in project.tech_list),
+            )
+        expected = Project.objects.filter(is_active=True, technology_tags__key='django').count()
+        self.assertEqual(len(search.search_projects('django', limit=100)), expected)
+
+        self.generate('--clear')
+        self.assertEqual(Project.objects.count(), 30)
+
+    def test_benchmark_reports_and_compares_every_endpoint(self):
+        self.generate()
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        output = os.path.join(directory, 'results.json')
+        stdout = StringIO()
+        call_command('benchmark_api', '--requests=2', f'--output={output}', f'--compare={output}', stdout=stdout)
+
+        with open(output) as results:
+            report = json.load(results)
+        self.assertEqual(set(report['endpoints']), set(benchmarks.endpoint_paths()))
+        self.assertEqual(report['dataset']['projects'], 30)
+        for name, result in report['endpoints'].items():
+            with self.subTest(name):
+                self.assertEqual(result['requests'], 2)
+                self.assertIsNotNone(result['sql_queries'])
+        self.assertIn('project-search', report['endpoints'])
+        self.assertIn('req/s +0.0%', stdout.getvalue())
+
+    def test_streaming_routes_are_not_benchmarked(self):
+        Project.objects.create(title='Shop', slug='shop', short_description='s', description='d', image='')
+        paths = benchmarks.endpoint_paths()
+        self.assertIn('project-detail', paths)
+        self.assertNotIn('events', paths)
+        self.assertEqual(benchmarks.endpoint_paths(['events']), {})
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, PORTFOLIO_IMAGE_WORKERS=0)
+class ReaderParityTests(TestCase):
+    """The compiled ``.values()`` readers render the same bytes as their serializers"""
+
+    @classmethod
+    def setUpTestData(cls):
+        # bulk_create skips the singleton check in PersonalInfo.save
+        PersonalInfo.objects.bulk_create([
+            PersonalInfo(profile_photo='profile/me and you é.png', favicon=''),
+            PersonalInfo(profile_photo=None, favicon='favicon/icon.png', bio=''),
+        ])
+        SocialLink.objects.create(platform='github', url='https://github.com/user', icon='')
+        SocialLink.objects.create(platform='unknown', url='https://example.com', order=1)
+        category = SkillCategory.objects.create(name='Backend', order=1)
+        SkillCategory.objects.create(name='Empty')
+        for name in ('Django', 'Python'):
+            Skill.objects.create(name=name, category=category, is_featured=name == 'Django')
+        Project.objects.create(
+            title='With image', slug='with-image', short_description='Short', description='Long',
+            image='projects/shot é.png', technologies='React,  Django ,',
+        )
+        Project.objects.create(
+            title='Without image', slug='without-image', short_description='Short', description='Long',
+            image='', technologies='',
+        )
+        Education.objects.create(
+            institution='University', degree='BSc', field_of_study='CS', start_date=date(2020, 1, 1),
+            logo='education/logo.png',
+        )
+        Education.objects.create(
+            institution='College', degree='Diploma', field_of_study='IT', start_date=date(2018, 1, 1),
+            end_date=date(2019, 6, 1), logo='',
+        )
+        Education.objects.create(
+            institution='School', degree='-', field_of_study='-', start_date=date(2015, 1, 1), logo=None,
+        )
+        Certification.objects.create(name='Cert', issuer='Issuer', issue_date=date(2021, 1, 1), image='')
+        Certification.objects.create(
+            name='Expiring', issuer='Issuer', issue_date=date(2021, 1, 1), expiry_date=date(2024, 1, 1),
+            credential_url='https://example.com/cert', image='certifications/cert.jpg',
+        )
+        Certification.objects.create(name='No image', issuer='Issuer', issue_date=date(2022, 1, 1), image=None)
+        CV.objects.create(title='Resume', file='cv/resume.pdf')
+        CV.objects.create(title='Empty', file='')
+        ContactMessage.objects.create(name='Visitor', email='v@example.com', subject='', message='Hello')
+
+    def test_readers_match_serializers(self):
+        for request in (None, RequestFactory().get('/')):
+            for reader in (
+                readers.PERSONAL_INFO, readers.SOCIAL_LINKS, readers.SKILLS, readers.SKILL_CATEGORIES,
+                readers.PROJECTS, readers.EDUCATION, readers.CERTIFICATIONS, readers.CV, readers.CONTACT_MESSAGES,
+            ):
+                with self.subTest(reader.serializer_class.__name__, request=request is not None):
+                    queryset = reader.ordered(reader.model._default_manager.all())
+                    expected = reader.serializer_class(queryset, many=True, context={'request': request}).data
+                    self.assertEqual(
+                        JSONRenderer().render(reader.serialize(queryset, request)), JSONRenderer().render(expected)
+                    )
+
+    def test_benchmark_serializers_checks_the_output(self):
+        stdout = StringIO()
+        call_command('benchmark_serializers', '--repeat=1', stdout=stdout)
+        self.assertIn('Reader output is byte-identical to the serializers', stdout.getvalue())
+
+
+# URLconf for AsyncViewTests: the API with each read route served by its async_views class
+urlpatterns = [
+    route('api/', include([
+        route(str(pattern.pattern), getattr(async_views, view_class.__name__).as_view(), name=pattern.name)
+        if (view_class := getattr(pattern.callback, 'view_class', None)) and hasattr(async_views, view_class.__name__)
+        else pattern
+        for pattern in portfolio_urls.urlpatterns
+    ])),
+]
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, PORTFOLIO_IMAGE_WORKERS=0, ROOT_URLCONF=__name__)
+class AsyncViewTests(TestCase):
+    """The async read views answer like the DRF views, conditional GETs included"""
+
+    @classmethod
+    def setUpTestData(cls):
+        PersonalInfo.objects.create(profile_photo='profile/me.png')
+        SocialLink.objects.create(platform='github', url='https://github.com/user')
+        category = SkillCategory.objects.create(name='Backend')
+        Skill.objects.create(name='Django', category=category, is_featured=True)
+        Skill.objects.create(name='SQL', category=category)
+        for i in range(3):
+            Project.objects.create(
+                title=f'Project {i}', slug=f'project-{i}', short_description='A React app',
+                description='Built with React', image='projects/project.png', technologies='React, Django',
+            )
+            Certification.objects.create(name=f'Cert {i}', issuer='Issuer', issue_date=date(2021, 1, 1))
+        Education.objects.create(
+            institution='University', degree='BSc', field_of_study='CS', start_date=date(2020, 1, 1)
+        )
+        CV.objects.create(title='Resume', file='cv/resume.pdf')
+
+    def setUp(self):
+        cache.clear()
+        snapshot.invalidate()
+
+    async def test_endpoints_answer_like_the_sync_views(self):
+        for name, args, query in [
+            ('bundle', [], ''),
+            ('personal-info', [], '?fields=name,profile_photo_url'),
+            ('social-links', [], ''),
+            ('skill-categories', [], ''),
+            ('skills', [], ''),
+            ('featured-skills', [], ''),
+            ('projects', [], '?page_size=2&tech=react'),
+            ('project-search', [], '?q=react'),
+            ('project-detail', ['project-1'], ''),
+            ('education', [], ''),
+            ('certifications', [], '?page_size=2'),
+            ('stats', [], ''),
+            ('cv', [], ''),
+        ]:
+            with self.subTest(name):
+                url = reverse(name, args=args) + query
+                response = await self.async_client.get(url)
+                self.assertEqual(response.resolver_match.func.view_class.__module__, async_views.__name__)
+                self.assertEqual(response.status_code, 200)
+                with override_settings(ROOT_URLCONF='config.urls'):
+                    expected = await self.async_client.get(url)
+                self.assertEqual(response.json(), expected.json())
+                self.assertEqual(response['ETag'], expected['ETag'])
+
+                response = await self.async_client.get(url, headers={'If-None-Match': response['ETag']})
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.content, b'')
+
+    async def test_errors(self):
+        response = await self.async_client.get(reverse('project-detail', args=['missing']))
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {'detail': 'No Project matches the given query.'})
+        response = await self.async_client.get(reverse('projects') + '?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {'detail': 'Invalid cursor'})
+        response = await self.async_client.get(reverse('projects') + '?fields=secret')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'fields': ['Unknown field: secret']})
+
+
+class ReplicaTests(TestCase):
+    @override_settings(PORTFOLIO_READ_DATABASES=['replica'])
+    def test_only_public_reads_go_to_a_replica(self):
+        router = routers.ReadReplicaRouter()
+        self.assertEqual(router.db_for_read(Project), 'default')
+        with routers.replica_reads():
+            self.assertEqual(router.db_for_read(Project), 'replica')
+            self.assertEqual(router.db_for_read(ContactMessage), 'default')
+            self.assertEqual(router.db_for_read(User), 'default')
+            self.assertEqual(router.db_for_write(Project), 'default')
+        self.assertEqual(router.db_for_read(Project), 'default')
+        self.assertIs(router.allow_migrate('replica', 'portfolio'), False)
+        self.assertIsNone(router.allow_migrate('default', 'portfolio'))
+
+    def test_copies_leave_out_private_tables(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        primary, replica = os.path.join(directory, 'primary.sqlite3'), os.path.join(directory, 'replica.sqlite3')
+        with sqlite3.connect(primary) as db:
+            db.execute('CREATE TABLE portfolio_project (id INTEGER PRIMARY KEY, title TEXT)')
+            db.execute('CREATE TABLE portfolio_contactmessage (id INTEGER PRIMARY KEY, name, email, subject, message)')
+            db.execute('CREATE TABLE auth_user (id INTEGER PRIMARY KEY, password TEXT)')
+            db.execute(
+                f"CREATE VIRTUAL TABLE {search.MESSAGE_FTS_TABLE} USING fts5(name, email, subject, message, "
+                "content='portfolio_contactmessage', content_rowid='id')"
+            )
+            db.execute("INSERT INTO portfolio_project VALUES (1, 'Shop')")
+            db.execute("INSERT INTO portfolio_contactmessage VALUES (1, 'A', 'a@example.com', 'Private', 'Secret')")
+            db.execute(f"INSERT INTO {search.MESSAGE_FTS_TABLE}({search.MESSAGE_FTS_TABLE}) VALUES ('rebuild')")
+            db.execute("INSERT INTO auth_user VALUES (1, 'pbkdf2_sha256$hash')")
+        sqlite.copy_database(primary, [replica])
+
+        db = sqlite3.connect(replica)
+        self.addCleanup(db.close)
+        self.assertEqual(db.execute('SELECT title FROM portfolio_project').fetchall(), [('Shop',)])
+        self.assertEqual(db.execute('SELECT COUNT(*) FROM portfolio_contactmessage').fetchone(), (0,))
+        self.assertEqual(db.execute('SELECT COUNT(*) FROM auth_user').fetchone(), (0,))
+        matches = db.execute(f"SELECT rowid FROM {search.MESSAGE_FTS_TABLE} WHERE {search.MESSAGE_FTS_TABLE} MATCH 'secret'")
+        self.assertEqual(matches.fetchall(), [])
+        with open(replica, 'rb') as copy:
+            self.assertNotIn(b'Secret', copy.read())
+
+    def test_changes_are_copied_once_then_announced_once(self):
+        copies = []
+        for name in ('sqlite_replicas', 'sync_replicas', '_syncer'):
+            self.addCleanup(setattr, sqlite, name, getattr(sqlite, name))
+        sqlite.sqlite_replicas = lambda: ['replica']
+        sqlite.sync_replicas = lambda aliases=None: copies.append(aliases)
+        sqlite._syncer = None
+        broker = events.get_broker()
+        sequence = broker._sequence
+
+        with override_settings(PORTFOLIO_SYNC_SQLITE_REPLICAS=True, PORTFOLIO_SQLITE_SYNC_DEBOUNCE=60):
+            with self.captureOnCommitCallbacks(execute=True):
+                category = SkillCategory.objects.create(name='Backend')
+                category.save()
+            # Nothing is copied on the request thread, or announced before the copy
+            self.assertEqual((copies, broker._sequence), ([], sequence))
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertEqual(sqlite.get_syncer().flush(), 1)
+        self.assertEqual(len(copies), 1)
+        self.assertEqual(broker._sequence, sequence + 1)
+
+
+class RendererTests(TestCase):
+    def test_fast_renderer_matches_json_renderer(self):
+        data = {
+            'created_at': datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=dt_timezone.utc),
+            'issued': date(2024, 5, 1),
+            'price': Decimal('9.50'),
+            'bio': 'Línea\u2028nueva',
+            'rows': [{'id': 1, 'tags': ('a', 'b')}],
+        }
+        for name in renderers.EXACT:
+            with self.subTest(name), override_settings(PORTFOLIO_JSON_ENCODER=name):
+                self.assertEqual(renderers.FastJSONRenderer().render(data), JSONRenderer().render(data))
+        indented = renderers.FastJSONRenderer().render(data, 'application/json; indent=2')
+        self.assertEqual(indented, JSONRenderer().render(data, 'application/json; indent=2'))
+
+
+class StartupTests(TestCase):
+    def test_api_profile_stays_lean(self):
+        result = benchmarks.measure_startup('config.settings_api', '/api/', runs=1)
+        self.assertEqual(result['status'], 200)
+        # Admin itself is still imported by DRF's schema generator
+        for module in ('PIL.Image', 'django.contrib.auth.models', 'django.contrib.sessions.models'):
+            self.assertNotIn(module, result['heavy_modules'])
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, PORTFOLIO_IMAGE_WORKERS=0)
+class MediaStorageTests(TestCase):
+    def tearDown(self):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def test_identical_uploads_share_one_immutable_blob(self):
+        first, second = CV(title='First'), CV(title='Second')
+        first.file.save('resume.PDF', ContentFile(b'%PDF-1.4 same'), save=True)
+        second.file.save('other.pdf', ContentFile(b'%PDF-1.4 same'), save=True)
+        digest = hashlib.sha256(b'%PDF-1.4 same').hexdigest()
+        self.assertEqual(first.file.name, f'cv/{digest}.pdf')
+        self.assertEqual(second.file.name, first.file.name)
+
+        response = self.client.get(f'/media/{first.file.name}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), b'%PDF-1.4 same')
+        self.assertEqual(response['Cache-Control'], 'public, max-age=31536000, immutable')
+        response = self.client.get(f'/media/{first.file.name}', HTTP_IF_NONE_MATCH=f'"{digest}"')
+        self.assertEqual(response.status_code, 304)
+
+    def test_garbage_collection_keeps_referenced_blobs(self):
+        kept, dropped = CV(title='Kept'), CV(title='Dropped')
+        kept.file.save('kept.pdf', ContentFile(b'kept'), save=True)
+        dropped.file.save('dropped.pdf', ContentFile(b'dropped'), save=True)
+        derivative = images.derivative_name(dropped.file.name, 320, 'webp')
+        default_storage.save(derivative, ContentFile(b'variant'))
+        # Uploaded before content addressing
+        FileSystemStorage().save('projects/original-name.png', ContentFile(b'legacy'))
+        dropped.delete()
+
+        self.assertEqual(storage.collect_garbage(min_age=60), [])
+        garbage = storage.collect_garbage(min_age=0)
+        self.assertEqual(sorted(garbage), sorted([derivative, dropped.file.name]))
+        self.assertTrue(default_storage.exists(kept.file.name))
+        self.assertTrue(default_storage.exists('projects/original-name.png'))
+
+    def test_reuploading_an_orphaned_blob_restarts_its_grace_period(self):
+        name = default_storage.save('cv/resume.pdf', ContentFile(b'orphan'))
+        hour_ago = time.time() - 3600
+        os.utime(default_storage.path(name), (hour_ago, hour_ago))
+        self.assertEqual(storage.collect_garbage(min_age=60, dry_run=True), [name])
+
+        # Stored again for a row that is not committed yet
+        self.assertEqual(default_storage.save('cv/again.pdf', ContentFile(b'orphan')), name)
+        self.assertEqual(storage.collect_garbage(min_age=60), [])
+        self.assertTrue(default_storage.exists(name))
@@ -1,18 +1,35 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+if getattr(settings, 'PORTFOLIO_ASYNC_VIEWS', False):
+    from . import async_views as read_views
+else:
+    read_views = views
 
 urlpatterns = [
     path('', views.api_overview, name='api-overview'),
-    path('personal-info/', views.PersonalInfoView.as_view(), name='personal-info'),
-    path('social-links/', views.SocialLinkListView.as_view(), name='social-links'),
-    path('skill-categories/', views.SkillCategoryListView.as_view(), name='skill-categories'),
-    path('skills/', views.SkillListView.as_view(), name='skills'),
-    path('skills/featured/', views.FeaturedSkillsView.as_view(), name='featured-skills'),
-    path('projects/', views.ProjectListView.as_view(), name='projects'),
-    path('projects/<slug:slug>/', views.ProjectDetailView.as_view(), name='project-detail'),
-    path('education/', views.EducationListView.as_view(), name='education'),
-    path('certifications/', views.CertificationListView.as_view(), name='certifications'),
-    path('cv/', views.CVDownloadView.as_view(), name='cv'),
+    path('bundle/', read_views.BundleView.as_view(), name='bundle'),
+    path('personal-info/', read_views.PersonalInfoView.as_view(), name='personal-info'),
+    path('social-links/', read_views.SocialLinkListView.as_view(), name='social-links'),
+    path('skill-categories/', read_views.SkillCategoryListView.as_view(), name='skill-categories'),
+    path('skills/', read_views.SkillListView.as_view(), name='skills'),
+    path('skills/featured/', read_views.FeaturedSkillsView.as_view(), name='featured-skills'),
+    path('projects/', read_views.ProjectListView.as_view(), name='projects'),
+    path('projects/search/', read_views.ProjectSearchView.as_view(), name='project-search'),
+    path('projects/<slug:slug>/', read_views.ProjectDetailView.as_view(), name='project-detail'),
+    path('education/', read_views.EducationListView.as_view(), name='education'),
+    path('certifications/', read_views.CertificationListView.as_view(), name='certifications'),
+    path('stats/', read_views.StatsView.as_view(), name='stats'),
+    path('events/', async_views.EventStreamView.as_view(), name='events'),
+    path('cv/', read_views.CVDownloadView.as_view(), name='cv'),
     path('cv/download/', views.CVFileDownloadView.as_view(), name='cv-download'),
+    path('images/<path:name>', views.ImageDerivativeView.as_view(), name='image-derivative'),
     path('contact/', views.ContactMessageCreateView.as_view(), name='contact'),
+    path('contact/messages/', views.ContactMessageListView.as_view(), name='contact-messages'),
+]
+
+# Mounted at MEDIA_URL by the project URLconfs while PORTFOLIO_SERVE_MEDIA is on
+media_urlpatterns = [
+    path('<path:name>', views.MediaFileView.as_view(), name='media'),
 ]
@@ -0,0 +1,81 @@
+"""
+Per-resource version registry used to validate cached API responses
+
+Each portfolio model is a resource whose version is bumped by the post_save /
+post_delete signals. Versions live in Django's default cache so that every
+worker sharing that cache agrees on them; a missing entry is re-seeded with a
+fresh token, so a cache flush or restart can only cause misses, never stale hits.
+"""
+import hashlib
+import time
+import uuid
+
+from django.core.cache import cache
+
+CACHE_PREFIX = 'portfolio:version:'
+
+
+def resource_for(model):
+    """Resource name used for a model class"""
+    return model._meta.model_name
+
+
+def _key(resource):
+    return f'{CACHE_PREFIX}{resource}'
+
+
+def _new_version():
+    return (uuid.uuid4().hex, time.time())
+
+
+def bump(resource):
+    """Record that a resource changed; returns its new version token"""
+    version = _new_version()
+    cache.set(_key(resource), version, None)
+    return version[0]
+
+
+def get_versions(resources):
+    """Return ``{resource: (token, changed_at)}`` for the given resources"""
+    keys = {_key(resource): resource for resource in resources}
+    found = cache.get_many(keys)
+    missing = [key for key in keys if key not in found]
+    if missing:
+        for key in missing:
+            cache.add(key, _new_version(), None)
+        found.update(cache.get_many(missing))
+    return {keys[key]: value for key, value in found.items()}
+
+
+async def aget_versions(resources):
+    """``get_versions`` for async views, through the cache's async API"""
+    keys = {_key(resource): resource for resource in resources}
+    found = await cache.aget_many(keys)
+    missing = [key for key in keys if key not in found]
+    if missing:
+        for key in missing:
+            await cache.aadd(key, _new_version(), None)
+        found.update(await cache.aget_many(missing))
+    return {keys[key]: value for key, value in found.items()}
+
+
+def fingerprint(versions):
+    """Stable digest of a set of resource versions"""
+    return hashlib.sha1(
+        '|'.join(f'{name}:{versions[name][0]}' for name in sorted(versions)).encode()
+    ).hexdigest()
+
+
+def last_modified(versions):
+    """Most recent change time across a set of resource versions"""
+    return max(changed_at for _, changed_at in versions.values())
+
+
+def make_etag(versions, request):
+    """Strong ETag for a response built from ``versions`` for this exact request"""
+    variant = '|'.join([
+        fingerprint(versions),
+        request.build_absolute_uri(),
+        request.META.get('HTTP_ACCEPT', ''),
+    ])
+    return '"%s"' % hashlib.sha1(variant.encode()).hexdigest()
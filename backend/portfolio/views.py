@@ -2,112 +2,229 @@ from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
-from django.http import FileResponse, Http404
+from rest_framework.permissions import IsAdminUser
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.decorators import method_decorator
+from django.utils.http import http_date
+from django.views.decorators.cache import never_cache
 from .models import (
     PersonalInfo, SocialLink, SkillCategory, Skill,
-    Project, Education, Certification, CV, ContactMessage
+    Project, Technology, Education, Certification, CV, ContactMessage
 )
 from .serializers import (
     PersonalInfoSerializer, SocialLinkSerializer, SkillCategorySerializer,
     SkillSerializer, ProjectSerializer, EducationSerializer,
-    CertificationSerializer, CVSerializer, ContactMessageSerializer
+    CertificationSerializer, CVSerializer, ContactMessageSerializer,
+    ContactMessageListSerializer, ProjectSearchResultSerializer
 )
+from .mixins import ConditionalGetMixin, ReaderListMixin, SparseFieldsMixin
+from .pagination import KeysetPagination, AlwaysKeysetPagination
+from . import cdn, downloads, images, ingest, readers, search, snapshot, stats, storage
 
+# Content-addressed files and their derivatives never change behind a URL
+IMMUTABLE = 'public, max-age=31536000, immutable'
 
-class PersonalInfoView(APIView):
+
+def filter_projects(params):
+    """Active projects filtered by ``?featured=true`` and ``?tech=`` (shared with async_views)"""
+    queryset = Project.objects.filter(is_active=True)
+    featured = params.get('featured')
+    if featured and featured.lower() == 'true':
+        queryset = queryset.filter(is_featured=True)
+    # ?tech=react&tech=django keeps projects that use every listed technology
+    for tech in params.getlist('tech'):
+        queryset = queryset.filter(technology_tags__key=Technology.normalize(tech))
+    return queryset
+
+
+class PersonalInfoView(ConditionalGetMixin, APIView):
     """Get personal information (singleton)"""
+    version_resources = ('personalinfo',)
     
     def get(self, request):
+        reader = readers.PERSONAL_INFO.project(request.query_params)
         try:
-            info = PersonalInfo.objects.first()
+            info = reader.only(PersonalInfo.objects.all()).first()
             if info:
-                serializer = PersonalInfoSerializer(info, context={'request': request})
+                serializer = PersonalInfoSerializer(info, context={'request': request, 'fields': reader.fields})
                 return Response(serializer.data)
             return Response({'detail': 'Personal information not configured'}, status=404)
         except Exception as e:
             return Response({'detail': str(e)}, status=500)
 
 
-class SocialLinkListView(generics.ListAPIView):
+class SocialLinkListView(ConditionalGetMixin, ReaderListMixin, generics.ListAPIView):
     """List all active social links"""
+    version_resources = ('sociallink',)
     serializer_class = SocialLinkSerializer
+    reader = readers.SOCIAL_LINKS
     
     def get_queryset(self):
         return SocialLink.objects.filter(is_active=True)
 
 
-class SkillCategoryListView(generics.ListAPIView):
+class SkillCategoryListView(ConditionalGetMixin, ReaderListMixin, generics.ListAPIView):
     """List all skill categories with their skills"""
+    version_resources = ('skillcategory', 'skill')
     serializer_class = SkillCategorySerializer
-    queryset = SkillCategory.objects.prefetch_related('skills')
+    reader = readers.SKILL_CATEGORIES
+    queryset = SkillCategory.objects.all()
 
 
-class SkillListView(generics.ListAPIView):
+class SkillListView(ConditionalGetMixin, ReaderListMixin, generics.ListAPIView):
     """List all skills"""
+    version_resources = ('skill', 'skillcategory')
     serializer_class = SkillSerializer
-    queryset = Skill.objects.select_related('category')
+    reader = readers.SKILLS
+    queryset = Skill.objects.all()
 
 
-class FeaturedSkillsView(generics.ListAPIView):
+class FeaturedSkillsView(ConditionalGetMixin, ReaderListMixin, generics.ListAPIView):
     """List featured skills only"""
+    version_resources = ('skill', 'skillcategory')
     serializer_class = SkillSerializer
+    reader = readers.SKILLS
     
     def get_queryset(self):
-        return Skill.objects.filter(is_featured=True).select_related('category')
+        return Skill.objects.filter(is_featured=True)
 
 
-class ProjectListView(generics.ListAPIView):
+class ProjectListView(ConditionalGetMixin, ReaderListMixin, generics.ListAPIView):
     """List all active projects"""
+    version_resources = ('project', 'technology')
     serializer_class = ProjectSerializer
+    reader = readers.PROJECTS
+    pagination_class = KeysetPagination
+    
+    def get_queryset(self):
+        return filter_projects(self.request.query_params)
+
+
+class ProjectSearchView(ConditionalGetMixin, SparseFieldsMixin, generics.ListAPIView):
+    """Full-text search over active projects, best matches first"""
+    version_resources = ('project',)
+    serializer_class = ProjectSearchResultSerializer
+    reader = readers.PROJECT_SEARCH_RESULTS
+    max_limit = 50
     
     def get_queryset(self):
-        queryset = Project.objects.filter(is_active=True)
-        featured = self.request.query_params.get('featured')
-        if featured and featured.lower() == 'true':
-            queryset = queryset.filter(is_featured=True)
-        return queryset
+        query = self.request.query_params.get('q', '')
+        limit = search.parse_limit(self.request.query_params.get('limit'), maximum=self.max_limit)
+        return search.search_projects(query, limit=limit, queryset=self.get_reader().only(Project.objects.all()))
 
 
-class ProjectDetailView(generics.RetrieveAPIView):
+class ProjectDetailView(ConditionalGetMixin, SparseFieldsMixin, generics.RetrieveAPIView):
     """Get single project by slug"""
+    version_resources = ('project',)
     serializer_class = ProjectSerializer
+    reader = readers.PROJECTS
     lookup_field = 'slug'
     
     def get_queryset(self):
-        return Project.objects.filter(is_active=True)
+        return self.get_reader().only(Project.objects.filter(is_active=True))
+    
+    def get_object(self):
+        project = super().get_object()
+        self.surrogate_keys = cdn.instance_keys(project)
+        return project
 
 
-class EducationListView(generics.ListAPIView):
+class EducationListView(ConditionalGetMixin, ReaderListMixin, generics.ListAPIView):
     """List all education entries"""
+    version_resources = ('education',)
     serializer_class = EducationSerializer
+    reader = readers.EDUCATION
+    pagination_class = KeysetPagination
     queryset = Education.objects.all()
 
 
-class CertificationListView(generics.ListAPIView):
+class CertificationListView(ConditionalGetMixin, ReaderListMixin, generics.ListAPIView):
     """List all certifications"""
+    version_resources = ('certification',)
     serializer_class = CertificationSerializer
+    reader = readers.CERTIFICATIONS
+    pagination_class = KeysetPagination
     queryset = Certification.objects.all()
 
 
-class CVDownloadView(APIView):
+class StatsView(ConditionalGetMixin, APIView):
+    """Aggregate statistics over skills and projects"""
+    version_resources = stats.RESOURCES
+    
+    def get(self, request):
+        return Response(stats.get_stats(self.version_fingerprint))
+
+
+class CVDownloadView(ConditionalGetMixin, APIView):
     """Get active CV/Resume"""
+    version_resources = ('cv',)
     
     def get(self, request):
-        cv = CV.objects.filter(is_active=True).first()
+        reader = readers.CV.project(request.query_params)
+        # file is always read: a CV without one is reported as missing
+        cv = reader.only(CV.objects.filter(is_active=True), 'file').first()
         if cv and cv.file:
-            serializer = CVSerializer(cv, context={'request': request})
+            serializer = CVSerializer(cv, context={'request': request, 'fields': reader.fields})
             return Response(serializer.data)
         return Response({'detail': 'No active CV found'}, status=404)
 
 
 class CVFileDownloadView(APIView):
-    """Download active CV file directly"""
+    """Download active CV file directly (supports Range and conditional requests)"""
     
     def get(self, request):
-        cv = CV.objects.filter(is_active=True).first()
-        if cv and cv.file:
-            return FileResponse(cv.file.open('rb'), as_attachment=True, filename='CV_Fares_Essam.pdf')
-        raise Http404("No active CV found")
+        info = downloads.active_cv_file()
+        if info is None:
+            raise Http404("No active CV found")
+        return downloads.serve(request, info)
+
+
+class ImageDerivativeView(APIView):
+    """Serve a resized image variant, generating it on first request"""
+    
+    def get(self, request, name):
+        parsed = images.parse_derivative_name(name)
+        if parsed is None:
+            raise Http404("Unknown image variant")
+        if not default_storage.exists(name):
+            source_name, width, fmt = parsed
+            if not default_storage.exists(source_name):
+                raise Http404("Image not found")
+            try:
+                images.generate(source_name, width, fmt)
+            except images.UndecodableImage:
+                raise Http404("Image could not be decoded")
+        response = FileResponse(default_storage.open(name, 'rb'), content_type=f'image/{parsed[2]}')
+        response['Cache-Control'] = IMMUTABLE if storage.digest_of(parsed[0]) else 'public, max-age=86400'
+        return response
+
+
+class MediaFileView(APIView):
+    """Serve an uploaded file; content-addressed ones are cached forever"""
+
+    def get(self, request, name):
+        parts = name.split('/')
+        # Dot files are blobs still being written (see storage.py)
+        if '..' in parts or parts[-1].startswith('.') or not default_storage.exists(name):
+            raise Http404("File not found")
+        digest = storage.digest_of(name)
+        if digest:
+            etag, modified, cache_control = f'"{digest}"', None, IMMUTABLE
+        else:
+            # Uploaded under its original name, which a re-upload may reuse
+            etag, cache_control = None, 'no-cache'
+            modified = int(default_storage.get_modified_time(name).timestamp())
+        response = get_conditional_response(request, etag=etag, last_modified=modified)
+        if response is None:
+            response = FileResponse(default_storage.open(name, 'rb'))
+        if etag:
+            response['ETag'] = etag
+        else:
+            response['Last-Modified'] = http_date(modified)
+        response['Cache-Control'] = cache_control
+        return response
 
 
 class ContactMessageCreateView(generics.CreateAPIView):
@@ -117,11 +234,39 @@ class ContactMessageCreateView(generics.CreateAPIView):
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
+        if ingest.is_buffered():
+            # Queued for a batched insert; acknowledge without touching the database
+            ingest.get_buffer().submit(serializer.validated_data)
+            response_status = status.HTTP_202_ACCEPTED
+        else:
+            self.perform_create(serializer)
+            response_status = status.HTTP_201_CREATED
         return Response({
             'message': 'Thank you for your message! I will get back to you soon.',
             'data': serializer.data
-        }, status=status.HTTP_201_CREATED)
+        }, status=response_status)
+
+
+class BundleView(ConditionalGetMixin, APIView):
+    """Get every payload the home page needs in a single response"""
+    version_resources = snapshot.RESOURCES
+    
+    def get(self, request):
+        sections = readers.requested_fields(request.query_params, snapshot.SECTIONS)
+        rendered = snapshot.get_bundle(request, self.version_fingerprint, sections)
+        return HttpResponse(rendered, content_type='application/json')
+
+
+@method_decorator(never_cache, name='dispatch')
+class ContactMessageListView(SparseFieldsMixin, generics.ListAPIView):
+    """List received contact messages, newest first (staff only)"""
+    serializer_class = ContactMessageListSerializer
+    reader = readers.CONTACT_MESSAGES
+    pagination_class = AlwaysKeysetPagination
+    permission_classes = [IsAdminUser]
+    
+    def get_queryset(self):
+        return self.get_reader().only(ContactMessage.objects.all())
 
 
 @api_view(['GET'])
@@ -130,17 +275,22 @@ def api_overview(request):
     return Response({
         'message': 'Welcome to Fares Essam Portfolio API',
         'endpoints': {
+            'bundle': '/api/bundle/',
             'personal_info': '/api/personal-info/',
             'social_links': '/api/social-links/',
             'skills': '/api/skills/',
             'skill_categories': '/api/skill-categories/',
             'featured_skills': '/api/skills/featured/',
             'projects': '/api/projects/',
+            'project_search': '/api/projects/search/?q=',
             'project_detail': '/api/projects/<slug>/',
             'education': '/api/education/',
             'certifications': '/api/certifications/',
+            'stats': '/api/stats/',
+            'events': '/api/events/ (Server-Sent Events)',
             'cv': '/api/cv/',
             'cv_download': '/api/cv/download/',
             'contact': '/api/contact/ (POST)',
+            'contact_messages': '/api/contact/messages/ (staff only)',
         }
     })
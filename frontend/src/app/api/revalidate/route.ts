@@ -0,0 +1,49 @@
+// On-demand revalidation webhook sent by the Django backend after admin saves
+// (backend/portfolio/revalidate.py). The body lists the paths to re-render;
+// a path with a [segment] stands for every page of that route.
+
+import { createHmac, timingSafeEqual } from "crypto";
+import { revalidatePath } from "next/cache";
+import { NextRequest, NextResponse } from "next/server";
+
+const SECRET = process.env.REVALIDATE_SECRET;
+// Webhooks older than this are rejected as replays
+const MAX_AGE_SECONDS = 300;
+
+function isAuthentic(body: string, timestamp: string, signature: string) {
+  const expected =
+    "sha256=" +
+    createHmac("sha256", SECRET!).update(`${timestamp}.${body}`).digest("hex");
+  const age = Math.abs(Date.now() / 1000 - Number(timestamp));
+  return (
+    signature.length === expected.length &&
+    timingSafeEqual(Buffer.from(signature), Buffer.from(expected)) &&
+    age <= MAX_AGE_SECONDS
+  );
+}
+
+export async function POST(request: NextRequest) {
+  if (!SECRET) {
+    return NextResponse.json(
+      { detail: "Revalidation is not configured" },
+      { status: 503 }
+    );
+  }
+
+  const body = await request.text();
+  const timestamp = request.headers.get("x-portfolio-timestamp") ?? "";
+  const signature = request.headers.get("x-portfolio-signature") ?? "";
+  if (!isAuthentic(body, timestamp, signature)) {
+    return NextResponse.json({ detail: "Invalid signature" }, { status: 401 });
+  }
+
+  const { paths } = JSON.parse(body) as { paths: string[] };
+  for (const path of paths) {
+    if (path.includes("[")) {
+      revalidatePath(path, "page");
+    } else {
+      revalidatePath(path);
+    }
+  }
+  return NextResponse.json({ revalidated: paths });
+}
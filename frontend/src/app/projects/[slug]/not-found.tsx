@@ -0,0 +1,40 @@
+"use client";
+
+import { motion } from "framer-motion";
+import Link from "next/link";
+
+export default function ProjectNotFound() {
+  return (
+    <div
+      style={{
+        minHeight: "100vh",
+        display: "flex",
+        flexDirection: "column",
+        alignItems: "center",
+        justifyContent: "center",
+        color: "var(--text-primary)",
+        gap: 24,
+      }}
+    >
+      <h1 style={{ fontSize: 48, fontWeight: 700 }}>404</h1>
+      <p style={{ color: "var(--text-secondary)" }}>Project not found</p>
+      <Link href="/projects">
+        <motion.button
+          style={{
+            padding: "14px 32px",
+            background: "var(--gradient-accent)",
+            color: "white",
+            borderRadius: 12,
+            border: "none",
+            cursor: "pointer",
+            fontWeight: 600,
+          }}
+          whileHover={{ scale: 1.05 }}
+          whileTap={{ scale: 0.95 }}
+        >
+          Back to Projects
+        </motion.button>
+      </Link>
+    </div>
+  );
+}
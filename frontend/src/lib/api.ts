@@ -11,6 +11,10 @@ import type {
   Certification,
   CV,
   ContactMessage,
+  PortfolioBundle,
+  PortfolioStats,
+  ChangeEvent,
+  CursorPage,
 } from "@/types";
 
 const API_BASE_URL =
@@ -23,6 +27,33 @@ const api = axios.create({
   },
 });
 
+// Cursor pagination: yields one page at a time until the server has no `next`
+export async function* streamPages<T>(
+  path: string,
+  pageSize = 50
+): AsyncGenerator<T[]> {
+  let url: string | null = path;
+  let params: Record<string, number> | undefined = { page_size: pageSize };
+  while (url) {
+    const response = await api.get<CursorPage<T>>(url, { params });
+    yield response.data.results;
+    // `next` is an absolute URL that already carries the cursor and page size
+    url = response.data.next;
+    params = undefined;
+  }
+}
+
+// Bundle (every home page payload in one request, or just the listed sections)
+export const getBundle = async <
+  K extends keyof PortfolioBundle = keyof PortfolioBundle
+>(
+  sections?: K[]
+): Promise<Pick<PortfolioBundle, K>> => {
+  const params = sections ? { fields: sections.join(",") } : undefined;
+  const response = await api.get("/bundle/", { params });
+  return response.data;
+};
+
 // Personal Info
 export const getPersonalInfo = async (): Promise<PersonalInfo> => {
   const response = await api.get("/personal-info/");
@@ -52,15 +83,32 @@ export const getFeaturedSkills = async (): Promise<Skill[]> => {
 };
 
 // Projects
-export const getProjects = async (featured?: boolean): Promise<Project[]> => {
-  const params = featured ? { featured: "true" } : {};
+export const getProjects = async (
+  featured?: boolean,
+  technologies: string[] = []
+): Promise<Project[]> => {
+  // Repeated ?tech= keys keep projects that use every listed technology
+  const params = new URLSearchParams();
+  if (featured) params.append("featured", "true");
+  technologies.forEach((tech) => params.append("tech", tech));
   const response = await api.get("/projects/", { params });
   return response.data;
 };
 
-export const getProject = async (slug: string): Promise<Project> => {
-  const response = await api.get(`/projects/${slug}/`);
-  return response.data;
+export const streamProjects = (pageSize?: number) =>
+  streamPages<Project>("/projects/", pageSize);
+
+// null when no project has this slug
+export const getProject = async (slug: string): Promise<Project | null> => {
+  try {
+    const response = await api.get(`/projects/${slug}/`);
+    return response.data;
+  } catch (error) {
+    if (axios.isAxiosError(error) && error.response?.status === 404) {
+      return null;
+    }
+    throw error;
+  }
 };
 
 // Education
@@ -75,6 +123,32 @@ export const getCertifications = async (): Promise<Certification[]> => {
   return response.data;
 };
 
+export const streamCertifications = (pageSize?: number) =>
+  streamPages<Certification>("/certifications/", pageSize);
+
+// Aggregate skill and project statistics, computed by the backend
+export const getStats = async (): Promise<PortfolioStats> => {
+  const response = await api.get("/stats/");
+  return response.data;
+};
+
+// Content changes pushed over Server-Sent Events. EventSource reconnects and
+// resumes by itself; onReset means events were missed and everything should be
+// refetched. Returns a function that closes the stream.
+export const subscribeToChanges = (
+  onChange: (event: ChangeEvent) => void,
+  onReset?: () => void
+): (() => void) => {
+  const source = new EventSource(`${API_BASE_URL}/events/`);
+  source.addEventListener("change", (event) =>
+    onChange(JSON.parse((event as MessageEvent<string>).data))
+  );
+  if (onReset) {
+    source.addEventListener("reset", onReset);
+  }
+  return () => source.close();
+};
+
 // CV
 export const getCV = async (): Promise<CV | null> => {
   try {
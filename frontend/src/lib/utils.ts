@@ -1,11 +1,24 @@
 // Utility functions
 
 import { type ClassValue, clsx } from "clsx";
+import type { ImageSrcset } from "@/types";
 
 export function cn(...inputs: ClassValue[]) {
   return clsx(inputs);
 }
 
+// Build an <img srcSet> value from the API's resized variants
+export function toSrcSet(
+  srcset: ImageSrcset | null | undefined,
+  format = "webp"
+): string | undefined {
+  const variants = srcset?.[format];
+  if (!variants) return undefined;
+  return Object.entries(variants)
+    .map(([width, url]) => `${url} ${width}w`)
+    .join(", ");
+}
+
 // Smooth scroll to element
 export function scrollToElement(elementId: string) {
   const element = document.getElementById(elementId);
@@ -1,5 +1,8 @@
 // TypeScript types for the Portfolio API
 
+// Resized variants of an uploaded image: format -> width -> URL
+export type ImageSrcset = Record<string, Record<string, string>>;
+
 export interface PersonalInfo {
   id: number;
   name: string;
@@ -12,6 +15,7 @@ export interface PersonalInfo {
   resume_headline: string;
   profile_photo: string | null;
   profile_photo_url: string | null;
+  profile_photo_srcset: ImageSrcset | null;
   favicon: string | null;
   favicon_url: string | null;
 }
@@ -52,6 +56,7 @@ export interface Project {
   description: string;
   image: string | null;
   image_url: string | null;
+  image_srcset: ImageSrcset | null;
   technologies: string;
   tech_list: string[];
   live_url: string;
@@ -71,6 +76,7 @@ export interface Education {
   description: string;
   logo: string | null;
   logo_url: string | null;
+  logo_srcset: ImageSrcset | null;
 }
 
 export interface Certification {
@@ -83,6 +89,7 @@ export interface Certification {
   credential_url: string;
   image: string | null;
   image_url: string | null;
+  image_srcset: ImageSrcset | null;
 }
 
 export interface CV {
@@ -100,6 +107,50 @@ export interface ContactMessage {
   message: string;
 }
 
+export interface PortfolioBundle {
+  personal_info: PersonalInfo | null;
+  social_links: SocialLink[];
+  skill_categories: SkillCategory[];
+  featured_skills: Skill[];
+  projects: Project[];
+  education: Education[];
+  certifications: Certification[];
+  cv: CV | null;
+}
+
+export interface PortfolioStats {
+  skills: {
+    count: number;
+    average_proficiency: number | null;
+    proficiency_histogram: { min: number; max: number; count: number }[];
+  };
+  skill_categories: {
+    id: number;
+    name: string;
+    skill_count: number;
+    average_proficiency: number | null;
+    min_proficiency: number | null;
+    max_proficiency: number | null;
+  }[];
+  technologies: { name: string; key: string; project_count: number }[];
+  projects: {
+    count: number;
+    per_year: { year: number; count: number }[];
+  };
+}
+
+// Pushed by /api/events/ when content changes; id is null after bulk writes
+export interface ChangeEvent {
+  model: string;
+  id: number | null;
+  version: string;
+}
+
+export interface CursorPage<T> {
+  next: string | null;
+  results: T[];
+}
+
 export interface ApiResponse<T> {
   data: T;
   message?: string;